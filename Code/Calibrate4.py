@@ -1,19 +1,19 @@
-'''
-SLab Calibration Stage 4
-calibrate4.py
-
-Check calibration
-'''
-
-import slab
-
-slab.connect()
-
-slab.checkCalibration()
-
-slab.disconnect()
-
-
-
-
-    
+'''
+SLab Calibration Stage 4
+calibrate4.py
+
+Check calibration
+'''
+
+import slab
+
+slab.connect()
+
+slab.checkCalibration()
+
+slab.disconnect()
+
+
+
+
+    
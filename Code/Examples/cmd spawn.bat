@@ -1 +1 @@
-start cmd /k 
+start cmd /k 
@@ -1 +1 @@
-python %1
+python %1
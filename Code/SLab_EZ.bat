@@ -1 +1 @@
-python -i slab_ez.py
+python -i slab_ez.py
@@ -1,40 +1,69 @@
-'''
-Generates the help file from the source code
-'''
-
-HELP_FILE = "SLab_Help.dat"
-COMMAND_LIST = "SLab_Commands.txt"
-
-def processFile(filename,hfile,cfile):
-    print "Processing " + filename
-    cfile.write("FILE: "+filename+"\n")
-    with open(filename, 'r') as sfile:
-        copy = False
-        for line in sfile:
-            if line.startswith("@"):
-                hfile.write(line)
-                cfile.write("  "+line)
-                copy = True
-            elif line.startswith("'''"):
-                copy = False
-            elif copy:
-                hfile.write(line)   
-
-print
-print "Working on " + HELP_FILE + " ..."
-
-with open(HELP_FILE, 'w') as hfile:
-    with open(COMMAND_LIST, 'w') as cfile:
-
-        processFile("slab.py",hfile,cfile)
-        processFile("slab_dc.py",hfile,cfile)
-        processFile("slab_ac.py",hfile,cfile)
-        processFile("slab_meas.py",hfile,cfile)
-        processFile("slab_fft.py",hfile,cfile)
-        processFile("slab_ez.py",hfile,cfile)
-    
-        hfile.write("@# EOF\n") 
-    
-print "Done"
-print
-                
\ No newline at end of file
+'''
+Generates the help file from the source code
+
+It also generates a prebuilt topic index of the help file
+that slab.py loads instead of parsing the help file
+'''
+
+from __future__ import print_function
+
+import json
+
+HELP_FILE = "SLab_Help.dat"
+HELP_INDEX_FILE = "SLab_Help.json"
+COMMAND_LIST = "SLab_Commands.txt"
+
+# Index of topics
+# Lowercase topic name is the key
+# Each entry is a list [topic name, list of lines]
+index = {}
+
+def processFile(filename,hfile,cfile):
+    print("Processing " + filename)
+    cfile.write("FILE: "+filename+"\n")
+    with open(filename, 'r') as sfile:
+        copy = False
+        entry = None
+        for line in sfile:
+            if line.startswith("@"):
+                hfile.write(line)
+                cfile.write("  "+line)
+                copy = True
+                # New index entry (first definition wins)
+                name = line.split("@")[1]
+                if name.lower() in index:
+                    entry = None
+                else:
+                    entry = [name,[]]
+                    index[name.lower()] = entry
+            elif line.startswith("'''"):
+                copy = False
+            elif copy:
+                hfile.write(line)
+                if entry is not None and not line.startswith("#"):
+                    entry[1].append(line.rstrip("\r\n"))
+
+print()
+print("Working on " + HELP_FILE + " ...")
+
+with open(HELP_FILE, 'w') as hfile:
+    with open(COMMAND_LIST, 'w') as cfile:
+
+        processFile("slab.py",hfile,cfile)
+        processFile("slab_dc.py",hfile,cfile)
+        processFile("slab_ac.py",hfile,cfile)
+        processFile("slab_meas.py",hfile,cfile)
+        processFile("slab_fft.py",hfile,cfile)
+        processFile("slab_ez.py",hfile,cfile)
+        processFile("slab_wave.py",hfile,cfile)
+        processFile("slab_fit.py",hfile,cfile)
+    
+        hfile.write("@# EOF\n") 
+        
+print("Working on " + HELP_INDEX_FILE + " ...")
+
+with open(HELP_INDEX_FILE, 'w') as jfile:
+    json.dump({"version":1,"topics":index},jfile,indent=1,sort_keys=True)
+    
+print("Done")
+print()
@@ -1,3857 +1,7341 @@
-'''
-Base SLab Python module
-It contains all interaction to the Hardware Board through Base Commands
-
-History:
-
-Version 1.0 : First version
-
-17/2/2017 : It seems that DAC output is more acurate
-            than ADC input. 
-            ADC can be calibrated against DAC.
-            
-10/2/2018 : Addition to halt response code   
-
-Version 1.1 : Added Python 3 compatibility
-
- 1/3/2018 : Added compatibility with python 3         
-'''
-
-from __future__ import print_function
- 
-###################### INFO FOR THE HELP FILE ###################################
-
-'''
-@root@
-This is the main page of the SLab help
-List of command category topics:
-
-   manage : System management
-     file : File commands
-     base : Base DC voltage operations
-   plotdc : DC curves
-     plot : Generic plot commands
-     tran : Transient commands
-     wave : Wave commands
-     util : Utility commands
-      dio : Digital I/O
-      cal : Board calibration
-      var : Internal variables
-      
-List of SLab submodule category topics:
-
-       dc : DC submodule
-       ac : AC submodule
-     meas : Measure submodule
-      fft : FFT submodule
-       ez : Easy submodule
-	  
-You can also input the name of a particular command
-@manage@  
-List of management command topics:
-
-  connect
-  disconnect
-  softReset
-  printBoardInfo
-  wait
-  pause
-  setVerbose
-  setPlotReturnData
-@file@
-  save
-  load  
-  setFilePrefix
-  setCalPrefix  
-@base@
-List of base DC voltage command topics:
-
-  setVoltage
-  readVoltage
-  rCurrent
-  dcPrint
-  dcLive
-  zero
-  dcSweep
-  dcSweepPlot
-  writeDAC
-  readADC  
-  setDCreadings
-@plot@
-List of generic plotting command topics:
-
-  plot11
-  plot1n
-  plotnn
-@tran@
-List of transient command topics:
-
-  setSampleTime
-  setTransientStorage
-  tranStore (alias)
-  tranAsyncPlot
-  tranTriggeredPlot
-  stepPlot
-  transientAsync
-  transientTriggered
-  stepResponse
-@wave@
-List of wave command topics:
-
-   waveSquare
-   waveTriangle
-   waveSawtooth
-   waveSine
-   waveCosine
-   wavePulse
-   waveNoise
-   waveRandom
-   loadWavetable
-   setWaveFrequency
-   wavePlot
-   waveResponse
-   singleWavePlot
-   singleWaveResponse
-   wavePlay
-@util@  
-List of utility command topics:
-
-   highPeak
-   lowPeak
-   peak2peak
-   halfRange
-   mean
-   std
-   rms
-@dio@
-List of digital I/O command topics:
-
-   dioMode
-   dioWrite
-   dioRead   
-@cal@
-Full board calibration is a four stage procedure
-List of calibration command and alias topics:
-
-  Stage 1 : manualCalibrate   | cal1
-  Stage 2 : adcCalibrate      | cal2
-  Stage 3 : dacCalibrate      | cal3
-  Stage 4 : checkCalibration  | cal4
- 
- setVdd
- setVref
-@var@
-List of internal variables topics:
-
-  vdd
-  vref
-  sampleTime
-  linux  
-'''
-
-'''
-Help information about internal variables
-@vdd@
-vdd
-Voltage supply in Volt
-Do not modify this variable
-@vref@
-vref
-Voltage reference in Volt for DACs and ADCs
-Do not modify this variable
-@sampleTime@
-Current sample time in seconds
-Do not modify this variable
-@linux@
-True if system is detected as Linux
-Modify before connect if autodetect fails
-'''
-
-################################################################################# 
- 
-import sys            # System module
-import time           # Time module for wait
-import serial         # Serial connection module
-import pickle         # Savedata for calibration
-import math           # Math module
-import numbers        # Numbers module
-import glob
-import warnings       # Warnings module
-
-################# PYTHON VERSION CHECK ###########################
-
-'''
-Check if we are running on Python 2.x or 3.x
-'''
-
-PY3 = False
-if sys.version_info >= (3,0):
-    PY3 = True
-    print("Python 3.0 or later detected")
-    
-'''
-Set input both in python2 and python3
-'''    
-try:
-   input = raw_input
-except NameError:
-   pass    
-
-##################### LINUX CHECK ################################
-
-'''
-We need to check if we are in Linux because the connection
-procedure has specific requirements in Linux
-
-If Linux detection does not work ok, we can force this
-variable using:
-
-slab.linux = True    # Linux system
-slab.linux = False   # Non Linux system
-'''
-
-if sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-    linux = True
-else:
-    linux = False
-
-#################### SCIPY LOAD ##################################    
-    
-# Try to load the SciPy modules
-# The "TkAgg" backend is selected out of linux because in default
-# operation the console goes very slow after plotting
-try:		
-    if not PY3: # Needed so it does not crash Python 3.x
-        if not linux:
-            import matplotlib
-            matplotlib.use("TkAgg")    
-    import numpy as np                # Numpy for math calculations
-    import pylab as pl                # Pylab and Mathplotlib for plotting
-    import matplotlib.pyplot as plt
-
-except:
-    scipy = False
-else:
-    scipy = True
-	   
-# Version information
-version_major = 1
-version_minor = 1
-version_date  = "1/3/2018"
-
-# Default baud rate
-BAUD_RATE = 38400
-
-# Serial constants
-ACK = 181     # Command Ok
-NACK = 226    # Command Error
-ECRC = 37     # Error in CRC
-
-# External files
-HELP_FILE = "SLab_Help.dat"
-
-LAST_COM_FILE = "Last_COM.dat"
-ADC_CAL_FILE = "Cal_ADC.dat"
-DAC_CAL_FILE = "Cal_DAC.dat"
-VDD_CAL_FILE = "Cal_Vdd.dat"
-
-# External files prefixes
-fprefix = ""
-calprefix = ""
-
-# Exception code
-class SlabEx(Exception):
-    # Exception Methods ----------------------------------
-    def __init__(self, msg=""):
-        self.msg = msg
-        print("\n** SLab exception")
-        print('** ' + msg)
-        print("\n")    
-        if not interactive:
-            input("Hit RETURN to end the script")
-            
-    def __str__(self):
-        return repr(self.code)
-
-# Variable that indicates if plot functions shall return data
-plotReturnData = False        
-        
-# Verbose level 0 = None, 1 = Warn, 2 = Normal, 3 = Extensive
-verbose = 2           
-
-# Warn information
-nwarns = 0  # No warnings yet        
-        
-# Warn code
-def warn(message):
-    global nwarns
-    if verbose > 0:
-        print("\n** WARNING")
-        print("** " + message)
-        print()
-    nwarns = nwarns + 1
-                
-# Board specific data        
-ndacs = 2                         # Default number of available DACs
-
-adcNames = ["ADC1","ADC2","ADC3","ADC4"]  # Names of ADCs
-dacNames = ["DAC1","DAC2","DAC3"]         # Names of DACs
-        
-magic = [56,41,18,1]  # Magic identification code
-
-opened = 0            # Connection not opened yet
-
-vdd = 3.3             # By default vdd is 3.3V
-vref = 3.3            # By default vref is 3.3V
-
-dcroundings = 10      # Number of measurements to average in DC
-
-sampleTime = 0.001    # Current sample time
-
-# Default values to be loaded from board
-min_sample = 50e-6
-max_sample = 1.0
-
-# Empty ADC Calibration tables
-xcal  = []
-ycal1 = []
-ycal2 = []
-ycal3 = []
-ycal4 = []
-adcCalData = [ycal1,ycal2,ycal3,ycal4]
-
-# Empty DAC Calibration tables
-dacx  = []
-dac1y = []
-dac2y = []
-dac3y = []
-dac4y = []
-dacCalData = [dac1y,dac2y,dac3y,dac4y]
-
-# Wavetable information
-
-w_idle = -1  # No wave loaded
-w_points = 0 # Number of wave points
-
-# Secondary wavetable information
-w_idle2 = -1  # No secondary table loaded
-w_points2 = 0 # Number of wave points
-
-# Saturation limits
-#SAT_HIGH = 0.95
-#SAT_LOW  = 0.05
-
-##################### PUBLIC VARIABLES ###########################
-
-# Trigger Modes
-tmodeRise = 0
-tmodeFall = 1
-
-# DIO Modes
-mInput     = 10
-mPullUp    = 11
-mPullDown  = 12
-mOutput    = 20
-mOpenDrain = 21
-
-######################## OBJECTS #################################
-
-'''
-bunch (Not used yet)
-Generate a new namespace
-Included in slab.py 
-
-Example:
-  data = bunch(a=1,b=[2,3])
-  data.a
-  data.b.append(7)
-  data.c = "New element"
-  data
-      
-class bunch(dict):
-    def __init__(self,**kw):
-        dict.__init__(self,kw)
-        self.__dict__.update(kw)
-'''   
-        
-
-####################### PRIVATE SERIAL ###########################
-
-'''
-Compose a u16 value from two byes: low and high
-Parameters:
-  low  : Low byte
-  high : High byte
-Returns composed valuie
-'''    
-def composeU16(low,high):
-    value = low + high*256
-    return value     
-   
-'''
-Split a u16 value in two byes: low and high
-Parameters:
-  data : value to convert
-Returns low,high
-'''    
-def splitU16(data):
-    high = data//256
-    low = data % 256
-    return low,high   
-   
-'''
-Start of a Tx transmission
-'''   
-def startTx():
-    global crcTx
-    crcTx = 0
-    
-'''
-Send the crc
-Usually that ends the Tx transmission
-'''    
-def sendCRC():
-    global crcTx
-    if PY3:
-        ser.write([crcTx])
-    else:
-        ser.write(chr(crcTx))
-    
-'''
-Send one byte and computes crc
-'''    
-def sendByte(byte):
-    if byte < 0 or byte > 255:
-        raise SlabEx("Byte value out of range")
-    global crcTx
-    if PY3:
-        ser.write([byte])
-    else:
-        ser.write(chr(byte))
-    crcTx = crcTx ^ byte
-   
-'''
-Send one uint16 and computes crc
-'''   
-def sendU16(value):
-    if value < 0 or value > 65535:
-        raise SlabEx("Unsigned 16 bit integer out of range")
-    low,high = splitU16(value)
-    sendByte(low)
-    sendByte(high)  
-  
-'''
-Send one float and computes crc
-Floats are sent as an offset 128 exponent (1 byte)
-followed by an offset 20000 4 digit mantissa (2 byte U16)
-Returns the sent float value
-'''
-def sendFloat(value):
-    # Convert to mantissa/exponent
-    exp  = int(math.floor(math.log10(value)))-3;
-    mant = int(value/math.pow(10,exp))
-    sendByte(exp+128)
-    sendU16(mant+20000)
-    # Recalculate value
-    value2 = 1.0 * mant * math.pow(10,exp)
-    return value2
-    
-'''
-Start of a Rx reception
-'''   
-def startRx():
-    global crcRx
-    crcRx = 0
-    
-'''
-Get CRC anc check it
-It usually ends the Rx reception
-'''    
-def checkCRC():
-    global crcRx
-    crc = ord(ser.read())
-    if crc != crcRx:
-        raise SlabEx("CRC Error in Board to PC link")
-   
-'''
-Get one byte and computes crc
-'''   
-def getByte():
-    global crcRx
-    byte = ord(ser.read())
-    crcRx = crcRx ^ byte    
-    return byte
-    
-'''
-Get one uint16 and computes crc
-'''    
-def getU16():
-    low  = getByte()
-    high = getByte()
-    value = composeU16(low,high)
-    return value 
- 
-'''
-Get one float value and computes crc
-''' 
-def getFloat():
-    # Get exponent and mantissa
-    exp = getByte() - 128
-    mant = getU16() - 20000
-    # Compute value
-    value = 1.0 * mant * math.pow(10,exp)
-    return value    
-   
-'''
-Check ACK, NACK and ECRC
-'''   
-def checkACK():
-    # Get response
-    response = getByte();    
-   
-    if (response == NACK) or (response == ECRC):
-        # Check also CRC
-        checkCRC()
-        # Exceptions
-        if (response == NACK):
-            raise SlabEx("Remote Error : Bad command parameters")
-        
-        if response == ECRC:
-            raise SlabEx("CRC Error in PC to Board link")
-        
-    if response != ACK:
-        raise SlabEx("Unknown Board Response")   
-    
-'''
-Start command
-Parameters:
-   code : Code of command
-'''
-def startCommand(code):
-    startTx()
-    startRx()
-    sendByte(ord(code))
-    
-
-'''
-Check Magic 
-Check magic code in an opened serial connection
-returns 1 if board is correct or 0 otherwise
-'''
-def checkMagic():
-    global ser
-    
-    # First we flush
-    ser.flushInput()
-    
-    startCommand('M') # Magic request
-    sendCRC()         # End of command
-        
-    # Check that it responds if not Linux
-    if not linux:
-        time.sleep(0.1)
-      
-        if ser.inWaiting() < 5:
-            return 0
-        
-    read = getByte()
-    if read != ACK:
-        return 0
-    
-    # Check all magic bytes
-    for char in magic:
-        # Obtain the byte value of received character 
-        read = getByte()
-        # Exit if the magic does not match
-        if read != char:
-            return 0
-       
-    # Check CRC
-    checkCRC()
-       
-    # If we arrive here, magic is good
-    return 1    
-
-'''
-Open a serial connection with the given port
-Includes the Linux especific operations
-'''    
-def openSerial(com_port):
-    global ser
-    ser = serial.Serial(port=com_port,baudrate=BAUD_RATE)
-    # Settings required for Linux in the Nucleo boards
-    if linux: 
-        ser.setDTR(False)
-        ser.setRTS(True)
-    
-'''
-Detect and open COM port
-Only returns if the board is detected
-'''
-def detectCom():
-    global ser
-    global com_port
-    
-    # Check if there is a saved last port
-    try:
-        with open(fprefix + LAST_COM_FILE,'rb') as f:
-            com_port = pickle.load(f) 
-    except:
-        pass
-    else:
-        try:
-            message(1,"Trying last valid port " + str(com_port))
-            openSerial(com_port)
-        except:
-            pass
-        else:    
-            if checkMagic():
-                message(1,"Board detected")
-                return   
-        message(1,"Last used port is not valid")
-        message(1,"Searching for port")
-    
-    # Get a list of ports to tests
-    if sys.platform.startswith('win'):
-        ports = ['COM%s' % (i + 1) for i in range(256)]
-    elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-        # this excludes your current terminal "/dev/tty"
-        ports = glob.glob('/dev/tty[A-Za-z]*')
-    elif sys.platform.startswith('darwin'):
-        ports = glob.glob('/dev/tty.*')
-    else:
-        raise SlabEx('Platform not supported in autodetect')
-            
-    # Test each port    
-    for p in ports:
-        try:
-            message(2,"Testing port " +str(p))
-            # Port to try
-            openSerial(p)
-            
-            if checkMagic():
-                message(1,"Board detected at port " + str(p))
-                com_port = p
-                return
-            ser.close()
-        except (OSError, serial.SerialException):
-            pass
-    raise SlabEx('COM Autodetect Fail')    
-
-    
-#################### PRIVATE FUNCTIONS ###########################
-
-'''
-Convert a U16 value in float
-Truncates to the limits
-Parameter:
-  value : U16 value between 0 an 65535
-Returns float between 0.0 and 9.9998
-'''   
-def u16toFloat(value):
-    if value < 0:
-        value = 0
-    if value > 65535:
-        value = 65535
-    return value / 65536.0
-   
-'''
-Convert a float value to U16
-Truncates in the limits
-Parameter:
-  value : Float value between 0.0 and 9.9998
-Returns u16 between 
-'''   
-def floatToU16(fvalue):
-    value = int(fvalue*65536.0)
-    if value < 0:
-        value = 0
-    if value > 65535:
-        value = 65535
-    return value    
-
-'''
-Send a message to screen
-Parameters:
-    level : 1 Normal for verbose 2
-            2 Extensive for verbose 3
-'''
-def message(level,message):
-    # Check level errors    
-    if level < 1 or level > 2:
-        raise SlabEx("Internal Error : Bad message level")
-    # Print message depending on level    
-    if level < verbose:
-        print(message)
-        
-'''
-Calibrates one reading 0.0...1.0
-Returns real ratiometric from read ADC ratiometric 
-If data is outside of the calibration table, it returns 
-the data without any calibration.
-Parameters:
-  input  : Float value to calibrate in table2 domain
-  list1 : List of correct values
-  list2 : List of incorrect values
-Returns the calibrated value
-'''  
-def dc_cal(input,list1,list2):  
-    if len(list1) < 2:
-        return input
-    prevx = -1.0   # Lower limit for x (calibrated)
-    prevy = -1.0   # Lower limit for y (uncalibrated)
-    for x,y in zip(list1,list2):
-        if input <= y:         # Locate upper limit
-            if prevx == -1:    # If out of table...
-                return input   # ...don't calibrate
-            # Calbrate the value    
-            alpha = (input - prevy)/(y - prevy)
-            value = prevx + alpha*(x - prevx)
-            return value            
-        else:
-            prevx = x    # New lower limit
-            prevy = y
-    # Don't calibrate if we are out of the table        
-    return input 
-      
-'''
-Get firmware string
-This command don't use CRC
-'''    
-def getFirmwareString():
-    startCommand('F')
-
-    cad = "" 
-
-    # Check that it responds if not Linux
-    if not linux:
-        time.sleep(0.2);
-        nchar = ser.inWaiting()
-        if nchar < 1 :
-            return "Unknown"
-   
-        for i in range(0,nchar):
-            car = ser.read()
-            if (not car == '\n') and (not car == '\r'):
-                if PY3:
-                    cad = cad + car.decode("utf-8")
-                else:
-                    cad = cad + str(car)
-        return cad        
-    else:
-        car = ser.read()
-        while not car == '\n':
-            cad = cad + str(car) 
-            car = ser.read()
-        ser.read() # Flush '\r'
-        return cad     
-   
-'''
-Read one pin name
-'''
-def readPinName():
-    name = ""
-    while True:
-        car = chr(getByte())
-        if car == '$':
-            raise SlabEx("Unexpected end of pin list")
-        if car == '|':
-            return name        
-        name = name + str(car)    
-   
-'''
-Identifies the connected board
-'''
-def getBoardData():
-    global board_name
-    global ndacs,nadcs,buff_size,max_sample,min_sample,vdd
-    global dacPinList,adcPinList,dioPinList
-    global maxSFfresponse
-    global vref,dac_bits,adc_bits
-    global ndio
-    
-    print("Getting board data")
-    
-    # Get firmware string
-    board_name = getFirmwareString()
-    message(1,"Connected to " + board_name)
-    
-    startCommand('I')  # Get board capabilities
-    sendCRC()          # End of command
-    
-    # Check response
-    time.sleep(0.1)
-    flush = 0
-    if not ser.inWaiting() == 25:   # Data size + 2 (ACK and CRC)
-        message(1,"Unexpected Board Data")
-        flush = 1
-    # Check ACK    
-    checkACK()    
-    # Get data
-    ndacs = getByte()
-    nadcs = getByte()
-    buff_size = getU16()
-    max_sample = getFloat()
-    min_sample = getFloat()  
-    vdd  =  getFloat()
-    maxSFfresponse = getFloat()
-    vref = getFloat()
-    dac_bits = getByte()
-    adc_bits = getByte()
-    ndio = getByte()
-    rState = getByte()
-   
-    if flush:
-        # Flush buffer
-        ser.flushInput()
-    else:
-        checkCRC()
-    
-    if rState:
-        message(1,"Board at reset state")
-    else:
-        message(1,"Board out of reset state")
-    
-    # Get pin list
-    dacPinList=[]
-    adcPinList=[]
-    dioPinList=[]
-    startCommand('L')
-    sendCRC()          # End of command
-    
-    checkACK()
-    for i in range(0,ndacs):
-        dacPinList.append(readPinName())
-    for i in range(0,nadcs):
-        adcPinList.append(readPinName()) 
-    for i in range(0,ndio):
-        dioPinList.append(readPinName())         
-            
-    # Get the final $
-    car = chr(getByte())
-    if car != '$':
-        raise SlabEx("[P] Bad termination in pin list")
-           
-    checkCRC()
-    # Flush buffer
-    ser.flushInput()
-   
-'''
-Ratiometric read of one analog ADC channel
-Does not perform any calibration
-Parameters:
-   n :Channel can be a number 1,2,3,4
-Returns the ratiometric reading between 0.0 and 1.0   
-'''    
-def readChannel(n):
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if n > nadcs:
-        raise SlabEx("Invalid ADC number")        
-    acum = 0.0     
-    '''
-    # This code has been moved to the hardware board
-    for i in range(0,dcroundings):
-        startCommand('A')
-        sendByte(n);
-        sendCRC()          # End of command
-        
-        checkACK()
-        value = getU16()
-        checkCRC()
-        
-        fvalue = u16toFloat(value)
-        acum = acum + fvalue
-    fvalue = acum / dcroundings 
-    '''
-    startCommand('A')
-    sendByte(n);
-    sendCRC()          # End of command
-        
-    checkACK()
-    value = getU16()
-    checkCRC() 
-    
-    fvalue = u16toFloat(value)
-    
-    return fvalue  
-	
-'''
-Ratiometric write of one analog DAC channel
-Does not perform any calibration
-Parameters:
-      n : DAC to set 1,2 (or 3 if three DACs)
-  value : Value to set 0.0 to 1.0
-'''    
-def writeChannel(n,value):
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if n > ndacs:    
-        raise SlabEx("Invalid DAC number")        
-    data = ratio2counts(value)
-    
-    startCommand('D')
-    sendByte(n)
-    sendU16(data) 
-    sendCRC()
-    
-    checkACK()
-    checkCRC()
-
-'''
-Convert ratiometric level to counts
-Generate exception if out of range
-Parameter:
-   ratio : Value between 0.0 and 1.0
-Returns uint 16   
-'''  
-def ratio2counts(ratio):
-    if ratio < -0.001:
-        raise SlabEx("Ratiometric value cannot be below 0.0")
-    if ratio > 1.001:
-        raise SlabEx("Ratiometric value cannot be above 1.0")
-
-    data = floatToU16(ratio)
-            
-    return data    
-
-'''
-Convert voltage value to ratiometric value
-'''    
-def voltage2ratio(value):
-    if value < -0.001:
-        raise SlabEx("Voltage value cannot be below 0 V")
-    if value > vref*1.001:
-        raise SlabEx("Voltage value cannot be above Vref")
-    return value/vref;
-    
-'''
-Convert voltage value to counts 
-'''  
-def voltage2counts(value):
-    return ratio2counts(voltage2ratio(value))
-       
-'''
-Message when SciPy is not loaded and we cannot plot
-'''       
-def cannotPlot(exception=False):
-    if not exception:
-        message(1,"")
-        message(1,"SciPy not loaded. Cannot plot")
-        message(1,"")
-    else:
-        raise SlabEx("SciPy not loaded. Cannot plot")
-       
-'''
-Generate an exception if scipy is not loaded
-'''  
-def checkSciPy():
-    if not scipy:
-        raise SlabEx("SciPy not loaded. Cannot execute")
-       
-#################### HELP CODE ###########################       
-
-'''
-@help@
-help(topic)
-Gives help information
-
-Optional parameters:
-   topic : Text to give information about
-           (Defaults to "root")
-Returns nothing
-Included in slab.py           
-'''
-def help(topic="root"):
-    while (True):
-        print()
-        ftopic = "@"+topic+"@"
-        topic_found = False
-        list = []
-        maxlen = 0
-        with open(fprefix + HELP_FILE, 'r') as hfile:
-            for line in hfile:
-                if line.startswith("#"):
-                    continue
-                if not topic_found:
-                    if line.startswith("@#"):
-                        print("'" + topic + "' topic not found")
-                        break
-                    elif line.upper().startswith(ftopic.upper()):
-                        topic_found = True
-                else:
-                    if line.startswith("@"):
-                        break
-                    list.append(" " + line[0:-1]) 
-                    if len(line) > maxlen:
-                        maxlen = len(line)
-                    # print(" " + line[0:-1])
-        if topic_found:            
-            print((maxlen+1)*"-")
-            for line in list:
-                print(line)
-            print((maxlen+1)*"-")
-        else:
-            print()        
-        print("root topic goes to main page")
-        print("Just hit return to exit help")
-        print()
-        topic = input("Help topic : ")
-        if topic == "":
-            print()
-            return
-       
-############# PUBLIC NO BOARD RELATED FUNCTIONS #################
-    
-'''
-@wait@
-wait(t)
-Wait the indicated time in seconds
-
-Required parameter:
-    t : Time to wait in float seconds
-Returns nothing
-Included in slab.py 
-'''    
-def wait(t):
-    time.sleep(t)
-    
-'''
-@pause@
-pause(message)
-Pause the script untill return is hit
-
-Optional parameter:
-  message : Message to show 
-            (Use default if not provided)
-Returns nothing 
-Included in slab.py            
-'''    
-def pause(message="Script Paused. Hit RETURN to continue"):
-    input(message)
-    
-    
-'''
-@setVerbose@
-setVerbose(level)
-Sets the verbose level
-
-Required parameter:
-   level : Verbose level 0, 1, 2 or 3
-           0 : No messages
-           1 : Only warnings
-           2 : Basic information
-           3 : Detailed information
-Returns previous verbose level 
-Included in slab.py   
-'''    
-def setVerbose(level):
-    global verbose
-    # Check
-    if level < 0 or level > 3:
-        raise SlabEx("Invalid verbose level")
-    # Set level
-    last_verbose = verbose
-    verbose = level    
-    return last_verbose
-    
-'''
-@setFilePrefix@
-setFilePrefix(prefix)
-Set file prefix for all external files
-
-Optional parameter:
-  prefix : Prefix to use (Defaults to none)
-Returns nothing  
-Included in slab.py 
-
-See also setCalPrefix
-''' 
-def setFilePrefix(prefix=""):
-    global fprefix
-    fprefix = prefix
-    
-'''
-@setCalPrefix@
-setCalPrefix(prefix)
-Set file prefix for calibration files
-It adds after file prefix if present
-
-Optional parameter:
-  prefix : Prefix to use (Defaults to none)
-Returns nothing  
-Included in slab.py 
-
-See also setFilePrefix
-''' 
-def setCalPrefix(prefix=""):
-    global calprefix
-    calprefix = prefix    
-    
-    
-'''
-@save@
-save(filename,data)
-Saves a variable on a file
-Adds .sav extension to filename
-
-Parameters:
-  filename : Name of the file (with no extension)
-  data : Variable to store
-  
-Returns nothing  
-Included in slab.py 
-'''    
-def save(filename,data):
-    with open(filename+".sav",'wb') as f:
-        pickle.dump(data,f)
-    message(1,"Data saved")
-
-'''
-@load@
-load(filename)
-Loads a variable from a file
-Adds .sav extension to filename
-
-Parameters:
-  filename : Name of the file (with no extension)
-  
-Returns variable contained in the file
-Included in slab.py 
-'''    
-def load(filename):
-    with open(filename+".sav",'rb') as f:
-        data = pickle.load(f)
-    message(1,"Data loaded")    
-    return data
-    
-################ PUBLIC BASIC DC FUNCTIONS ####################
-
-'''
-@printBoardInfo@
-printBoardInfo()
-Shows board information on screen
-Returns nothing
-Included in slab.py 
-'''
-def printBoardInfo():
-    if not opened:
-        raise SlabEx("No board connected")
-    print("")
-    print("Board : " + board_name)
-    print("  COM port : " + str(com_port))
-    print("  Reference Vref voltage : " + str(vref) + " V")
-    print("  Power Vdd voltage : " + str(vdd) + " V")
-    print("  " + str(ndacs) + " DACs with " + str(dac_bits) + " bits")
-    print("  " + str(nadcs) + " ADCs with " + str(adc_bits) + " bits")
-    print("  " + str(ndio) + " Digital I/O lines")
-    print("  DAC Pins " + str(dacPinList))
-    print("  ADC Pins " + str(adcPinList))
-    print("  DIO Pins " + str(dioPinList))
-    print("  Buffer Size : " + str(buff_size) + " samples")
-    print("  Maximum Sample Period : " + str(max_sample) + " s")
-    print("  Minimum Sample Period for Transient Async: " + str(min_sample) + " s")
-    print("  Maximum Sample Frequency for Frequency Response : " + str(maxSFfresponse) + " Hz")
-    print("")
- 
-  
-'''
-@disconnect@
-disconnect()
-Disconnect from the board
-Returns nothing
-Included in slab.py 
-'''  
-def disconnect():
-    global opened
-    if not opened:
-        raise SlabEx("Not connected to board")
-    ser.close()
-    opened = 0
-    message(1,"Disconnected from the board")
-    if nwarns > 0:
-        message(1,str(nwarns) + " warnings since connect")
-  
- 
-'''
-@connect@
-connect(portIdent)
-Open the connection with the hardware board
-Must be called before any other function that uses it
-
-Optional parameter:
-   portIdent : Identifier of the COM port 
-               In windows it is COMx where x is a number
-               (Defaults to Autodetect)
-Returns nothing
-Included in slab.py 
-'''
-def connect(portIdent=-1):
-    global ser,opened
-    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
-    global dacx,dac1y,dac2y,dacCalData
-    global com_port
-    global vdd,vref
-    global nwarns
-    
-    # Check if already connected
-    if opened:
-        message(1,"Already connected")
-        disconnect()
-    
-    com_port = portIdent
-        
-    if portIdent == -1:
-        detectCom()
-    else:    
-        try:    
-            openSerial(com_port)
-        except:
-            raise SlabEx("Cannot open connection. Check port")
-    
-    if not ser.isOpen():
-        raise SlabEx("Cannot open connection. Check port")
-         
-    # Get firmware string
-    #board_name = getFirmwareString()
-    #message(1,"Connected to " + board_name)
-
-    if not checkMagic(): 
-        raise SlabEx("Bad magic from board. Check Firmware")
-            
-    # Set board as opened
-    opened = 1    
-    
-    # Save good com port
-    with open(fprefix + LAST_COM_FILE,'wb') as f:
-        pickle.dump(com_port, f)
-    
-    # Get information about the board
-    getBoardData()
-                    
-    # Try to load ADC calibration data
-    try:
-        with open(fprefix + calprefix + ADC_CAL_FILE,'rb') as f:
-            xcal,ycal1,ycal2,ycal3,ycal4 = pickle.load(f) 
-    except:
-        message(1,"No ADC calibration data found")
-    else:
-        message(1,"ADC Calibration data loaded")
-        # All output adc calibration tables    
-        adcCalData = [ycal1,ycal2,ycal3,ycal4]
-        
-    # Try to load DAC calibration data
-    try:
-        with open(fprefix + calprefix + DAC_CAL_FILE,'rb') as f:
-            dacx,dac1y,dac2y,dac3y,dac4y = pickle.load(f) 
-    except:
-        message(1,"No DAC calibration data found")
-    else:
-        message(1,"DAC Calibration data loaded")
-        # All output dac calibration tables    
-        dacCalData = [dac1y,dac2y,dac3y,dac4y]        
-        
-    # Try to load Vdd and Vref calibration data
-    try:
-        with open(fprefix + calprefix + VDD_CAL_FILE,'rb') as f:
-            vdd,vref = pickle.load(f)
-    except:
-        pass
-    else:
-        message(1,"Vdd loaded from calibration as " + str(vdd) + " V")
-        message(1,"Vref loaded as " + str(vref) + " V")
-  
-    message(1,"")
-    
-    # Erase warn count
-    nwarns = 0
-
-'''
-@setVdd@
-setVdd(value,persistent)
-Set Vdd supply voltage
-
-Required parameter:
-  value : Value to set (in Volt)
-  
-Optional parameter:
-  persistent : Makes value persistent in a file
-               (Defaults to False)
-
-Returns nothing  
-Included in slab.py              
-'''  
-def setVdd(value,persistent=False):
-    global vdd
-    # Check connection
-    if not opened:
-        raise SlabEx("Not connected to board")
-    # Check vdd value
-    if value < 3.0:
-        raise SlabEx("Vdd value too low")
-    # Removed to expand functionality at high voltages    
-    # if value > 4.0:
-    #    raise SlabEx("Vdd value too high")
-    vdd = value
-    
-    # Save if persistent
-    if persistent:
-        message(1,"Saving Vdd and Vref data to " + fprefix + calprefix + VDD_CAL_FILE)
-        with open(fprefix + calprefix + VDD_CAL_FILE,'wb') as f:
-            pickle.dump([vdd,vref], f)
-            
-'''
-@setVref@
-setVref(value,persistent)
-Set Vref reference value for DACs and ADCs
-
-Required parameter:
-  value : Value to set (in Volt)
-  
-Optional parameter:
-  persistent : Makes value persistent in a file
-               (Defaults to False)
-
-Returns nothing
-Included in slab.py                
-'''  
-def setVref(value,persistent=False):
-    global vref
-    # Check connection
-    if not opened:
-        raise SlabEx("Not connected to board")
-    # Check vref value
-    if value < 3.0:
-        raise SlabEx("Vref value too low")
-    # Removed to expand functionality at high voltages    
-    # if value > 4.0:
-    #    raise SlabEx("Vref value too high")
-    vref = value
-    
-    # Save if persistent
-    if persistent:
-        message(1,"Saving Vdd and Vref data to " + fprefix + calprefix + VDD_CAL_FILE)
-        with open(fprefix + calprefix + VDD_CAL_FILE,'wb') as f:
-            pickle.dump([vdd,vref], f)            
-  
-'''
-@writeDAC@
-writeDAC(channel,value)
-Write a ratiometric value to one DAC
-Performs calibration if available
-
-Required parameteres:
- channel : DAC number
-   value : Value to set from 0.0 to 1.0 
-Returns nothing
-Included in slab.py    
-'''  
-def writeDAC(channel,value):   
-    # Calibrate value    
-    value = dc_cal(value,dacx,dacCalData[channel-1])    
-    
-    # Send to board
-    writeChannel(channel,value)  
-
- 
-'''
-@setVoltage@
-setVoltage(channel,value)
-Sets the voltage value of one DAC
-Performs calibration if available
-
-Required parameters:
- channel : DAC to write
-   value : Voltage to set
-Returns nothing
-Included in slab.py    
-'''   
-def setVoltage(channel,value):
-    value = voltage2ratio(value)
-    writeDAC(channel,value)
- 
-
-'''
-@readADC@
-readADC(channel)
-Read the ratiometric value at one ADC
-Uses calibration data if available
-
-Rquired parameter:
-  n : ADC number
-Returns a ratiometric value between 0.0 and 1.0
-Included in slab.py 
-'''            
-def readADC(channel):
-    fvalue = readChannel(channel)
-    return dc_cal(fvalue,xcal,adcCalData[channel-1])  
-    
-    
-'''
-@readVoltage@
-readVoltage(ch1,ch2)
-Reads a differential voltage between two ADCs at ch1 and ch2
-If ch2 is ommited, returns voltage between ch1 and GND
-If any channel is zero, it is considered as GND
-Return the voltage
-Included in slab.py 
-'''    
-def readVoltage(ch1,ch2=0):
-    if ch1 == 0:
-        pvalue = 0.0
-    else:    
-        pvalue = vref*readADC(ch1)
-    if ch2 == 0:
-        nvalue = 0.0
-    else:
-        nvalue = vref*readADC(ch2)
-    return pvalue - nvalue 
-
-'''
-@rCurrent@
-rCurrent(r,ch1,ch2)
-Reads the voltage on a resistor and computes current from it
-If any channel is zero, it is considered as GND
-
-Parameters:
-   r : Resistor value
-  n1 : Positive terminal ADC
-  n2 : Negative terminal ADC
-       If omited it is considered to be GND
-Returns the resistor current 
-Included in slab.py       
-'''    
-def rCurrent(r,ch1,ch2=0):
-    v = readVoltage(ch1,ch2)
-    i = v/r
-    return i
-    
-'''
-@setDCreadings@
-setDCreadings(number)
-Sets the number of readings to average on each DC mesurement
-Parameter:
-  number : Number of values to read
-Returns last value of this number
-Included in slab.py   
-'''
-def setDCreadings(number):
-    global dcroundings
-    lastValue = dcroundings
-    # Check
-    if number < 1:
-        raise SlabEx("Number of readings must be greater or equal than 1")
-    if number > 65535:
-        raise SlabEx("Number of readings too big")
-    dcroundings = int(number)
-    
-    # Send command
-    startCommand('N')
-    sendU16(dcroundings) 
-    sendCRC()
-    
-    checkACK()
-    checkCRC()
-    
-    return lastValue
-   
-'''
-@adcCalibrate@
-adcCalibrate()
-Second stage of board calibration
-Calibrates ADCs against DAC1
-Stores calibration data on ADC_CAL_FILE file
-Returns nothing
-Included in slab.py 
-'''   
-def adcCalibrate():
-    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
-    
-    print()
-    print("Calibration of ADCs")
-    print()
-    print("Connect the DAC 1 output to all ADC inputs")
-    print("Use the buffers in all connections")
-    print()   
-    input("Press [Return] to continue")
-    
-    # Increase number of readings for better calibration
-    lastDCR=setDCreadings(1000)
-    
-    # Define input calibration range and steps
-    # xcal = np.arange(0.0,1.1,0.1)
-    xcal = []
-    for x in range(0,11):
-        xcal.append(x/10.0)
-    
-    # Output range is now empty
-    ycal1 = []
-    ycal2 = []
-    ycal3 = []
-    ycal4 = []
-    
-    # Obtain calibration data
-    # We use readChannel because it does not depend on
-    # previous calibrations
-    message(1,"Performing ADC calibration")
-    for x in xcal:
-        message(2,"  Calibrate at " + str(x))
-        writeDAC(1,x)        # Set DAC value
-        time.sleep(0.1)      # Wait a little
-        a1 = readChannel(1)  # ADC read
-        a2 = readChannel(2)
-        a3 = readChannel(3)
-        a4 = readChannel(4)
-        ycal1.append(a1)     # Append values
-        ycal2.append(a2)
-        ycal3.append(a3)
-        ycal4.append(a4)
-    
-    prev1=-1;
-    # Check monotony
-    for x,y1,y2,y3,y4 in zip(xcal,ycal1,ycal2,ycal3,ycal4):
-        if prev1!=-1:
-            if y1 < prev1:
-                raise SlabEx("Channel 1 non monotonous")
-            if y2 < prev2:
-                raise SlabEx("Channel 2 non monotonous")
-            if y3 < prev3:
-                raise SlabEx("Channel 3 non monotonous")
-            if y4 < prev4:
-                raise SlabEx("Channel 4 non monotonous")               
-        prev1 = y1
-        prev2 = y2
-        prev3 = y3
-        prev4 = y4
-    
-    # Show graph is we have SciPy
-    if not scipy:
-        cannotPlot()
-    else:    
-        plt.figure(facecolor="white")     # White border
-        pl.plot(xcal,ycal1,label="ADC1")  # Show curves
-        pl.plot(xcal,ycal2,label="ADC2")
-        pl.plot(xcal,ycal3,label="ADC3")
-        pl.plot(xcal,ycal4,label="ADC4")
-
-        pl.xlabel('DAC1 Value')                         # Set X label
-        pl.ylabel('ADC 1,2,3,4 Values')                 # Set Y label
-        pl.title('ADC Ratiometric Calibration Curves')  # Set title
-
-        pl.legend(loc='lower right')
-        pl.grid()
-        pl.show() 
-        pl.close()
-
-    # Save of calibration data
-    message(1,"Saving calibration data to " + fprefix +  calprefix + ADC_CAL_FILE)
-    with open(fprefix + calprefix +  ADC_CAL_FILE,'wb') as f:
-        pickle.dump([xcal,ycal1,ycal2,ycal3,ycal4], f)
-        
-    # All calibration tables    
-    adcCalData = [ycal1,ycal2,ycal3,ycal4]    
-            
-    # Restore the number of ADC readings
-    setDCreadings(lastDCR)
-            
-    print() 
-    print("Calibration of ADCs completed")
-    print()    
-   
-'''
-Stores DAC calibration data
-Internal function
-Parameter:
- n : Number of DACs to show
-'''   
-def _storeAndShowDACcalibration(n):
-
-    # Plot if we have SciPy
-    if not scipy:
-        cannotPlot()
-    else:    
-        plt.figure(facecolor="white")     # White border
-        pl.plot(dacx,dac1y,label="DAC1")  # Show curves
-    
-        if n >= 2:
-            pl.plot(dacx,dac2y,label="DAC2")
-        if n >= 3:
-            pl.plot(dacx,dac2y,label="DAC3")
-
-        pl.xlabel('DAC Value')                          # Set X label
-        pl.ylabel('Real Ratiometric Values')            # Set Y label
-        pl.title('DAC Ratiometric Calibration Curves')  # Set title
-
-        pl.legend(loc='lower right')
-        pl.grid()
-        pl.show()   
-        pl.close()        
-
-    message(1,"Saving calibration data to "+ fprefix + calprefix + DAC_CAL_FILE)
-    with open(fprefix + calprefix + DAC_CAL_FILE,'wb') as f:
-        pickle.dump([dacx,dac1y,dac2y,dac3y,dac4y], f)
-     
-    # All calibration tables    
-    dacCalData = [dac1y,dac2y,dac3y,dac4y]       
-   
-'''
-@dacCalibrate@
-dacCalibrate()
-Third stage of board calibration
-Calibrates DAC(i) against ADC(i)
-Stores calibration data on DAC_CAL_FILE file
-Returns nothing
-Included in slab.py 
-'''   
-def dacCalibrate():
-    global dacx,dac1y,dac2y,dac3y,dac4y,dacCalData
-    
-    print()
-    print("Calibration of DACs")
-    print()
-    print("Connect the DAC outputs to ADC inputs with same number")
-    print("DAC 1 to ADC 1 and DAC2 to ADC2 and son on...")
-    print()    
-    input("Press [Return] to continue")
-    
-    # Increase number of readings for better calibration
-    lastDCR=setDCreadings(1000)
-    
-    # Define input calibration range and steps
-    # dacx = np.arange(0.0,1.1,0.1)
-    dacx = []
-    for x in range(0,11):
-        dacx.append(x/10.0)
-    
-    # Output range is now empty
-    dac1y = []
-    dac2y = []
-    dac3y = []
-    dac4y = []
-    
-    # Obtain calibration data
-    # We use previusly calibrated ADC channels
-    message(1,"Performing DAC calibration")
-    for x in dacx:
-        message(2,"  Calibrate at " + str(x))
-        writeChannel(1,x)       # Set DAC values without calibration
-        writeChannel(2,x)
-        if ndacs >= 3:
-            writeChannel(3,x)
-        time.sleep(0.1)    # Wait a little
-        a1 = readADC(1)    # ADC ratiometric read (with calibration)
-        a2 = readADC(2)
-        dac1y.append(a1)   # Append read values
-        dac2y.append(a2)
-        if ndacs>=3:
-            a3 = readADC(3)    
-            dac3y.append(a3)
-    
-    prev1=-1;
-    # Check monotony
-    for x,y1,y2,y3,y4 in zip(xcal,dac1y,dac2y,dac3y,dac4y):
-        if prev1!=-1:
-            if y1 < prev1:
-                raise SlabEx("Channel 1 non monotonous")
-            if y2 < prev2:
-                raise SlabEx("Channel 2 non monotonous")
-            if ndacs >= 3 and y3 < prev3:
-                raise SlabEx("Channel 3 non monotonous")
-            if ndacs >= 4 and y4 < prev4:
-                raise SlabEx("Channel 4 non monotonous")               
-        prev1 = y1
-        prev2 = y2
-        prev3 = y3
-        prev4 = y4    
-    
-    # Show and save calibration data
-    _storeAndShowDACcalibration(ndacs)
-     
-    # Restore the number of ADC readings
-    setDCreadings(lastDCR) 
-     
-    print() 
-    print("Calibration of DACs completed")
-    print()     
-   
-'''
-@manualCalibrateDAC1@
-manualCalibrateDAC1()
-First stage of board calibration
-Performs a manual calibration of DAC 1 against a voltage meter
-Also calibrates Vdd and Vref
-Returns nothing
-Included in slab.py 
-'''   
-def manualCalibrateDAC1():  
-    global vdd,vref,dacx,dac1y
-    print()
-    print("Manual calibration of DAC 1")
-    print("You will need a voltage measurement instrument (VM)" )
-    print()
-    print("Put VM between the Vdd terminal and GND")
-    print("Write down the voltage value and press enter")
-    print()
-    vdd = float(input("Voltage value [Volt]: "))
-    print()
-    print("Put VM between the buffered DAC 1 output and GND")
-    print("Write down the voltage value and press enter each time it is asked")
-    print()
-    
-    # Increase number of readings for better calibration
-    lastDCR=setDCreadings(1000)
-    
-    dacx  = [0.0,0.02,0.1,0.5,0.9,0.98,1.0]
-    voltages = []
-    
-    prevv = -1.0
-    for x in dacx:
-        writeChannel(1,x)
-        y = float(input("Voltage value [Volt]: "))
-        voltages.append(y)
-        if y < prevv:
-            raise SlabEx("Non monotonous. Cannot calibrate")
-        prevv = y
-        
-    # Stores vdd and vref calibration
-    if voltages[3]*2.0 > voltages[6] :
-        setVref(voltages[3]*2.0, persistent=True)
-    else:    
-        setVref(voltages[-1], persistent=True) 
-
-    # Convert to ratiometric    
-    dac1y = []
-    for v in voltages:
-        dac1y.append(v/vref)
-        
-    # Store calibration
-    _storeAndShowDACcalibration(1)  
-
-    # Restore the number of ADC readings
-    setDCreadings(lastDCR) 
-    
-    print() 
-    print("Manual calibration of DAC 1 completed")
-    print()    
-    
-
-'''
-@checkCalibration@
-checkCalibration()
-Fourth and last stage of board calibration
-Checks the board calibration
-Shows the curves of DACs connected to ADCs
-Returns nothing
-Included in slab.py 
-'''    
-def checkCalibration():
-
-    print()
-    print("Calibration check")
-    print()
-    print("Connect the DAC outputs to ADC inputs with same number")
-    print("DAC 1 to ADC 1 and DAC2 to ADC2 and son on...")
-    print("Connect the rest of ADCs to DAC 1")
-    print()    
-    input("Press [Return] to continue")
-
-    # Increase number of readings for better calibration
-    lastDCR=setDCreadings(400)
-    
-    vmin = 0.1
-    vmax = vref - 0.1
-
-    R1 = dcSweep(1,vmin,vmax,0.2)
-    R2 = dcSweep(2,vmin,vmax,0.2)
-    if ndacs > 2:
-        R3 = dcSweep(3,vmin,vmax,0.2)
-
-    x = R1[0]
-    y1 = R1[1]
-    y2 = R2[2]
-    if ndacs > 2:
-        y3 = R3[3]
-    else:
-        y3 = R1[3]
-    y4 = R1[4]
-
-    for i in range(1,ndacs+1):
-        setVoltage(i,1.0)
-    
-    message(1,"")
-    message(1,"DAC outputs shall be now 1V")
-    message(1,"They will be zero after closing the plot")
-    message(1,"")
-    
-    plot1n(x,[y1,y2,y3,y4],"Final curves","DAC (V)","ADC (V)",["Ch1","Ch2","Ch3","Ch4"])
-    
-    zero()
-    
-    
-    # Restore the number of ADC readings
-    setDCreadings(lastDCR) 
-    
-    
-
-'''
-@dcPrint@
-dcPrint()
-Show readings all four ADC channels on screen
-Returns nothing
-Included in slab.py  
-'''
-def dcPrint():
-    a1 = readVoltage(1);
-    a2 = readVoltage(2);
-    a3 = readVoltage(3);
-    a4 = readVoltage(4);
-    print("ADC DC Values")
-    print("  ADC1 = "+"{0:.3f}".format(a1)+" V")
-    print("  ADC2 = "+"{0:.3f}".format(a2)+" V")
-    print("  ADC3 = "+"{0:.3f}".format(a3)+" V")
-    print("  ADC4 = "+"{0:.3f}".format(a4)+" V")
-    print()
-    
-'''
-@zero@
-zero()
-Set all DACs to ratiometric zero
-Does not use calibration
-Returns nothing
-Included in slab.py 
-'''    
-def zero():
-    for i in range(1,ndacs+1):
-        writeChannel(i,0.0);  
-    message(2,"All DACs at zero")        
-  
-'''
-@dcLive@
-dcLive(n,wt,single,returnData)
-Prints live values of ADC voltages
-Use CTRL+C to exit
-
-Optional parameters:
-          n : Number of ADCs to show (Defaults to 4)
-         wt : Wait time, in seconds, between measurements (Defaults to 0.2)
-     single : Read only the ADC number n
- returnData : Return obtained data
-
-Included in slab.py
-'''
-def dcLive(n=4,wt=0.2,single=False,returnData=False):
-    # Initial checks
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if n < 1 or n > 4:
-        raise SlabEx("Invalid number of ADCs")
-    
-    # Generate output lists
-    data=[]
-    if not single:
-        for i in range(0,n):
-            data.append([])
-    
-    print("Live voltage readings:")
-    print()
-    try:
-        while True:
-            sys.stdout.write("\r")
-            if single:
-                a = readVoltage(n)
-                sys.stdout.write(" ADC%d: " % n)
-                sys.stdout.write("%f V" % a)
-                if returnData:
-                    data.append(a)
-            else:
-                for i in range(1,n+1):
-                    a = readVoltage(i)
-                    sys.stdout.write(" ADC%d: " % i)
-                    sys.stdout.write("%f V" % a)
-                    if returnData:
-                        data[i-1].append(a)
-            sys.stdout.write("    ")
-            wait(wt)
-    except:
-        print()
-        print("End of live measurements")
-        print()
-        
-    # Compose return data if enabled    
-    if returnData:
-        if not scipy:
-            return data
-        else:    
-            if single:
-                return np.array(data)
-            elif n == 1:
-                return np.array(data[0])
-            else:
-                ret = []
-                for i in range(0,n):
-                    ret.append(np.array(data[i]))
-                return ret    
-        
-  
-########### CALIBRATE ALIAS COMMANDS ############################
-
-'''
-@cal1@
-cal1()
-Alias for the manualCalibrateDAC1 command
-Included in slab.py
-'''
-def cal1():
-    manualCalibrateDAC1()
-
-'''
-@cal2@
-cal2()
-Alias for the adcCalibrate command
-Included in slab.py
-'''    
-def cal2():
-    adcCalibrate()
-  
-'''
-@cal3@
-cal3()
-Alias for the dacCalibrate command
-Included in slab.py
-'''     
-def cal3():
-    dacCalibrate()
- 
-'''
-@cal4@
-cal4()
-Alias for the checkCalibration command
-Included in slab.py
-'''      
-def cal4():
-    checkCalibration()   
- 
-################ PUBLIC COMPLEX DC FUNCTIONS ####################
-
-'''
-@dcSweep@
-dcSweep(ndac,v1,v2,vi,wt)
-Performs a DC Sweep on a DAC and reads all ADCs at each point
-
-Required parameters:
-  ndac : DAC to sweep
-    v1 : Start voltage
-    v2 : End voltage
-    
-Optional parameters    
-    vi : Increment (Defaults to 0.1 V)
-    wt : Wait time at each step (Defaults to 0.1 s)
-    
-Returns a list of vectors
-   Vector 0 is the DAC value
-   Vectorns 1 onward are ADC values    
-
-Included in slab.py    
-'''
-
-def dcSweep(ndac,v1,v2,vi=0.1,wt=0.1):
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if v1 < 0.0:
-        raise SlabEx("Voltage cannot be below 0 volts")
-    if v1 > vref:
-        raise SlabEx("Voltage cannot be over Vref")
-    if v2 < 0.0:
-        raise SlabEx("Voltage cannot be below 0 volts")
-    if v2 > vref:
-        raise SlabEx("Voltage cannot be over Vref")        
-    if ndac < 1 or ndac > ndacs:
-        raise SlabEx("Invalid DAC number")
-
-    checkSciPy()
-            
-    message(1,"Performing mesurements...")        
-            
-    # Initialize outputs
-    a1 = []
-    a2 = []
-    a3 = []
-    a4 = []   
-           
-    # Perform the measurements       
-    xrange = np.arange(v1,v2,vi)
-    for x in xrange:
-        message(2,"  DAC at " + str(x) + " V")
-        setVoltage(ndac,x)
-        wait(wt)
-        a1.append(readVoltage(1))
-        a2.append(readVoltage(2))
-        a3.append(readVoltage(3))
-        a4.append(readVoltage(4))
-        
-    message(1,"Measurement ends")    
-
-    # Return results
-    return xrange,np.array(a1),np.array(a2),np.array(a3),np.array(a4)
-    
-################## PUBLIC PLOTTING FUNCTIONS ####################
-
-
-'''
-Plot two magnitudes using log if needed
-Used by the plot11, plot1n and plotnn commands
-'''
-def plotXY(x,y,label="",logx=False,logy=False):
-    if not logx and not logy:
-        pl.plot(x,y,label=label)
-        return
-    if logx and not logy:
-        pl.semilogx(x,y,label=label)
-        return
-    if logy and not logx:
-        pl.semilogy(x,y,label=label)
-        return
-    if logx and logy:
-        pl.loglog(x,y,label=label)
-        return
-
-'''
-@setPlotReturnData@
-setPlotReturnData(value)
-Configures if plot commands shoud return the plotted data
-
-Optional parameters:
-  value : By default is False
-Returns nothing 
-Included in slab.py  
-'''
-def setPlotReturnData(value=False):
-    global plotReturnData
-    plotReturnData = value
-
-'''
-@plot11@
-plot11(x,y,title,xt,yt,logx,logy)
-Plot one input against one output
-If x is an empty list [], a sequence number
-will be used for the x axis
-
-Required parameters:
-  x : Horizontal vector
-  y : Vertical vector
-  
-Optional parameters:
-  title : Plot title (Defaults to none)
-     xt : Label for x axis (Defaults to none)
-     yt : Label for y axis (Defaults to none)
-   logx : Use logarithmic x axis (Defaults to False)
-   logy : Use logarithmic x axis (Defaults to False)
-
-Returns nothing
-Included in slab.py      
-'''
-def plot11(x,y,title="",xt="",yt="",logx=False,logy=False):
-
-    # Check if SciPy is loaded
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-       
-    # Generate sequence if x is not provided
-    if x == []:
-        x = np.arange(0,len(y))
-       
-    plt.figure(facecolor="white")   # White border
-    plotXY(x,y,logx=logx,logy=logy)
-    pl.xlabel(xt)
-    pl.ylabel(yt)
-    pl.title(title)
-    pl.grid()
-    pl.show()
-    pl.close()
-    
-'''
-@plot1n@
-plot1n(x,ylist,title,xt,yt,labels,location,logx,logy)
-Plot one input against several outputs
-If x is an empty list [], a sequence number
-will be used for the x axis
-
-Required parameters:
-      x : Horizontal vector
-  ylist : List of vertical vectors
-  
-Optional parameters:
-    title : Plot title (Defaults to none)
-       xt : Label for x axis (Defaults to none)
-       yt : Label for y axis (Defaults to none)
-   labels : List of legend labels (Defaults to none)
- location : Location for legend (Defaults to 'best')
-     logx : Use logarithmic x axis (Defaults to False)
-     logy : Use logarithmic x axis (Defaults to False)
-
-Returns nothing
-Included in slab.py     
-'''
-def plot1n(x,ylist,title="",xt="",yt="",labels=[],location='best',logx=False,logy=False):
-
-    # Check if SciPy is loaded
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Generate sequence is x is not provided
-    if x == []:
-        x = np.arange(0,len(ylist[0]))        
-        
-    plt.figure(facecolor="white")   # White border
-    if labels == []:
-        for y in ylist:
-            plotXY(x,y,logx=logx,logy=logy)
-            #pl.plot(x,y)
-    else:
-        for y,lbl in zip(ylist,labels):
-            plotXY(x,y,label=lbl,logx=logx,logy=logy)
-            #pl.plot(x,y,label=lbl)
-    pl.xlabel(xt)
-    pl.ylabel(yt)
-    pl.title(title)
-    pl.grid()
-    if not labels == []:
-        pl.legend(loc=location)
-    pl.show() 
-    pl.close()    
-  
-'''
-@plotnn@
-plotnn(xlist,ylist,title,xt,yt,labels,location,logx,logy)
-Plot several curves with different inputs and outputs
-
-Required parameters:
-  xlist : List of horizontal vector
-  ylist : List of vertical vectors
-  
-Optional parameters:
-    title : Plot title (Defaults to none)
-       xt : Label for x axis (Defaults to none)
-       yt : Label for y axis (Defaults to none)
-   labels : List of legend labels (Defaults to none)
- location : Location for legend (Defaults to 'best')
-     logx : Use logarithmic x axis (Defaults to False)
-     logy : Use logarithmic x axis (Defaults to False)
-
-Returns nothing
-Included in slab.py     
-'''
-def plotnn(xlist,ylist,title="",xt="",yt="",labels=[],location='best',logx=False,logy=False):
-
-    # Check if SciPy is loaded
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    plt.figure(facecolor="white")   # White border
-    if labels == []:
-        for x,y in zip(xlist,ylist):
-            plotXY(x,y,logx=logx,logy=logy)
-    else:
-        for x,y,lbl in zip(xlist,ylist,labels):
-            plotXY(x,y,label=lbl,logx=logx,logy=logy)
-    pl.xlabel(xt)
-    pl.ylabel(yt)
-    pl.title(title)
-    pl.grid()
-    if not labels == []:
-        pl.legend(loc=location)
-    pl.show()  
-    pl.close()    
-  
-    
-######################### DC SWEEP PLOT ############################
-
-'''
-@dcSweepPlot@
-dcSweepPlot(ndac,v1,v2,vi,na,wt,returnData)
-Plots the results of a DC sweep
-
-Required parameters: 
- ndac : DAC to sweep
-   v1 : Initial value (in Volt)
-   v2 : End of range (in Volt)
-  
-Optional parameters:  
-  vi : Step (defaults to 0.1V)  
-  na : Number of ADCs to show (defaults to 4)
-  wt : Waiting time between steps (defaults to 0.1s)
-  returnData : Enable return of plot data (Defaults to False)
-  
-Returns plot data if enabled (see also setPlotReturnData)
-Included in slab.py 
-''' 
-def dcSweepPlot(ndac,v1,v2,vi=0.1,na=4,wt=0.1,returnData=False):
-
-    # Check if SciPy is loaded
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform a DC sweep
-    res = dcSweep(1,v1,v2,vi,wt)
-    
-    if na == 1:
-        # Plot result
-        message(1,"Drawing curve")
-        plot11(res[0],res[1],"V(V) Plot","DAC"+str(ndac)+" (V)","ADC1 (V)")
-        ret = [res[0],res[1]]
-    else:
-        ylist=[]
-        labels=[]
-        ret=[res[0]]
-        for i in range(0,na):
-            ylist.append(res[i+1])
-            ret.append(res[i+1])
-            labels.append("ADC"+str(i+1))
-        plot1n(res[0],ylist,"DC Sweep Plot","DAC"+str(ndac)+" (V)","ADC(V)",labels)
-    
-    if plotReturnData or returnData:
-        return ret
-   
-   
-######################### REALTIME PLOT ############################   
-
-'''
-@realtimePlot@
-realtimePlot(nadc,wt,returnData)
-Plots ADC data in real time
-
-Optional parameters:
-        nadc : Number of ADCs to read (Defaults to 1)
-          wt : Wait time between read (Defaults to 0.2s)
-           n : Number of points to show (Defaults to All)
-  returnData : Returns captured data if true (Defaults to False)
-  
-Returns a time+nadc list if returnData is true  
-Included in slab.py   
-'''
-def realtimePlot(nadc=1,wt=0.2,n=0,returnData=False):
-
-    nn=int(n)
-
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")  
-    if nadc < 1 or nadc > nadcs:
-        raise SlabEx("Invalid number of ADCs")
-    
-    # Initialize the data arrays    
-    vt = []
-    va = []
-    for i in range(0,nadc):
-        va.append([])
-        
-    message(1,"Entering realtime plot")
-    message(1,"Close the graph window to exit")
-
-    #plt.ion()    
-    
-    fig=plt.figure(facecolor="white")   # White border
-    ax=fig.add_subplot(1,1,1)
-    pl.xlabel("time (s)")
-    pl.ylabel("Value (V)")
-    pl.title("Realtime Plot")
-    pl.grid()
-    
-    labels=[]
-    for i in range(0,nadc):
-        labels.append("ADC"+str(i+1))
-        
-    toffs=-1.0
-    try:    
-        while True:
-            t = time.time()
-            if toffs < 0.0:
-                toffs=t
-            t=t-toffs    
-            vt.append(t)
-            
-            for i in range(0,nadc):
-                value = readVoltage(i+1)
-                va[i].append(value)
-                
-            ax.cla()    
-            ax.grid()
-            pl.xlabel("time (s)")
-            pl.ylabel("Value (V)")
-            pl.title("Realtime Plot") 
-            
-            for i in range(0,nadc):
-                if nn:
-                    ax.plot(vt[-nn:-1], va[i][-nn:-1], label=labels[i])
-                else:
-                    ax.plot(vt, va[i], label=labels[i])
-                
-            if nadc>1:
-                pl.legend(loc='lower right')   
-            
-            fig.canvas.draw()
-            plt.pause(wt)
-               
-    except:
-        print()
-        print("End of realtime measurements")
-        print()
-
-    plt.close()
-
-    plot1n(vt,va,"Measurement Plot","time (s)","Value (V)",labels)   
-
-    if plotReturnData or returnData:
-        ret = vt
-        ret.extend(va)
-        return ret 
-    
-
-   
-################ PUBLIC BASIC TRANSIENT FUNCTIONS ####################    
-
-'''
-@setSampleTime@
-setSampleTime(st)
-Set sample time for time measurements
-Resolution on sample time is limited so value set 
-can be different of the input value
-Check your hardware board limits
-
-Required parameter:
-  st : Sample time (float seconds)
-  
-Returns real sample time set
-Included in slab.py   
-'''
-def setSampleTime(st):
-    global sampleTime
-    
-    # Check
-    if st > 100.0:
-        raise SlabEx("Sample time too high")
-    if st < 0.000005:  
-        raise SlabEx("Sample time too low") 
-        
-    startCommand('R')
-    sampleTime = sendFloat(st)
-    sendCRC()
-    
-    checkACK()
-    checkCRC()
-    
-    return sampleTime
- 
-
-'''
-Check of storage space
-Gives exception if there is not enough space
-'''
-def checkBuffSpace(samples,na,nd=0):
-    # Assert
-    if not nd == 0:
-        raise SlabEx("Digital signals are not supported yet")
-        
-    # Calculate space    
-    space = buff_size - w_points - w_points2
-    required = samples * na 
-    if space < required:
-        raise SlabEx("Not enough buffer space. Only " + str(space) + " samples free")
- 
-'''
-@setTransientStorage@
-setTransientStorage(samples,na)
-Set storage for samples in transient time measurements
-Check your hardware board limits
-
-Required parameters:
-  samples : Number of samples to obtain
-  
-Optional parameters:  
-  na : Number of ADC analog signals to record
-       (Defaults to 1)
-       
-Returns nothing
-Included in slab.py 
-
-This command has an alias tranStore
-'''    
-def setTransientStorage(samples,na=1,nd=0):
-    if nd != 0:
-        raise SlabEx("Digital signals not implemented yet")
-    
-    # Check space
-    checkBuffSpace(samples,na,nd)
-    
-    startCommand('S')
-    sendByte(na)
-    sendByte(nd)
-    sendU16(samples)
-    sendCRC()
-    
-    checkACK()
-    checkCRC()
-   
-'''
-@tranStore@
-tranStore(samples,na)
-Alias for the command setTransientStorage
-Included in slab.py 
-'''   
-def tranStore(samples,na=1,nd=0):
-    setTransientStorage(samples,na,nd)
-   
-'''
-@transientAsync@
-transientAsync()
-Performs an asynchronous transient measurement
-
-Returns a list of vectors
-  Vector 0 is time
-  Vectors 1 onward are ADC readings
-  
-Included in slab.py  
-See also setSampleTime and setTransientStorage  
-'''   
-def transientAsync():
-
-    message(1,"Performing transient measurement..." )
-   
-    startCommand('Y')
-    sendCRC()
-    
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")
-    
-    message(1,"Mesurement ends. Receiving data")
-    
-    na = getByte()
-    nd = getByte()
-    if nd!=0:
-        raise SlabEx("Digital transient is not supported Yet")
-    samples = getU16()
-    result = []
-    vector = []
-    for s in range(0,samples):
-        vector.append(s*sampleTime)
-    if scipy:    
-        result.append(np.array(vector))
-    else:
-        result.append(vector)    
-    for i in range(0,na):
-        vector = []
-        for s in range(0,samples):
-            fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[i])
-            fvalue = fvalue * vref
-            vector.append(fvalue)
-        if scipy:    
-            result.append(np.array(vector))
-        else:
-            result.append(vector)
-
-    checkCRC()    
-        
-    message(1,"Data received")
-        
-    return result    
-        
-'''
-@transientTriggered@
-transientTriggered(level,mode,timeout)
-Performs a triggered transient measurement
-Mesuremenst will be centered at the trigger point
-
-Required parameters:
-  level : Trigger level (float voltage)
-  
-Optional parameters:  
-   mode : Trigger mode (tmodeRise or tmodeFall)
-          (Defaults to tmodeRise)
-   timeout : Timeout in integer seconds (Defaults to no timeout)       
-   
-Returns a list of vectors
-  Vector 0 is time
-  Vectors 1 onward are ADC readings   
-   
-Included in slab.py    
-See also setSampleTime and setTransientStorage     
-''' 
-def transientTriggered(level,mode=tmodeRise,timeout=0):
-    # Check timeout
-    timeout = int(timeout)
-    if timeout > 255:
-        raise SlabEx("Timeout limited to 255 seconds")
-    if timeout < 0:
-        raise SlabEx("Timeout cannot be negative")
-
-    # Convert level to uint16 considering calibration
-    ratio = voltage2ratio(level)
-    cal_ratio = dc_cal(ratio,ycal1,xcal) # Reverse calibration
-    counts = ratio2counts(cal_ratio)
-        
-    message(1,"Performing transient triggered measurement...")
-        
-    startCommand('G')
-    sendU16(counts)
-    sendByte(mode)
-    sendByte(timeout)
-    sendCRC()
-    
-    # Receive data
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")
-    if code == 2:
-        checkCRC();
-        raise SlabEx("Timeout error")
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")        
-
-    
-    message(1,"Mesurement ends. Receiving data")
-    
-    na = getByte()
-    nd = getByte()
-    if nd!=0:
-        raise SlabEx("Digital transient is not supported Yet")
-    samples = getU16()
-    result = []
-    vector = []
-    
-    # Determine the trigger sample
-    tsample = samples / 2 - 1
-    
-    for s in range(0,samples):
-        vector.append((s - tsample)*sampleTime)
-    if scipy:    
-        result.append(np.array(vector))
-    else:
-        result.append(vector)
-    for i in range(0,na):
-        vector = []
-        for s in range(0,samples):
-            fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[i])
-            fvalue = fvalue * vref
-            vector.append(fvalue)
-        if scipy:    
-            result.append(np.array(vector))
-        else:
-            result.append(vector)
-
-    checkCRC()    
-        
-    message(1,"Data received")
-        
-    return result          
-    
-'''
-@stepResponse@
-stepResponse(v1,v2,t)
-Obtains the Step Response for a circuit
-  1/5 of measurement time will be before the step
-  4/5 of measurement time will be after the step
-  
-Required parameters:
-       v1 : Start voltage
-       v2 : End voltage
-       
-Optional parameters:       
-    tinit : Time before start in seconds (defaults to 1 s)
-    
-Returns a list of vectors
-  Vector 0 is time
-  Vectors 1 onward are ADC readings   
-
-Included in slab.py   
-See also setSampleTime and setTransientStorage       
-'''   
-def stepResponse(v1,v2,tinit=1.0):
-    message(1,"Performing step response...")
-   
-    setVoltage(1,v1)
-    time.sleep(tinit)
-    v2cal = dc_cal(v2,dacx,dac1y)  
-    counts = voltage2counts(v2)
-    
-    readADC(1);  # Precharge ADC inputs
-    readADC(2);  # and discard the reading
-    readADC(3);
-    readADC(4);
-    
-    startCommand('P')
-    sendU16(counts)
-    sendCRC()
-    
-    # Receive data
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")           
-    
-    message(1,"Mesurement ends. Receiving data")
-    
-    na = getByte()
-    nd = getByte()
-    if nd!=0:
-        raise SlabEx("Digital transient is not supported Yet")
-    samples = getU16()
-    result = []
-    vector = []
-    
-    # Determine the trigger sample
-    tsample = samples / 5
-    
-    for s in range(0,samples):
-        vector.append((s - tsample)*sampleTime)
-    if scipy:    
-        result.append(np.array(vector))
-    else:
-        result.append(vector)
-    for i in range(0,na):
-        vector = []
-        for s in range(0,samples):
-            fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[i])
-            fvalue = fvalue * vref
-            vector.append(fvalue)
-        if scipy:    
-            result.append(np.array(vector))
-        else:
-            result.append(vector)
-        
-    checkCRC()
-
-    setVoltage(1,v1)
-    
-    message(1,"Data received")
-        
-    return result      
-        
-################## PUBLIC AC PLOT FUNCTIONS ####################        
-
-'''
-@tranAsyncPlot@
-tranAsyncPlot(returnData)
-Plots an asynchronous transient measurement
-
-Optional parameter:
-  returnData : Enable return of plot data (Defaults to False)
-
-Returns plot data if enabled
-  Vector 0 is time
-  Vectors 1 onward are ADC readings
-
-Included in slab.py   
-See also setSampleTime, setTransientStorage and setPlotReturnData
-'''
-def tranAsyncPlot(returnData=False):
-
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform measurement
-    res = transientAsync()
-    # Plot result
-    message(1,"Drawing curves")
-    plt.figure(facecolor="white")   # White border
-    for i in range(1,len(res)):
-        if (len(res) == 2):
-            # Only one plot
-            pl.plot(res[0],res[i])
-        else:    
-            # More than one plot
-            pl.plot(res[0],res[i],label=adcNames[i-1])
-    pl.xlabel("Time (s)")
-    pl.ylabel("Voltage (V)")
-    pl.title("Async Transient Plot")
-    if (len(res) > 2):
-        # More than one plot
-        pl.legend(loc='lower right')        
-    pl.grid()
-    pl.show()
-    pl.close()
-    
-    if plotReturnData or returnData:
-        return res    
-
-'''
-@tranTriggeredPlot@
-tranTriggeredPlot(level,mode,timeout,returnData)
-Plots a triggered transient measurement
-Mesuremenst will be centered at the trigger point
-
-Required parameters:
-  level : Trigger level (float voltage)
-  
-Optional parameters:  
-   mode : Trigger mode (tmodeRise or tmodeFall)
-          (Defaultst to tmodeRise)
-   timeout : Timeout in integer seconds (Defaults to no timeout)           
-   returnData : Enable return of plot data (Defaults to False)
-   
-Returns plot data if enabled
-  Vector 0 is time
-  Vectors 1 onward are ADC readings   
-
-Included in slab.py   
-See also setSampleTime, setTransientStorage and setPlotReturnData
-'''
-def tranTriggeredPlot(level,mode=tmodeRise,timeout=0,returnData=False):
-
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform measurement
-    res = transientTriggered(level,mode,timeout)
-    # Plot result
-    message(1,"Drawing curves")
-
-    plt.figure(facecolor="white")   # White border
-    for i in range(1,len(res)):
-        if (len(res) == 2):
-            # Only one plot
-            pl.plot(res[0],res[i])
-        else:    
-            # More than one plot
-            pl.plot(res[0],res[i],label=adcNames[i-1])
-    pl.xlabel("Time (s)")
-    pl.ylabel("Voltage (V)")
-    pl.title("Transient Triggered Plot")
-    if (len(res) > 2):
-        # More than one plot
-        pl.legend(loc='lower right')        
-    pl.grid()
-    pl.show()  
-    pl.close()
-    
-    if plotReturnData or returnData:
-        return res    
-
-'''
-@stepPlot@  
-stepPlot(v1,v2,tinit,returnData)  
-Plots the Step Response for a circuit
-  1/5 of measurement time will be before the step
-  4/5 of measurement time will be after the step
-  
-Required parameters:
-  v1 : Start voltage
-  v2 : End voltage
-       
-Optional parameters:       
-  tinit : Time before start in seconds (defaults to 1 s)
-  returnData : Enable return of plot data (Defaults to False)
-    
-Returns plot data if enabled (see setPlotReturnData) 
-  Vector 0 is time
-  Vectors 1 onward are ADC readings   
-
-Included in slab.py   
-See also setSampleTime, setTransientStorage and setPlotReturnData
-'''
-def stepPlot(v1,v2,tinit=1.0,returnData=False):
-
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform measurement
-    res = stepResponse(v1,v2,tinit)
-    # Plot result
-    message(1,"Drawing curves")
-    plt.figure(facecolor="white")   # White border
-    for i in range(1,len(res)):
-        if (len(res) == 2):
-            # Only one plot
-            pl.plot(res[0],res[i])
-        else:    
-            # More than one plot
-            pl.plot(res[0],res[i],label=adcNames[i-1])
-    pl.xlabel("Time (s)")
-    pl.ylabel("Voltage (V)")
-    pl.title("Step Response Plot")
-    if (len(res) > 2):
-        # More than one plot
-        pl.legend(loc='lower right')        
-    pl.grid()
-    pl.show() 
-    pl.close()
-    
-    if plotReturnData or returnData:
-        return res    
- 
-################## WAVETABLE COMMANDS #################
-
-'''
-@loadWavetable@
-loadWavetable(list,second=False)
-Load one wavetable on the hardware board
-Loading a primary wavetable erases the secondary if present
-
-Required parameters:
-  list : List of values of the wavetable
-         If empty [] the wavetable will be erased
-    
-Optional parameters:
-  second : Load secondary wavetable for DAC2
-           (Defaults to false)    
-
-Included in slab.py            
-Returns nothing
-'''
-def loadWavetable(list,second=False): 
-    global w_idle,w_idle2,w_points,w_points2
-
-    # Get list size
-    size = len(list)
-        
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")    
-    if size > buff_size :
-        raise SlabEx("Wavetable too big")
-        
-    # Additional check for secondary wavetable
-    if second:
-        if size > buff_size - w_points:
-            raise SlabEx("Not enough space for secondary wavetable")
-        
-    # Send data
-    if not second:
-        w_points = size      # Size of main wavetable
-        if size > 0:         # Iddle value (Volt) 
-            w_idle = list[0]    
-        else:
-            w_idle = -1        
-        w_idle2 = -1         # Eliminate secondary wavetable
-        w_points2 = 0
-        startCommand('W')    # Start
-    else:
-        w_points2 = size     # Size of secondary wavetable
-        if size > 0:
-            w_idle2 = list[0]    # Iddle value (Volt)
-        else:
-            w_idle2 = -1
-        startCommand('w')    # Start
-        
-    sendU16(size)
-    if size > 0:
-        for value in list:
-            ratio = value/vref
-            if not second:
-                rCal = dc_cal(ratio,dacx,dac1y) 
-            else:
-                rCal = dc_cal(ratio,dacx,dac2y)
-            counts = ratio2counts(rCal)
-            sendU16(counts)
-        
-    sendCRC()
-    
-    checkACK()
-    checkCRC()    
-        
-    if not second and size > 0:    
-        # Inform on frequency only on main wave
-        fmax = 1.0/(w_points * min_sample)
-        fmin = 1.0/(w_points * max_sample)
-        message(1,str(w_points) + " point wave loaded")
-        message(1,"Wave frequency must be between " + "{:.6f}".format(fmin) + " and " + "{:.2f}".format(fmax) + " Hz")
-        frequency = 1.0 /(sampleTime * w_points)
-        message(1,"Current frequency is " + str(frequency) + " Hz")
-        
-    # Inform on space
-    space = buff_size - w_points - w_points2
-    message(1,"Remaining buffer space is " + str(space) + " samples")
- 
-'''
-@waveSquare@
-waveSquare(v1,v2,np,returnList,second)
-Loads square wavetable omn the hardware board
-
-Required parameters:
-  v1 : Start value
-  v2 : End value
-  np : Number of points for a full wave
-    
-Optional parameters:    
- returnList : Request a return list (Default False)
-     second : Load on secondary table
-              (Defaults to false) 
-               
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-''' 
-def waveSquare(v1,v2,np,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-        
-    # Create wave
-    list = []
-    for point in range(0,np):
-        if point < np/2.0:
-            list.append(v1)
-        else:
-            list.append(v2)
-            
-    # Program wave 
-    loadWavetable(list,second)
-    
-    # Return list
-    if returnList:
-        return list
-
-'''
-@wavePulse@
-wavePulse(v1,v2,np,n1,returnList,second)
-Loads a pulse wavetable on the hardware board
-
-Parameters:
-  v1 : Start value
-  v2 : End value
-  np : Number of points for a full wave 
-  n1 : Number of points at v1
-           
-Optional parameters:    
- returnList : Request a return list (Default False)
-     second : Load on secondary table
-              (Defaults to false)   
-              
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-''' 
-def wavePulse(v1,v2,np,n1,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-        
-    # Create wave
-    list = []
-    for point in range(0,np):
-        if point < n1:
-            list.append(v1)
-        else:
-            list.append(v2)
-            
-    # Program wave 
-    loadWavetable(list,second)    
-    
-    # Return list
-    if returnList:
-        return list
-    
-'''
-@waveTriangle@
-waveTriangle(v1,v2,np,n1,returnList,second)
-Loads a triangle wavetable on the hardware board
-
-Parameters:
-   v1 : Minimum value
-   v2 : Maximum value
-   np : Number of points for a full wave 
-           
-Optional parameters:    
- returnList : Request a return list (Default False)
-     second : Load on secondary table
-              (Defaults to false)   
-              
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveTriangle(v1,v2,np,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-
-    # Create wave
-    list = []
-    for point in range(0,np):
-        point = (point + np//4) % np
-        if point < np/2.0:
-            value = v1 + 2.0*(v2-v1)*point/np
-        else:
-            value = v1 + 2.0*(v2-v1)*(np - point)/np
-        list.append(value)
-        
-    # Program wave 
-    loadWavetable(list,second)  
-
-    # Return list
-    if returnList:
-        return list
-    
-'''
-@waveSawtooth@
-waveSawtooth(v1,v2,np,returnList,second)
-Loads a sawtooth wavetable on the hardware board
-
-Parameters:
-    v1 : Start value
-    v2 : End value
-    np : Number of points for a full wave 
-           
-Optional parameters:    
- returnList : Request a return list (Default False)
-     second : Load on secondary table
-              (Defaults to false)     
-   
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveSawtooth(v1,v2,np,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-        
-    # Create wave
-    list = []
-    for point in range(0,np):
-        value = v1*1.0 + (v2*1.0-v1*1.0)*point/np
-        list.append(value)
-        
-    # Program wave 
-    loadWavetable(list,second) 
-
-    # Return list
-    if returnList:
-        return list   
-
-'''
-@waveSine@
-waveSine(v1,v2,np,phase,returnList,second)
-
-Generates a sine wavetable
-Parameters:
-  v1 : Minimum value
-  v2 : Maximum value
-  np : Number of points for a full wave 
-           
-Optional parameters:    
-      phase : Phase of the signal (deg) (Defaults to 0)
- returnList : Request a return list (Default False)
-     second : Load on secondary table
-              (Defaults to false)     
-   
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveSine(v1,v2,np,phase=0.0,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-
-    # Create wave
-    phase = phase*math.pi/180.0
-    list = []
-    mean = (v1 + v2)/2.0
-    amplitude = (v2 - v1)/2.0
-    for point in range(0,np):
-        value = mean + amplitude*math.sin(2.0*math.pi*point/np+phase)
-        list.append(value)
-        
-    # Program wave 
-    loadWavetable(list,second)  
-
-    # Return list
-    if returnList:
-        return list     
- 
-'''
-@waveCosine@
-waveCosine(v1,v2,np,returnList,second)
-
-Generates a cosine wavetable
-Parameters:
-  v1 : Minimum value
-  v2 : Maximum value
-  np : Number of points for a full wave 
-           
-Optional parameters:    
-       phase : Phase of the signal (deg) (Defaults to 0)
-  returnList : Request a return list (Default False)
-      second : Load on secondary table
-               (Defaults to false)     
-   
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveCosine(v1,v2,np,phase=0.0,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if np < 4:
-        raise SlabEx("Not enough points for wave")
-
-    # Create wave
-    phase = phase*math.pi/180.0
-    list = []
-    mean = (v1 + v2)/2.0
-    amplitude = (v2 - v1)/2.0
-    for point in range(0,np):
-        value = mean + amplitude*math.cos(2.0*math.pi*point/np+phase)
-        list.append(value)
-        
-    # Program wave 
-    loadWavetable(list,second)  
-
-    # Return list
-    if returnList:
-        return list  
-        
-'''
-@waveNoise@
-waveNoise(vm,vstd,n,returnList,second)
-
-Generates a noise wavetable
-Based on a normal distribution
-Samples are truncated between 0 and Vref
-
-Parameters:
-    vm : Mean value
-  vstd : Standard deviation
-     n : Number of points
-           
-Optional parameters:    
-   returnList : Request a return list (Default False)
-       second : Load on secondary table
-                (Defaults to false)     
-   
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveNoise(vm,vstd,n,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if n < 4:
-        raise SlabEx("Not enough points for wave")
-
-    # Create wave
-    list = np.random.normal(loc=vm,scale=vstd,size=n)
-    for i in range(0,n):
-        if list[i] > vref:
-            list[i] = vref
-        if list[i] < 0.0:
-            list[i] = 0
-        
-    # Program wave 
-    loadWavetable(list,second)  
-
-    # Return list
-    if returnList:
-        return list          
- 
-'''
-@waveRandom@
-waveRandom(v1,v2,n,returnList,second)
-
-Generates a random wavetable
-Based on a uniform distribution
-Samples will be random values between v1 and v2
-
-Parameters:
-   v1 : Minimum voltage
-   v2 : Maximum voltage
-    n : Number of points
-           
-Optional parameters:    
-   returnList : Request a return list (Default False)
-       second : Load on secondary table
-                (Defaults to false)     
-   
-If returnList is True, returns the table of loaded values
-Included in slab.py 
-'''
-def waveRandom(v1,v2,n,returnList=False,second=False):
-    # Check
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if n < 4:
-        raise SlabEx("Not enough points for wave")
-    if v1 >= v2 :
-        raise SlabEx("v1 must be lower than v2")
-
-    # Create wave
-    list = v1 + (v2-v1)*np.random.random(size=n)
-        
-    # Program wave 
-    loadWavetable(list,second)  
-
-    # Return list
-    if returnList:
-        return list   
- 
-'''
-@setWaveFrequency@
-setWaveFrequency(freq)
-Set wave frequency by changing sample frequency 
-
-Required parameters:
-   freq : Wave frequency in Hz
-   
-Return sampleTime set
-Included in slab.py 
-'''   
-def setWaveFrequency(freq):
-    # Checks
-    if freq <= 0.0:
-        raise SlabEx("Frequency cannot be negative or zero")
-    if w_idle == -1:
-        raise SlabEx("No wave loaded")
-    # Calculate sample time
-    st = 1.0/(w_points * freq)
-    if st < min_sample:
-        raise SlabEx("Frequency too high")
-    if st > max_sample:
-        raise SlabEx("Frequency too low")
-    # Change sample time
-    st = setSampleTime(st)
-    frequency = 1/(st * w_points)
-    message(1,"Sample time set to " +str(st) + " s")
-    message(1,"Wave frequency set to " +str(frequency) + " Hz")
-    return st
-    
-    
- 
-################## WAVE RESPONSE COMMANDS ################# 
- 
-'''
-@waveResponse@
-waveResponse(npre,tinit,dual)
-Obtain the response of a circuit against a wave
-
-Measurement sequence:
-  1) Set DAC1 to first wave sample during tinit
-  2) Send npre waves to DAC1
-  3) Start measurement as set on setTransientStorage
-     During this time wave continues to be generated
-
-Optional parameters:  
-  npre : Number of waves before measurement (default to zero)
- tinit : Time iddle before first wave (default to zero)
-  dual : Use dual DAC generation (defaults to False)
- 
-Returns a list of vectors:
-  Vector 0 is time
-  Vectors 1 onward are ADC readings          
-      
-Included in slab.py       
-See also setWaveFrequency and setTransientStorage
-''' 
-def waveResponse(npre = 0,tinit = 1.0,dual=False):
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")  
-    if npre < 0:
-        raise SlabEx("Invalid number of waves")
-    if w_idle < 0:
-        raise SlabEx("Wavetable not loaded")
-    if dual and w_idle2 < 0:
-        raise SlabEx("Secondary wavetable not loaded")
-
-    message(1,"Performing wave measurement...")
-        
-    # Idle start
-    if tinit > 0.0:
-        setVoltage(1,w_idle)
-        if dual:
-            setVoltage(2,w_idle2)
-        time.sleep(tinit)
-      
-    # Send command
-    if not dual:
-        startCommand('V')
-    else:
-        startCommand('v')
-    sendU16(npre)
-    sendCRC()
-    
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")          
-        
-    message(1,"Mesurement ends. Receiving data")    
-        
-    na = getByte()
-    nd = getByte()
-    if nd!=0:
-        raise SlabEx("Digital transient is not supported Yet")
-    samples = getU16()
-    result = []
-    vector = []
-    for s in range(0,samples):
-        vector.append(s*sampleTime)
-    if scipy:    
-        result.append(np.array(vector))
-    else:
-        result.append(vector)
-    for i in range(0,na):
-        vector = []
-        for s in range(0,samples):
-            fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[i])
-            fvalue = fvalue * vref
-            vector.append(fvalue)
-        if scipy:    
-            result.append(np.array(vector)) 
-        else:
-            result.append(vector)
-        
-    checkCRC()    
-
-    # Return to iddle
-    setVoltage(1,w_idle)  
-    
-    message(1,"Data received")
-        
-    return result    
- 
-'''
-@singleWaveResponse@
-waveResponse(channel,npre,tinit)
-Obtain the response of a circuit against a wave
-Response is obtained only on the selected channel
-regardless of the setting on setTransientStorage
-
-Measurement sequence:
-  1) Set DAC1 to first wave sample during tinit
-  2) Send npre waves to DAC1
-  3) Start measurement as set on setTransientStorage
-     During this time wave continues to be generated
-
-Optional parameters: 
- channel : ADC channel to read (default to 1)
-    npre : Number of waves before measurement (default to zero)
-   tinit : Time iddle before first wave (default to zero)
- 
-Returns a list of two:
-  Vector 0 is time
-  Vectors 1 is ADC readings          
-      
-Included in slab.py       
-See also setWaveFrequency and setTransientStorage
-''' 
-def singleWaveResponse(channel = 1,npre = 0,tinit = 1.0):
-
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")  
-    if npre < 0:
-        raise SlabEx("Invalid number of waves")
-    if channel < 1 or channel > 4:
-        raise SlabEx("Invalid channel number")
-    if w_idle < 0:
-        raise SlabEx("Wavetable not loaded")
-
-    message(1,"Performing wave measurement at ADC " + str(channel) + " ...")
-            
-    # Idle start
-    if tinit > 0.0:
-        setVoltage(1,w_idle)
-        time.sleep(tinit)
-      
-    # Send command
-    startCommand('X')
-    sendByte(channel)
-    sendU16(npre)
-    sendCRC()
-    
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")          
-        
-    message(1,"Mesurement ends. Receiving data")    
-        
-    na = getByte()
-    nd = getByte()
-    if nd!=0:
-        raise SlabEx("Digital transient is not supported Yet")
-    if na!=1:
-        raise SlabEx("Internal Error: Only one ADC should be read")    
-                
-    samples = getU16()
-    result = []
-    vector = []
-    for s in range(0,samples):
-        vector.append(s*sampleTime)
-    if scipy:    
-        result.append(np.array(vector))
-    else:
-        result.append(vector)
-    
-    vector = []
-    for s in range(0,samples):
-        fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[channel-1])
-        fvalue = fvalue * vref
-        vector.append(fvalue)
-    if scipy:    
-        result.append(np.array(vector)) 
-    else:
-        result.append(vector)
-        
-    checkCRC()    
-
-    # Return to iddle
-    setVoltage(1,w_idle)  
-    
-    message(1,"Data received")
-        
-    return result  
- 
-'''
-@wavePlay@
-wavePlay(n,tinit,dual)
-Generates wave withou measuring
-
-Generation sequence:
-  1) Set DAC1 to first wave sample during tinit
-  2) Send n waves to DAC1
-
-Optional parameters:  
-     n : Number of waves to send (default to one)
-           Zero means infinite (Use HALT to end)
- tinit : Time iddle before first wave (default to zero)
-  dual : Use dual DAC generation (defaults to False)
-
-Returns nothing  
-Included in slab.py 
-      
-See also setWaveFrequency
-''' 
-def wavePlay(n = 1,tinit = 1.0,dual=False):
-    # Checks
-    if not opened:
-        raise SlabEx("Not connected to board")  
-    if n < 0:
-        raise SlabEx("Invalid number of waves")
-    if w_idle < 0:
-        raise SlabEx("Wavetable not loaded")
-    if dual and w_idle2 < 0:
-        raise SlabEx("Secondary wavetable not loaded")
-
-    message(1,"Sending wave...")
-        
-    # Idle start
-    if tinit > 0.0:
-        setVoltage(1,w_idle)
-        if dual:
-            setVoltage(2,w_idle2)
-        time.sleep(tinit)
-      
-    # Send command
-    if not dual:
-        startCommand('Q')
-    else:
-        startCommand('q')
-    sendU16(n)
-    sendCRC()
-    
-    checkACK()
-    
-    # Check for overrun or other errors
-    code = getByte()
-    if code == 1:
-        checkCRC()
-        raise SlabEx("Sample overrun")     
-    if code == 3:
-        checkCRC()
-        raise SlabEx("Halt from board")
-    if code != 0: 
-        raise SlabEx("Unknown transient response code")          
-        
-    message(1,"Wave play ends")    
-            
-    checkCRC()    
-
-    # Return to iddle
-    setVoltage(1,w_idle)  
-  
- 
-'''
-@wavePlot@
-wavePlot(npre,tinit,dual,returnData)
-Plot the response of a circuit against a wave
-
-Measurement sequence:
-  1) Set DAC1 to first wave sample during tinit
-  2) Send npre waves to DAC1
-  3) Start measurement as set on setTransientStorage
-     During this time wave continues to be generated
-
-Optional parameters:  
- npre : Number of waves before measurement (default to zero)
- tinit : Time iddle before first wave (default to zero)
- dual : Generate waves on both dacs (defaults to False)
- returnData : Enables return of plot data (defaults to False)
- 
-Returns plot data if enabled
-  Vector 0 is time
-  Vectors 1 onward are ADC readings          
-      
-Included in slab.py       
-See also setWaveFrequency, setTransientStorage and setPlotReturnData
-'''     
-def wavePlot(n = 0,tinit = 1.0,dual=False,returnData=False):
-
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform measurement
-    res = waveResponse(n,tinit,dual)
-    
-    # Plot result
-    message(1,"Drawing curves")
-    plt.figure(facecolor="white")   # White border
-    for i in range(1,len(res)):
-        if (len(res) == 2):
-            # Only one plot
-            pl.plot(res[0],res[i])
-        else:    
-            # More than one plot
-            pl.plot(res[0],res[i],label=adcNames[i-1])
-    pl.xlabel("Time (s)")
-    pl.ylabel("Voltage (V)")
-    pl.title("Wave Response Plot")
-    if (len(res) > 2):
-        # More than one plot
-        pl.legend(loc='best')        
-    pl.grid()
-    pl.show() 
-    pl.close()
-    
-    if plotReturnData or returnData:
-        return res           
-        
-'''
-@singleWavePlot@
-singleWavePlot(channel,npre,tinit,returnData)
-Plot the response of a circuit against a wave
-Response is obtained only on the selected channel
-regardless of the setting on setTransientStorage
-
-Measurement sequence:
-  1) Set DAC1 to first wave sample during tinit
-  2) Send npre waves to DAC1
-  3) Start measurement as set on setTransientStorage
-     During this time wave continues to be generated
-
-Optional parameters:  
- channel : ADC channel to use (defaults to 1)
- npre : Number of waves before measurement (default to zero)
- tinit : Time iddle before first wave (default to zero)
- returnData : Enables return of plot data (defaults to False)
- 
-Returns plot data if enabled 
-  Vector 0 is time
-  Vectors 1 onward are ADC readings          
-      
-Included in slab.py       
-See also setWaveFrequency, setTransientStorage and setPlotReturnData
-'''     
-def singleWavePlot(channel=1,n=0,tinit = 1.0,returnData=False):
-
-    if not scipy:
-        cannotPlot(exception=True)
-        return
-
-    # Perform measurement
-    res = singleWaveResponse(channel,n,tinit)
-    
-    # Plot result
-    message(1,"Drawing curve")
-    plt.figure(facecolor="white")   # White border
-    pl.plot(res[0],res[1])
-    pl.xlabel("Time (s)")
-    pl.ylabel("Voltage (V)")
-    pl.title("Single Wave Response Plot")      
-    pl.grid()
-    pl.show() 
-    pl.close()
-    
-    if plotReturnData or returnData:
-        return res              
-     
-################## CALCULATIONS WITH VECTORS ###################
-
-'''
-@highPeak@
-highPeak(vector)
-Returns the maximum of a vector
-Included in slab.py 
-'''
-def highPeak(vector):
-    value = max(vector)
-    return value
-    
-'''
-@lowPeak@
-lowPeak(vector)
-Returns the minimum of a vector
-Included in slab.py 
-'''   
-def lowPeak(vector):
-    value = min(vector)    
-    return value
-
-'''
-@peak2peak@
-peak2peak(vector)
-Returns the maximum to minimum difference of a vector
-Included in slab.py 
-'''     
-def peak2peak(vector):
-    value = max(vector)-min(vector)
-    return value
-    
-'''
-@mean@
-mean(vector)
-Returns the mean value of a vector
-Included in slab.py 
-'''     
-if scipy:   
-    def mean(vector):
-        return np.mean(vector)    
-    
-'''
-@halfRange@
-halfRange(vector)
-Returns the average between maximum and minimum of a vector
-Included in slab.py 
-'''  
-def halfRange(vector):  
-    return (max(vector)+min(vector))/2.0
-    
-'''
-@rms@
-rms(vector)
-Returns the RMS value of a vector
-Included in slab.py 
-''' 
-if scipy:   
-    def rms(vector):
-        return np.sqrt(np.mean(vector*vector))
-    
-'''
-@std@
-std(vector)
-Returns the standard deviation of a vector
-Included in slab.py 
-''' 
-if scipy:   
-    def std(vector):
-        return np.std(vector)
-   
-  
-'''
-@softReset@
-softReset()
-Generates a soft reset on the hardware board
-Board state is set to reset condition
-Returns nothing
-Included in slab.py 
-'''   
-def softReset():
-    global sampleTime
-    global w_idle,w_points,w_idle2,w_points2
-
-    # Send Command
-    startCommand('E')
-    sendCRC()
-    checkACK()
-    checkCRC()
-    
-    # Syncronize state
-    sampleTime = 0.001  # Default sample time of 1ms
-    w_idle = -1         # No wave loaded
-    w_points = 0 
-    w_idle2 = -1        # No secondary table loaded
-    w_points2 = 0
-    dcroundings = 10    # Default of 10 readings on DC
-    
-    # Generate message
-    message(1,"Hardware board at reset state")
-   
-################## DC DIGITAL IO ##############################
-
-'''
-@dioMode@
-dioMode(line,mode)
-Configures a digital I/O line mode
-
-Possible modes are:
-      mInput : Normal input mode
-     mPullUp : Input with Pull Up
-   mPullDown : Input with Pull Down
-     mOutput : Output Push Pull
-  mOpenDrain : Output with Open Drain
-  
-Modes use the slab namespace
-
-Required parameter:
-  line : Line to configure
-  
-Optional parameter:
-  mode : Mode to configure (Defaults to mInput)
-
-Returns nothing  
-Included in slab.py 
-'''
-def dioMode(line,mode=mInput):
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if line < 1 or line > ndio:
-        raise SlabEx("Invalid digital I/O line")
-    startCommand('H')
-    sendByte(line)
-    sendByte(mode)
-    sendCRC()
-    checkACK()
-    checkCRC()
-    
-'''
-@dioWrite@
-dioWrite(line,value)
-Writes on a digital I/O line mode
-
-Required parameters:
-   line : Line to write
-  value : Value to write (True of False)
-
-Returns nothing 
-Included in slab.py  
-'''
-def dioWrite(line,value):
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if line < 1 or line > ndio:
-        raise SlabEx("Invalid digital I/O line")
-    startCommand('J')
-    sendByte(line)
-    if value:
-        sendByte(1)
-    else:
-        sendByte(0)
-    sendCRC()
-    checkACK()
-    checkCRC()    
-   
-'''
-@dioRead@
-dioRead(line)
-Reads a digital I/O line mode
-
-Required parameter:
-   line : Line to read
-
-Returns state (True of False)
-Included in slab.py   
-'''
-def dioRead(line):
-    if not opened:
-        raise SlabEx("Not connected to board")
-    if line < 1 or line > ndio:
-        raise SlabEx("Invalid digital I/O line")
-    startCommand('K')
-    sendByte(line)
-    sendCRC()
-    checkACK()
-    value = getByte()
-    checkCRC()    
-    if value:
-        return True
-    else:
-        return False
-    
-################## CODE EXECUTED AT IMPORT ####################
- 
-# Remove specific warnings if scipy was loaded 
-if scipy:
-    warnings.filterwarnings("ignore",".*GUI is implemented.*")
- 
-# Show version information upon load
-message(1,"SLab Module")
-message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
-    
-# Indicate if we are running in script or interactive mode    
-if hasattr(sys, 'ps1'):
-    interactive = True
-    message(1,"Running interactively")
-else:
-    message(1,"Running from script")
-    interactive = False
-   
-# Message if we are in Linxu
-if linux:
-    message(2,"")
-    message(2,"System is Linux")
-
-# Give message if SciPy modules could not be loaded   
-if not scipy:
-    message(1,"")
-    message(1,"Cannot load SciPy modules")
-    message(1,"Functionality will be reduced")
-    
-message(1,"")    
-    
-    
-    
+'''
+Base SLab Python module
+It contains all interaction to the Hardware Board through Base Commands
+
+History:
+
+Version 1.0 : First version
+
+17/2/2017 : It seems that DAC output is more acurate
+            than ADC input. 
+            ADC can be calibrated against DAC.
+            
+10/2/2018 : Addition to halt response code   
+
+Version 1.1 : Added Python 3 compatibility
+
+ 1/3/2018 : Added compatibility with python 3         
+'''
+
+from __future__ import print_function
+ 
+###################### INFO FOR THE HELP FILE ###################################
+
+'''
+@root@
+This is the main page of the SLab help
+List of command category topics:
+
+   manage : System management
+     file : File commands
+     base : Base DC voltage operations
+   plotdc : DC curves
+     plot : Generic plot commands
+     tran : Transient commands
+     wave : Wave commands
+     util : Utility commands
+      dio : Digital I/O
+     link : Board transports
+      cal : Board calibration
+      var : Internal variables
+      
+List of SLab submodule category topics:
+
+       dc : DC submodule
+       ac : AC submodule
+     meas : Measure submodule
+      fft : FFT submodule
+       ez : Easy submodule
+      arb : Arbitrary wave submodule
+      fit : Curve fit submodule
+	  
+You can also input the name of a particular command
+@manage@  
+List of management command topics:
+
+  connect
+  disconnect
+  softReset
+  printBoardInfo
+  wait
+  pause
+  setVerbose
+  setPlotReturnData
+  setPlotMode
+  setPipeDepth
+  setLinkTimeout
+  setRetries
+  setStats
+  stats
+  statsExport
+  helpSearch
+@file@
+  save
+  load  
+  setFilePrefix
+  setCalPrefix  
+@base@
+List of base DC voltage command topics:
+
+  setVoltage
+  readVoltage
+  rCurrent
+  dcPrint
+  dcLive
+  zero
+  dcSweep
+  dcSweepPlot
+  dcGrid
+  setSettle
+  settleTimes
+  writeDAC
+  readADC  
+  setDCreadings
+  dcBatch
+@plot@
+List of generic plotting command topics:
+
+  plot11
+  plot1n
+  plotnn
+@tran@
+List of transient command topics:
+
+  setSampleTime
+  setTransientStorage
+  tranStore (alias)
+  tranAsyncPlot
+  tranTriggeredPlot
+  stepPlot
+  transientAsync
+  transientTriggered
+  stepResponse
+  tranOversample
+  Decimator
+@wave@
+List of wave command topics:
+
+   waveSquare
+   waveTriangle
+   waveSawtooth
+   waveSine
+   waveCosine
+   wavePulse
+   waveNoise
+   waveRandom
+   loadWavetable
+   setWaveFrequency
+   wavePlan
+   wavePlot
+   waveResponse
+   singleWavePlot
+   singleWaveResponse
+   waveAverage
+   wavePlay
+@util@  
+List of utility command topics:
+
+   highPeak
+   lowPeak
+   peak2peak
+   halfRange
+   mean
+   std
+   rms
+@dio@
+List of digital I/O command topics:
+
+   dioMode
+   dioWrite
+   dioRead   
+   dioWritePort
+   dioReadPort
+@link@
+List of board transport topics:
+
+   connect
+   SerialTransport
+   TcpTransport
+   serveBoard
+   EmulatorTransport
+   ReplayTransport
+   startRecording
+   stopRecording
+   loadSession
+   setLinkTimeout
+   setRetries
+@cal@
+Full board calibration is a four stage procedure
+List of calibration command and alias topics:
+
+  Stage 1 : manualCalibrate   | cal1
+  Stage 2 : adcCalibrate      | cal2
+  Stage 3 : dacCalibrate      | cal3
+  Stage 4 : checkCalibration  | cal4
+
+Dense alternatives to stages 2 and 3:
+  adcCalibrateDense
+  dacCalibrateDense
+
+Calibrations are stored for each board and
+loaded on connect:
+  calibrationHistory
+  useCalibration
+
+Calibration drift self check:
+  setSelfCheck
+  selfCheck
+  selfCheckStats
+ 
+ setVdd
+ setVref
+@var@
+List of internal variables topics:
+
+  vdd
+  vref
+  sampleTime
+  linux  
+'''
+
+'''
+Help information about internal variables
+@vdd@
+vdd
+Voltage supply in Volt
+Do not modify this variable
+@vref@
+vref
+Voltage reference in Volt for DACs and ADCs
+Do not modify this variable
+@sampleTime@
+Current sample time in seconds
+Do not modify this variable
+@linux@
+True if system is detected as Linux
+Modify before connect if autodetect fails
+'''
+
+################################################################################# 
+ 
+import sys            # System module
+import time           # Time module for wait
+import serial         # Serial connection module
+import pickle         # Savedata for calibration
+import math           # Math module
+import numbers        # Numbers module
+import glob
+import warnings       # Warnings module
+import os             # Operating system module
+import json           # Prebuilt help index
+import bisect         # Calibration tables and statistics histograms
+import hashlib        # Board keys in the calibration store
+import difflib        # Help topic suggestions
+import socket         # Network transport
+import select         # Network transport polling
+import threading      # Board server
+import struct         # Session files
+import csv            # Statistics export
+
+################# PYTHON VERSION CHECK ###########################
+
+'''
+Check if we are running on Python 2.x or 3.x
+'''
+
+PY3 = False
+if sys.version_info >= (3,0):
+    PY3 = True
+    print("Python 3.0 or later detected")
+    
+'''
+Set input both in python2 and python3
+'''    
+try:
+   input = raw_input
+except NameError:
+   pass    
+
+##################### LINUX CHECK ################################
+
+'''
+We need to check if we are in Linux because the connection
+procedure has specific requirements in Linux
+
+If Linux detection does not work ok, we can force this
+variable using:
+
+slab.linux = True    # Linux system
+slab.linux = False   # Non Linux system
+'''
+
+if sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
+    linux = True
+else:
+    linux = False
+
+#################### SCIPY LOAD ##################################    
+    
+# Try to load the SciPy modules
+# The "TkAgg" backend is selected out of linux because in default
+# operation the console goes very slow after plotting
+try:		
+    import matplotlib
+    if not PY3: # Needed so it does not crash Python 3.x
+        if not linux:
+            matplotlib.use("TkAgg")    
+    import numpy as np                # Numpy for math calculations
+    import pylab as pl                # Pylab and Mathplotlib for plotting
+    import matplotlib.pyplot as plt
+
+except:
+    scipy = False
+else:
+    scipy = True
+	   
+# Version information
+version_major = 1
+version_minor = 1
+version_date  = "1/3/2018"
+
+# Default baud rate
+BAUD_RATE = 38400
+
+# Default TCP port to serve boards
+BRIDGE_PORT = 7032
+
+# Line that serveBoard sends to each client before the board data
+# It is followed by the serial of the board and a newline
+BRIDGE_HEADER = b"SLABSRV1 "
+
+# Header of session files
+SESSION_HEADER = b"SLABREC1"
+
+# Protocol statistics
+STATS_PHASES = ("tx","wait","rx","total")
+STATS_BINS = [1e-4*math.pow(10,i/4.0) for i in range(21)]  # 100us to 10s
+
+# Serial constants
+ACK = 181     # Command Ok
+NACK = 226    # Command Error
+ECRC = 37     # Error in CRC
+
+# Pipelining constants
+PIPE_DEPTH = 8      # Default outstanding commands
+PIPE_BYTES = 128    # Maximum outstanding bytes on the board Rx buffer
+
+# Link recovery constants
+TIMEOUT_BASE = 1.0    # Default response timeout (s)
+TIMEOUT_MARGIN = 2.0  # Margin over the transfer time of a response
+LINK_RETRIES = 2      # Default retries of read only commands
+RETRY_CODES = "AKbILM" # Read only commands that can be retried
+RESYNC_TRIES = 4      # Magic checks to resynchronize the link
+RESYNC_WAIT = 0.1     # Wait for pending bytes before each check (s)
+
+# External files
+HELP_FILE = "SLab_Help.dat"
+HELP_INDEX_FILE = "SLab_Help.json"
+
+LAST_COM_FILE = "Last_COM.dat"
+ADC_CAL_FILE = "Cal_ADC.dat"
+DAC_CAL_FILE = "Cal_DAC.dat"
+VDD_CAL_FILE = "Cal_Vdd.dat"
+CAL_STORE_FILE = "Cal_Boards.json"
+
+# Calibration store
+CAL_STORE_VERSION = 1 # Format version of the store file
+CAL_HISTORY = 10      # Calibration revisions kept for each board
+DRIFT_HISTORY = 1000  # Drift records kept for each board
+
+# Calibration self check
+CHECK_LEVELS = [0.1,0.3,0.5,0.7,0.9]  # Ratiometric levels checked
+CHECK_SETTLE = 0.01   # Settling time at each level (s)
+
+# External files prefixes
+fprefix = ""
+calprefix = ""
+
+# Exception code
+class SlabEx(Exception):
+    # Exception Methods ----------------------------------
+    def __init__(self, msg=""):
+        self.msg = msg
+        print("\n** SLab exception")
+        print('** ' + msg)
+        print("\n")    
+        if not interactive:
+            input("Hit RETURN to end the script")
+            
+    def __str__(self):
+        return repr(self.code)
+
+# Link error that can be recovered
+# It is converted to SlabEx if it cannot be retried
+class LinkError(Exception):
+    def __init__(self, msg=""):
+        Exception.__init__(self, msg)
+        self.msg = msg
+
+# Variable that indicates if plot functions shall return data
+plotReturnData = False        
+
+# Plot render policy (see setPlotMode)
+plotMode = 0          # Interactive (pmInteractive)
+plotPath = ""         # Path prefix for saved plots
+plotFormat = "png"    # Format for saved plots
+plotCount = 0         # Number of saved plots
+plotBackend = None    # Interactive backend when Agg is in use
+        
+# Verbose level 0 = None, 1 = Warn, 2 = Normal, 3 = Extensive
+verbose = 2           
+
+# Warn information
+nwarns = 0  # No warnings yet        
+        
+# Warn code
+def warn(message):
+    global nwarns
+    if verbose > 0:
+        print("\n** WARNING")
+        print("** " + message)
+        print()
+    nwarns = nwarns + 1
+                
+# Board specific data        
+ndacs = 2                         # Default number of available DACs
+
+adcNames = ["ADC1","ADC2","ADC3","ADC4"]  # Names of ADCs
+dacNames = ["DAC1","DAC2","DAC3"]         # Names of DACs
+        
+magic = [56,41,18,1]  # Magic identification code
+
+opened = 0            # Connection not opened yet
+
+vdd = 3.3             # By default vdd is 3.3V
+vref = 3.3            # By default vref is 3.3V
+
+dcroundings = 10      # Number of measurements to average in DC
+
+sampleTime = 0.001    # Current sample time
+
+# Default values to be loaded from board
+min_sample = 50e-6
+max_sample = 1.0
+
+# Empty ADC Calibration tables
+xcal  = []
+ycal1 = []
+ycal2 = []
+ycal3 = []
+ycal4 = []
+adcCalData = [ycal1,ycal2,ycal3,ycal4]
+
+# Empty DAC Calibration tables
+dacx  = []
+dac1y = []
+dac2y = []
+dac3y = []
+dac4y = []
+dacCalData = [dac1y,dac2y,dac3y,dac4y]
+
+# Calibration revision in use (zero if not stored)
+calRevision = 0
+
+# Board identifier given in connect (None to use the transport serial)
+board_id = None
+
+# Adaptive settling
+settleTol = 0.0       # Tolerance between readings (zero if disabled)
+settleInterval = 0.001 # First time between readings (s)
+settleLog = []        # Settle time of each point of the last sweep
+
+# Calibration self check
+checkPeriod = 0.0     # Time between checks (zero if disabled)
+checkDac = 0          # Loopback DAC (zero for the last one)
+checkAdc = 0          # Loopback ADC (zero for the last one)
+checkThreshold = 0.01 # Maximum drift (V)
+checkAction = "warn"  # Action when the drift is too big
+checkLast = 0.0       # Time of the last check
+checkDuration = len(CHECK_LEVELS)*CHECK_SETTLE  # Duration of the last check
+checkBusy = False     # True during a check
+checkData = {"checks":0,"exceeded":0,"last":0.0,"max":0.0,"sum":0.0}
+
+# Wavetable information
+
+w_idle = -1  # No wave loaded
+w_points = 0 # Number of wave points
+
+# Secondary wavetable information
+w_idle2 = -1  # No secondary table loaded
+w_points2 = 0 # Number of wave points
+
+# Command pipelining
+pipeSupport = False   # Board can buffer pipelined commands
+pipeDepth = 1         # Outstanding commands (1 is stop and wait)
+pipeQueue = []        # Queued commands
+
+# Port wide digital I/O
+portSupport = False   # Board has the port commands 'B' and 'b'
+
+# Protocol statistics (see setStats)
+statsEnabled = False  # Statistics are not recorded
+statsData = {}        # Statistics for each command code
+statsCur = None       # Command being recorded
+statsStart = 0.0      # Time when statistics were enabled
+statsLast = 0.0       # End of the last command
+statsHost = 0.0       # Time out of commands
+
+# Link recovery (see setLinkTimeout and setRetries)
+linkTimeout = TIMEOUT_BASE  # Base response timeout (None waits forever)
+linkRetries = LINK_RETRIES  # Retries of read only commands
+retryLevel = 0              # Link errors give LinkError if not zero
+
+# Transient storage, used to compute timeouts
+tranSamples = 0       # Samples in the board (0 if unknown)
+tranChannels = 1      # Analog channels in the board
+tranDigital = 0       # Digital lines in the board
+
+# Saturation limits
+#SAT_HIGH = 0.95
+#SAT_LOW  = 0.05
+
+##################### PUBLIC VARIABLES ###########################
+
+# Trigger Modes
+tmodeRise = 0
+tmodeFall = 1
+
+# Plot Modes
+pmInteractive = 0   # Show plot and wait till window is closed
+pmNonBlocking = 1   # Show plot and continue
+pmFile        = 2   # Save plot to file
+pmNone        = 3   # Don't render plots
+
+# DIO Modes
+mInput     = 10
+mPullUp    = 11
+mPullDown  = 12
+mOutput    = 20
+mOpenDrain = 21
+
+######################## OBJECTS #################################
+
+'''
+bunch (Not used yet)
+Generate a new namespace
+Included in slab.py 
+
+Example:
+  data = bunch(a=1,b=[2,3])
+  data.a
+  data.b.append(7)
+  data.c = "New element"
+  data
+      
+class bunch(dict):
+    def __init__(self,**kw):
+        dict.__init__(self,kw)
+        self.__dict__.update(kw)
+'''   
+        
+
+##################### PROTOCOL STATISTICS ########################
+
+'''
+Timing of each command is divided in three phases
+    tx : From the command start to the first response read
+         (write time and host processing before reading)
+  wait : From the first read to the first response byte
+         (board processing and link latency)
+    rx : From the first response byte to the final CRC
+         (transfer time and response decode)
+Time out of the commands is counted as host time
+'''
+
+'''
+Empty statistics for one command code
+'''
+def statsNew():
+    phases = {}
+    for phase in STATS_PHASES:
+        phases[phase] = {"sum":0.0,"min":None,"max":0.0,
+                         "hist":[0]*(len(STATS_BINS)+1)}
+    return {"count":0,"errors":0,"nack":0,"crc":0,"timeout":0,"retries":0,
+            "bytesOut":0,"bytesIn":0,"phases":phases}
+
+'''
+Close the current command record, if any, and start a new one
+Parameter:
+  code : Code of the command
+'''
+def statsBegin(code):
+    global statsCur,statsHost
+    now = time.time()
+    if statsCur is not None:
+        statsEnd()
+    statsHost = statsHost + now - statsLast
+    statsCur = {"code":code,"start":now,"request":None,"response":None,
+                "bytesOut":0,"bytesIn":0,"error":None}
+
+'''
+Count bytes sent in the current command
+'''
+def statsOut(n):
+    if statsCur is not None:
+        statsCur["bytesOut"] = statsCur["bytesOut"] + n
+
+'''
+Mark the start of a response read
+'''
+def statsRequest():
+    if statsCur is not None and statsCur["request"] is None:
+        statsCur["request"] = time.time()
+
+'''
+Count bytes received in the current command
+'''
+def statsIn(n):
+    if statsCur is not None:
+        if statsCur["response"] is None:
+            statsCur["response"] = time.time()
+        statsCur["bytesIn"] = statsCur["bytesIn"] + n
+
+'''
+Mark an error in the current command
+Parameter:
+  kind : "nack", "crc", "timeout" or "other"
+'''
+def statsError(kind):
+    if statsCur is not None:
+        statsCur["error"] = kind
+
+'''
+Count a retry of one command
+'''
+def statsRetry(code):
+    data = statsData.setdefault(code,statsNew())
+    data["retries"] = data["retries"] + 1
+
+'''
+Add one phase time to the statistics
+'''
+def statsPhase(data,phase,value):
+    pdata = data["phases"][phase]
+    pdata["sum"] = pdata["sum"] + value
+    if pdata["min"] is None or value < pdata["min"]:
+        pdata["min"] = value
+    if value > pdata["max"]:
+        pdata["max"] = value
+    pdata["hist"][bisect.bisect(STATS_BINS,value)] += 1
+
+'''
+Store the current command record in the statistics
+'''
+def statsEnd():
+    global statsCur,statsLast
+    if statsCur is None:
+        return
+    cur = statsCur
+    statsCur = None
+    now = time.time()
+    statsLast = now
+
+    data = statsData.setdefault(cur["code"],statsNew())
+    data["count"] = data["count"] + 1
+    data["bytesOut"] = data["bytesOut"] + cur["bytesOut"]
+    data["bytesIn"] = data["bytesIn"] + cur["bytesIn"]
+    if cur["error"] is not None:
+        data["errors"] = data["errors"] + 1
+        if cur["error"] in ("nack","crc","timeout"):
+            data[cur["error"]] = data[cur["error"]] + 1
+
+    # Missing marks take the next available time
+    response = cur["response"] if cur["response"] is not None else now
+    request = cur["request"] if cur["request"] is not None else response
+    statsPhase(data,"tx",request - cur["start"])
+    statsPhase(data,"wait",response - request)
+    statsPhase(data,"rx",now - response)
+    statsPhase(data,"total",now - cur["start"])
+
+######################### LINK RECOVERY ##########################
+
+'''
+Responses are read with a timeout so a lost byte does not
+block the host forever
+Link errors (timeouts and CRC errors) resynchronize the link
+Read only commands are retried up to linkRetries times
+'''
+
+'''
+Timeout for a command response
+Parameters:
+  nbytes : Bytes to transfer before the response ends
+           (Defaults to 0)
+    wait : Board processing time before the response (s)
+           (Defaults to 0)
+Returns the timeout in seconds or None if there is no timeout
+'''
+def commandTimeout(nbytes=0,wait=0.0):
+    if linkTimeout is None or wait is None:
+        return None
+    # Each byte uses 10 bits in the serial link
+    return linkTimeout + wait + TIMEOUT_MARGIN*nbytes*10.0/BAUD_RATE
+
+'''
+Set the timeout of the board transport
+Transports without timeout support are not changed
+Parameter:
+  value : Timeout in seconds or None to wait forever
+'''
+def applyTimeout(value):
+    # Setting the timeout can reconfigure the port
+    if hasattr(ser,"timeout") and ser.timeout != value:
+        ser.timeout = value
+
+'''
+Signal a link error
+Gives LinkError inside retryCommand and resync
+Otherwise it resynchronizes the link and gives SlabEx
+Parameters:
+  msg : Error message
+'''
+def linkError(msg):
+    if retryLevel > 0:
+        raise LinkError(msg)
+    resync()
+    raise SlabEx(msg)
+
+'''
+Resynchronize the link with the board
+Discards pending data and checks the magic code
+Returns True if the board responds
+'''
+def resync():
+    global retryLevel
+    retryLevel = retryLevel + 1
+    try:
+        for attempt in range(RESYNC_TRIES):
+            # Wait for the rest of the failed response
+            time.sleep(RESYNC_WAIT)
+            if checkMagic():
+                message(2,"Link resynchronized")
+                return True
+    finally:
+        retryLevel = retryLevel - 1
+    message(1,"Cannot resynchronize with the board")
+    return False
+
+'''
+Execute a command retrying it after link errors
+Only read only commands can be retried
+Parameters:
+      code : Code of the command
+  function : Function that executes the command
+      args : Arguments for the function
+Returns the function result
+'''
+def retryCommand(code,function,*args):
+    global retryLevel
+    attempt = 0
+    while True:
+        retryLevel = retryLevel + 1
+        try:
+            return function(*args)
+        except LinkError as ex:
+            error = ex.msg
+        finally:
+            retryLevel = retryLevel - 1
+        resynced = resync()
+        if attempt >= linkRetries or not resynced:
+            raise SlabEx(error + " (command '" + code + "' failed "
+                         + str(attempt+1) + " times)")
+        attempt = attempt + 1
+        message(2,"Link error in command '" + code + "'. Retrying")
+        if statsEnabled:
+            statsRetry(code)
+
+####################### PRIVATE SERIAL ###########################
+
+'''
+Compose a u16 value from two byes: low and high
+Parameters:
+  low  : Low byte
+  high : High byte
+Returns composed valuie
+'''    
+def composeU16(low,high):
+    value = low + high*256
+    return value     
+   
+'''
+Split a u16 value in two byes: low and high
+Parameters:
+  data : value to convert
+Returns low,high
+'''    
+def splitU16(data):
+    high = data//256
+    low = data % 256
+    return low,high   
+   
+'''
+Start of a Tx transmission
+'''   
+def startTx():
+    global crcTx
+    crcTx = 0
+    
+'''
+Send the crc
+Usually that ends the Tx transmission
+'''    
+def sendCRC():
+    global crcTx
+    if PY3:
+        ser.write([crcTx])
+    else:
+        ser.write(chr(crcTx))
+    if statsEnabled:
+        statsOut(1)
+    
+'''
+Send one byte and computes crc
+'''    
+def sendByte(byte):
+    if byte < 0 or byte > 255:
+        raise SlabEx("Byte value out of range")
+    global crcTx
+    if PY3:
+        ser.write([byte])
+    else:
+        ser.write(chr(byte))
+    crcTx = crcTx ^ byte
+    if statsEnabled:
+        statsOut(1)
+   
+'''
+Send one uint16 and computes crc
+'''   
+def sendU16(value):
+    if value < 0 or value > 65535:
+        raise SlabEx("Unsigned 16 bit integer out of range")
+    low,high = splitU16(value)
+    sendByte(low)
+    sendByte(high)  
+  
+'''
+Send one float and computes crc
+Floats are sent as an offset 128 exponent (1 byte)
+followed by an offset 20000 4 digit mantissa (2 byte U16)
+Returns the sent float value
+'''
+def sendFloat(value):
+    exp,mant = encodeFloat(value)
+    sendByte(exp+128)
+    sendU16(mant+20000)
+    # Recalculate value
+    return decodeFloat(exp,mant)
+
+'''
+Convert a float to the board mantissa/exponent format
+Parameters:
+  value : value to convert
+Returns exp,mant
+'''
+def encodeFloat(value):
+    exp  = int(math.floor(math.log10(value)))-3;
+    mant = int(value/math.pow(10,exp))
+    return exp,mant
+
+'''
+Convert mantissa/exponent to float
+Parameters:
+  exp  : exponent
+  mant : mantissa
+Returns the float value
+'''
+def decodeFloat(exp,mant):
+    return 1.0 * mant * math.pow(10,exp)
+
+'''
+Quantize a float as it will be sent to the board
+Parameters:
+  value : value to quantize
+Returns the value the board will receive
+'''
+def quantizeFloat(value):
+    exp,mant = encodeFloat(value)
+    return decodeFloat(exp,mant)
+    
+'''
+Start of a Rx reception
+'''   
+def startRx():
+    global crcRx
+    crcRx = 0
+    
+'''
+Get CRC anc check it
+It usually ends the Rx reception
+'''    
+def checkCRC():
+    global crcRx
+    crc = readByte()
+    if statsEnabled:
+        statsIn(1)
+        if crc != crcRx:
+            statsError("crc")
+        statsEnd()
+    if crc != crcRx:
+        linkError("CRC Error in Board to PC link")
+
+'''
+Read one byte from the board
+Gives a link error if the byte does not arrive in time
+'''
+def readByte():
+    data = ser.read()
+    if len(data) == 0:
+        if statsEnabled:
+            statsError("timeout")
+            statsEnd()
+        linkError("Timeout waiting for the board response")
+    return ord(data)
+   
+'''
+Get one byte and computes crc
+'''   
+def getByte():
+    global crcRx
+    if statsEnabled:
+        statsRequest()
+    byte = readByte()
+    crcRx = crcRx ^ byte    
+    if statsEnabled:
+        statsIn(1)
+    return byte
+    
+'''
+Get one uint16 and computes crc
+'''    
+def getU16():
+    low  = getByte()
+    high = getByte()
+    value = composeU16(low,high)
+    return value 
+ 
+'''
+Get a block of uint16 values and computes crc
+The block is read at once and decoded with NumPy
+Parameters:
+  n : Number of values
+Returns an array of values
+'''
+def getU16Block(n):
+    global crcRx
+    if not scipy:
+        return [getU16() for i in range(n)]
+    if statsEnabled:
+        statsRequest()
+    data = ser.read(2*n)
+    if len(data) < 2*n:
+        if statsEnabled:
+            statsError("timeout")
+            statsEnd()
+        linkError("Timeout waiting for the board response")
+    raw = np.frombuffer(data,dtype=np.uint8)
+    if n > 0:
+        crcRx = crcRx ^ int(np.bitwise_xor.reduce(raw))
+    if statsEnabled:
+        statsIn(2*n)
+    return raw.view('<u2').astype(int)
+ 
+'''
+Get one float value and computes crc
+''' 
+def getFloat():
+    # Get exponent and mantissa
+    exp = getByte() - 128
+    mant = getU16() - 20000
+    # Compute value
+    return decodeFloat(exp,mant)
+   
+'''
+Check ACK, NACK and ECRC
+'''   
+def checkACK():
+    # Get response
+    response = getByte();    
+   
+    if (response == NACK) or (response == ECRC):
+        if statsEnabled:
+            statsError("nack" if response == NACK else "crc")
+        # Check also CRC
+        checkCRC()
+        # Exceptions
+        if (response == NACK):
+            raise SlabEx("Remote Error : Bad command parameters")
+        
+        if response == ECRC:
+            linkError("CRC Error in PC to Board link")
+        
+    if response != ACK:
+        if statsEnabled:
+            statsError("other")
+        linkError("Unknown Board Response")   
+    
+'''
+Start command
+Parameters:
+   code : Code of command
+'''
+def startCommand(code):
+    if statsEnabled:
+        statsBegin(code)
+    applyTimeout(commandTimeout())
+    startTx()
+    startRx()
+    sendByte(ord(code))
+    
+'''
+Compose a full command frame
+Parameters:
+   code : Code of command
+   data : List of bytes after the code (Defaults to none)
+  block : List or array of u16 values after data (Defaults to none)
+Returns a bytearray with the frame ended by its crc
+'''
+def composeFrame(code,data=[],block=None):
+    frame = bytearray([ord(code)])
+    frame.extend(data)
+    if block is not None and len(block) > 0:
+        if scipy:
+            frame.extend(np.asarray(block).astype('<u2').tobytes())
+        else:
+            for value in block:
+                frame.extend(splitU16(value))
+    # XOR crc of all the frame
+    if scipy:
+        crc = int(np.bitwise_xor.reduce(np.frombuffer(bytes(frame),dtype=np.uint8)))
+    else:
+        crc = 0
+        for byte in frame:
+            crc = crc ^ byte
+    frame.append(crc)
+    return frame
+    
+'''
+Send a full command frame in only one write
+Used instead of startCommand, send* and sendCRC
+Parameters:
+   code : Code of command
+   data : List of bytes after the code (Defaults to none)
+  block : List or array of u16 values after data (Defaults to none)
+'''
+def sendFrame(code,data=[],block=None):
+    frame = composeFrame(code,data,block)
+    if statsEnabled:
+        statsBegin(code)
+        statsOut(len(frame))
+    applyTimeout(commandTimeout(len(frame)))
+    startRx()
+    ser.write(frame)
+
+'''
+Queue one command for a pipelined batch
+Parameters:
+    code : Code of command
+    data : List of bytes after the code (Defaults to none)
+  parser : Function that reads the response data after the ACK
+           (Defaults to none)
+'''
+def pipeCommand(code,data=[],parser=None):
+    pipeQueue.append((code,composeFrame(code,data),parser))
+
+'''
+Get one pipelined response
+Parameters:
+  parser : Function that reads the response data after the ACK
+Returns value,error,kind
+  value : Value returned by the parser
+  error : Error message or None if the response is ok
+   kind : "nack", "crc", "timeout" or "other" if there is an error
+'''
+def pipeResponse(parser):
+    global retryLevel
+    startRx()
+    value,error,kind = None,None,None
+    retryLevel = retryLevel + 1
+    try:
+        response = getByte()
+        if response == ACK:
+            if parser is not None:
+                value = parser()
+            crc = readByte()
+            if statsEnabled:
+                statsIn(1)
+            if crc != crcRx:
+                value,error,kind = None,"CRC Error in Board to PC link","crc"
+        elif response == NACK:
+            error,kind = "Remote Error : Bad command parameters","nack"
+        elif response == ECRC:
+            error,kind = "CRC Error in PC to Board link","crc"
+        else:
+            error,kind = "Unknown Board Response","other"
+    except LinkError as ex:
+        value,error,kind = None,ex.msg,"timeout"
+    finally:
+        retryLevel = retryLevel - 1
+    if statsEnabled:
+        if kind is not None:
+            statsError(kind)
+        statsEnd()
+    return value,error,kind
+
+'''
+Send queued commands and get their responses
+Commands already responded are not sent again
+Parameters:
+    queue : List of queued commands
+  results : List of results, new results are appended
+Returns None if all commands are ok or
+the position, error message and kind of the failing command
+'''
+def pipeRun(queue,results):
+    done = len(results)
+    sent = done  # Commands sent
+    pending = 0  # Bytes sent without response
+    times = {}   # Send time of each command
+    while len(results) < len(queue):
+        # Fill the window in only one write
+        chunk = bytearray()
+        first = sent
+        while sent < len(queue):
+            frame = queue[sent][1]
+            outstanding = sent - len(results)
+            if outstanding > 0:
+                if outstanding >= pipeDepth or pending + len(frame) > PIPE_BYTES:
+                    break
+            chunk.extend(frame)
+            pending = pending + len(frame)
+            sent = sent + 1
+        if len(chunk) > 0:
+            applyTimeout(commandTimeout(pending))
+            ser.write(chunk)
+            now = time.time()
+            for i in range(first,sent):
+                times[i] = now
+
+        # Get the oldest response
+        code,frame,parser = queue[len(results)]
+        if statsEnabled:
+            statsBegin(code)
+            statsCur["start"] = times[len(results)]
+            statsOut(len(frame))
+        value,error,kind = pipeResponse(parser)
+        if error is not None:
+            return len(results),error,kind
+        results.append(value)
+        pending = pending - len(frame)
+    return None
+
+'''
+Send all queued commands and get their responses
+Up to pipeDepth commands are sent before waiting for the
+first response and responses are matched to commands in order
+After a link error the link is resynchronized and, if all the
+pending commands are read only, they are sent again
+Errors give an exception that tells the failing command
+Returns a list with the parser results of each command
+'''
+def pipeFlush():
+    global pipeQueue
+
+    queue = pipeQueue
+    pipeQueue = []
+
+    results = []
+    attempt = 0
+    while True:
+        failure = pipeRun(queue,results)
+        if failure is None:
+            return results
+        position,error,kind = failure
+        code = queue[position][0]
+        # Discard responses of the commands already sent
+        resynced = resync()
+        retry = kind != "nack" and resynced and attempt < linkRetries
+        for pcode,frame,parser in queue[position:]:
+            if pcode not in RETRY_CODES:
+                retry = False
+        if not retry:
+            raise SlabEx("Pipelined command " + str(position+1) + " of "
+                         + str(len(queue)) + " ('" + code + "') : " + error)
+        attempt = attempt + 1
+        message(2,"Link error in pipelined command '" + code + "'. Retrying")
+        if statsEnabled:
+            statsRetry(code)
+
+'''
+Get the version of the firmware
+Parameters:
+  name : Firmware string
+Returns major,minor or 0,0 if the version is unknown
+'''
+def firmwareVersion(name):
+    pos = name.rfind(" v")
+    try:
+        major,minor = name[pos+2:].split(".")[:2]
+        return int(major),int(minor)
+    except ValueError:
+        return 0,0
+
+'''
+Check if the firmware buffers pipelined commands
+Firmware from v1.3 has a Rx buffer
+Parameters:
+  name : Firmware string
+Returns True if pipelining is supported
+'''
+def firmwarePipelining(name):
+    return firmwareVersion(name) >= (1,3)
+
+
+####################### BOARD TRANSPORTS ##########################
+
+'''
+All board communication goes through the ser object
+Any object with the following methods can be used as transport
+
+   write(data)  : Send a list, bytes or bytearray
+   read(size)   : Get size bytes, waits if needed
+   inWaiting()  : Number of bytes ready to be read
+   flushInput() : Discard the received bytes
+   isOpen()     : True if the transport is open
+   close()      : Close the transport
+
+Transports can also have a timeout attribute
+If it is not None, read waits at most timeout seconds
+and returns the bytes received until then
+'''
+
+'''
+Convert written data to bytes
+Accepts lists, bytearrays, bytes and Python 2 strings
+'''
+def toBytes(data):
+    return bytes(bytearray(data))
+
+'''
+@SerialTransport@
+SerialTransport(port)
+Serial port transport
+This is the transport used by default in connect
+
+Required parameter:
+  port : Serial port (COMx in Windows)
+
+Returns the transport object
+Included in slab.py
+'''
+class SerialTransport(serial.Serial):
+
+    def __init__(self,port):
+        serial.Serial.__init__(self,port=port,baudrate=BAUD_RATE,
+                               timeout=commandTimeout())
+        # Settings required for Linux in the Nucleo boards
+        if linux:
+            self.setDTR(False)
+            self.setRTS(True)
+
+    # Serial number of the USB device, if known
+    # VID:PID is not used as it is the same for all boards of a model
+    def boardSerial(self):
+        try:
+            from serial.tools import list_ports
+        except ImportError:
+            return ""
+        for info in list_ports.comports():
+            if getattr(info,"device",None) != self.port:
+                continue
+            if getattr(info,"serial_number",None):
+                return str(info.serial_number)
+        return ""
+
+'''
+@TcpTransport@
+TcpTransport(host,port)
+Transport to a board served on the network by serveBoard
+You can also connect using connect("tcp://host:port")
+
+The serial of the served board is sent by serveBoard
+so the calibration store finds the board as if it was
+connected to this computer
+
+Required parameter:
+  host : Name or IP of the computer that serves the board
+
+Optional parameter:
+  port : TCP port (Defaults to 7032)
+
+Returns the transport object
+Included in slab.py
+'''
+class TcpTransport(object):
+
+    def __init__(self,host,port=BRIDGE_PORT):
+        self.sock = socket.create_connection((host,port))
+        self.sock.setsockopt(socket.IPPROTO_TCP,socket.TCP_NODELAY,1)
+        self.buff = bytearray()
+        self.timeout = commandTimeout()
+        self.serial = self.readHeader()
+
+    # Get the serial from the serveBoard header line
+    # Returns "" if the server sends no header
+    def readHeader(self):
+        size = len(BRIDGE_HEADER)
+        while b"\n" not in self.buff and len(self.buff) < 256:
+            if not self.receive():
+                break
+        if bytes(self.buff[:size]) != BRIDGE_HEADER or b"\n" not in self.buff:
+            return ""
+        end = self.buff.index(b"\n")
+        serial_id = bytes(self.buff[size:end]).decode("utf-8","replace")
+        del self.buff[:end+1]
+        return serial_id
+
+    # Serial of the served board
+    def boardSerial(self):
+        return self.serial
+
+    # Move received data to the buffer
+    # Waits up to the timeout if wait is True
+    # Returns False if there is no data
+    def receive(self,wait=True):
+        delay = self.timeout if wait else 0
+        if not select.select([self.sock],[],[],delay)[0]:
+            return False
+        data = self.sock.recv(4096)
+        if not data:
+            raise SlabEx("Bridge connection closed")
+        self.buff.extend(data)
+        return True
+
+    def write(self,data):
+        self.sock.sendall(toBytes(data))
+
+    def read(self,size=1):
+        while len(self.buff) < size:
+            if not self.receive():
+                break
+        data = bytes(self.buff[:size])
+        del self.buff[:size]
+        return data
+
+    def inWaiting(self):
+        while self.receive(False):
+            pass
+        return len(self.buff)
+
+    def flushInput(self):
+        self.inWaiting()
+        self.buff = bytearray()
+
+    def isOpen(self):
+        return self.sock is not None
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+'''
+Open a bridge connection from a "tcp://host:port" string
+Returns a TcpTransport
+'''
+def openBridge(address):
+    host,sep,port = address[len("tcp://"):].partition(":")
+    if port == "":
+        return TcpTransport(host)
+    return TcpTransport(host,int(port))
+
+'''
+Copy all data received on the serial port to a socket
+Used by serveBoard in its own thread
+'''
+def bridgeSerialToSocket(conn,done):
+    while not done.is_set():
+        data = ser.read(max(1,ser.inWaiting()))
+        if data:
+            try:
+                conn.sendall(data)
+            except socket.error:
+                return
+
+'''
+@serveBoard@
+serveBoard(portIdent,tcpPort)
+Serves a board connected to this computer on the network
+so that other computers can use it with TcpTransport
+It runs until CTRL+C is hit and serves one client at a time
+Each client first gets the serial of the board so that
+it uses the calibration stored for this board
+
+Optional parameters:
+  portIdent : Serial port of the board (Defaults to Autodetect)
+    tcpPort : TCP port to listen (Defaults to 7032)
+
+Returns nothing
+Included in slab.py
+'''
+def serveBoard(portIdent=-1,tcpPort=BRIDGE_PORT):
+    global ser
+
+    if opened:
+        raise SlabEx("Disconnect before serving the board")
+
+    # Open the board
+    if portIdent == -1:
+        detectCom()
+    else:
+        try:
+            openSerial(portIdent)
+        except:
+            raise SlabEx("Cannot open connection. Check port")
+    # Short timeout so the copy thread can end
+    ser.timeout = 0.1
+    header = BRIDGE_HEADER + ser.boardSerial().encode("utf-8") + b"\n"
+
+    server = socket.socket(socket.AF_INET,socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET,socket.SO_REUSEADDR,1)
+    server.bind(("",tcpPort))
+    server.listen(1)
+    message(1,"Serving board on TCP port " + str(tcpPort))
+
+    try:
+        while True:
+            conn,address = server.accept()
+            conn.setsockopt(socket.IPPROTO_TCP,socket.TCP_NODELAY,1)
+            message(1,"Client connected from " + str(address[0]))
+            ser.flushInput()
+            conn.sendall(header)
+            done = threading.Event()
+            thread = threading.Thread(target=bridgeSerialToSocket,args=(conn,done))
+            thread.daemon = True
+            thread.start()
+            while True:
+                try:
+                    data = conn.recv(4096)
+                except socket.error:
+                    data = None
+                if not data:
+                    break
+                ser.write(data)
+            done.set()
+            thread.join()
+            conn.close()
+            message(1,"Client disconnected")
+    except KeyboardInterrupt:
+        message(1,"Board server ends")
+    finally:
+        server.close()
+        ser.close()
+
+'''
+@EmulatorTransport@
+EmulatorTransport(circuit,ndacs,nadcs,ndio)
+In memory emulation of a hardware board
+Lets you run scripts without a board
+
+DC, transient, wavetable and DIO commands are emulated
+Transient commands return the circuit response without delay
+Inputs do not change during a triggered read so the trigger
+never comes and the read ends with a timeout error
+Wave plays with no end (zero waves) end as halted
+
+Optional parameters:
+  circuit : Function that gets a list of DAC voltages and
+            returns a list of ADC voltages
+            (Defaults to each ADC reading one DAC in turn)
+    ndacs : Number of DACs (Defaults to 2)
+    nadcs : Number of ADCs (Defaults to 4)
+     ndio : Number of DIO lines (Defaults to 8)
+
+Returns the transport object
+Included in slab.py
+'''
+class EmulatorTransport(object):
+
+    # Emulated board data
+    NAME = "SLab Emulator v1.3"
+    BSIZE = 20000
+    MAX_ST = 1.0
+    MIN_ST = 10e-6
+    MAX_SF = 20000.0
+    VREF = 3.3
+
+    # Size of the commands that have a fixed size
+    SIZES = {'F':1,'M':2,'I':2,'L':2,'E':2,'A':3,'D':5,'N':4,'R':5,
+             'S':6,'Y':2,'G':6,'P':4,'V':4,'v':4,'Q':4,'q':4,'X':5,
+             'H':4,'J':4,'K':3,'B':6,'b':2}
+
+    def __init__(self,circuit=None,ndacs=2,nadcs=4,ndio=8):
+        self.circuit = circuit
+        self.ndacs = ndacs
+        self.nadcs = nadcs
+        self.ndio = ndio
+        self.rx = bytearray()
+        self.tx = bytearray()
+        self.opened = True
+        self.reset()
+        self.resetState = 1
+
+    # Board soft reset
+    def reset(self):
+        self.dacs = [0]*self.ndacs
+        self.dio = [0]*self.ndio
+        self.st = 0.001
+        self.na = 1
+        self.nd = 0
+        self.ns = 1000
+        self.wave = []
+        self.wave2 = []
+        self.trigger = None  # Last trigger (counts,mode)
+
+    # Voltages at the ADCs for the given DAC counts
+    def adcs(self,dacs):
+        volts = [self.VREF*value/65536.0 for value in dacs]
+        if self.circuit is None:
+            out = [volts[i % self.ndacs] for i in range(self.nadcs)]
+        else:
+            out = list(self.circuit(volts))
+        # 12 bit readings
+        counts = []
+        for value in out[:self.nadcs]:
+            value = int(value*65536.0/self.VREF)
+            counts.append(min(max(value,0),65535) & 0xFFF0)
+        return counts
+
+    # Response helpers
+    def send(self,*values):
+        self.tx.extend(values)
+
+    def sendU16(self,value):
+        self.send(value % 256,value//256)
+
+    def sendFloat(self,value):
+        exp,mant = encodeFloat(value)
+        self.send(exp+128)
+        self.sendU16(mant+20000)
+
+    def end(self,start):
+        crc = 0
+        for byte in self.tx[start:]:
+            crc = crc ^ byte
+        self.send(crc)
+
+    # Size of the next command, or 0 if it is not complete
+    def frameSize(self):
+        code = chr(self.rx[0])
+        if code in ('W','w'):
+            if len(self.rx) < 3:
+                return 0
+            size = 4 + 2*(self.rx[1] + 256*self.rx[2])
+        else:
+            size = self.SIZES.get(code,1)
+        if len(self.rx) < size:
+            return 0
+        return size
+
+    # Sample dump with the ADC readings for each DAC state
+    # Digital lines keep their state during the measurement
+    def dump(self,states,channels,nd=0):
+        self.send(0,len(channels),nd)
+        self.sendU16(len(states))
+        readings = [self.adcs(dacs) for dacs in states]
+        for channel in channels:
+            for values in readings:
+                self.sendU16(values[channel])
+        if nd:
+            word = sum([value << i for i,value in enumerate(self.dio[:nd])])
+            for values in readings:
+                self.sendU16(word)
+
+    # DAC states during a wave response
+    def waveStates(self,dual=False):
+        states = []
+        for i in range(self.ns):
+            dacs = list(self.dacs)
+            dacs[0] = self.wave[i % len(self.wave)]
+            if dual:
+                dacs[1] = self.wave2[i % len(self.wave2)]
+            states.append(dacs)
+        return states
+
+    # Process one command
+    def process(self,frame):
+        code = chr(frame[0])
+        start = len(self.tx)
+
+        if code == 'F':
+            self.tx.extend(bytearray((self.NAME + "\n\r").encode("ascii")))
+            return
+
+        # Unknown commands are taken as one byte frames
+        if code not in self.SIZES and code not in ('W','w'):
+            self.send(NACK)
+            self.end(start)
+            return
+
+        # Check CRC
+        crc = 0
+        for byte in frame[:-1]:
+            crc = crc ^ byte
+        if crc != frame[-1]:
+            self.send(ECRC)
+            self.end(start)
+            return
+
+        ok = True
+        if code == 'M':
+            self.send(ACK,*magic)
+        elif code == 'I':
+            self.send(ACK,self.ndacs,self.nadcs)
+            self.sendU16(self.BSIZE)
+            for value in (self.MAX_ST,self.MIN_ST,3.3,self.MAX_SF,self.VREF):
+                self.sendFloat(value)
+            self.send(12,12,self.ndio,self.resetState)
+        elif code == 'L':
+            names = ["DAC"+str(i+1) for i in range(self.ndacs)]
+            names += ["ADC"+str(i+1) for i in range(self.nadcs)]
+            names += ["DIO"+str(i+1) for i in range(self.ndio)]
+            self.send(ACK)
+            self.tx.extend(bytearray(("|".join(names) + "|$").encode("ascii")))
+        elif code == 'E':
+            self.reset()
+            self.resetState = 1
+            self.send(ACK)
+        elif code == 'A':
+            ok = 1 <= frame[1] <= self.nadcs
+            if ok:
+                self.send(ACK)
+                self.sendU16(self.adcs(self.dacs)[frame[1]-1])
+        elif code == 'D':
+            ok = 1 <= frame[1] <= self.ndacs
+            if ok:
+                self.dacs[frame[1]-1] = frame[2] + 256*frame[3]
+                self.send(ACK)
+        elif code == 'N':
+            self.send(ACK)
+        elif code == 'R':
+            st = decodeFloat(frame[1]-128,frame[2]+256*frame[3]-20000)
+            ok = self.MIN_ST <= st <= self.MAX_ST
+            if ok:
+                self.st = st
+                self.send(ACK)
+        elif code == 'S':
+            na,nd,ns = frame[1],frame[2],frame[3]+256*frame[4]
+            space = self.BSIZE - len(self.wave) - len(self.wave2)
+            size = na + 1 if nd else na
+            ok = (na >= 1 or nd >= 1) and na <= self.nadcs and nd <= self.ndio
+            ok = ok and size*ns <= space
+            if ok:
+                self.na,self.nd,self.ns = na,nd,ns
+                self.send(ACK)
+        elif code == 'Y':
+            self.send(ACK)
+            self.dump([self.dacs]*self.ns,range(self.na),self.nd)
+        elif code == 'G':
+            ok = frame[3] in (0,1) and self.na >= 1
+            if ok:
+                self.trigger = (frame[1] + 256*frame[2],frame[3])
+                self.send(ACK,2)
+        elif code == 'P':
+            # Step at one fifth of the samples
+            before = list(self.dacs)
+            self.dacs[0] = frame[1] + 256*frame[2]
+            states = [before]*(self.ns//5) + [list(self.dacs)]*(self.ns - self.ns//5)
+            self.send(ACK)
+            self.dump(states,range(self.na),self.nd)
+        elif code in ('W','w'):
+            size = frame[1] + 256*frame[2]
+            table = [frame[3+2*i] + 256*frame[4+2*i] for i in range(size)]
+            if code == 'W':
+                ok = size <= self.BSIZE
+                if ok:
+                    self.wave,self.wave2 = table,[]
+            else:
+                ok = size <= self.BSIZE - len(self.wave)
+                if ok:
+                    self.wave2 = table
+            if ok:
+                self.send(ACK)
+        elif code == 'V':
+            ok = len(self.wave) > 0
+            if ok:
+                self.send(ACK)
+                self.dump(self.waveStates(),range(self.na),self.nd)
+        elif code == 'v':
+            ok = len(self.wave) > 0 and len(self.wave2) > 0
+            if ok:
+                self.send(ACK)
+                self.dump(self.waveStates(True),range(self.na),self.nd)
+        elif code in ('Q','q'):
+            ok = len(self.wave) > 0 and (code == 'Q' or len(self.wave2) > 0)
+            if ok:
+                waves = frame[1] + 256*frame[2]
+                self.send(ACK,0 if waves else 3)
+        elif code == 'X':
+            ok = len(self.wave) > 0 and 1 <= frame[1] <= self.nadcs
+            if ok:
+                self.send(ACK)
+                self.dump(self.waveStates(),[frame[1]-1])
+        elif code == 'H':
+            ok = 1 <= frame[1] <= self.ndio
+            if ok:
+                self.send(ACK)
+        elif code == 'J':
+            ok = 1 <= frame[1] <= self.ndio
+            if ok:
+                self.dio[frame[1]-1] = 1 if frame[2] else 0
+                self.send(ACK)
+        elif code == 'K':
+            ok = 1 <= frame[1] <= self.ndio
+            if ok:
+                self.send(ACK,self.dio[frame[1]-1])
+        elif code == 'B':
+            mask = frame[1] + 256*frame[2]
+            values = frame[3] + 256*frame[4]
+            ok = (mask >> self.ndio) == 0
+            if ok:
+                for i in range(self.ndio):
+                    if mask & (1 << i):
+                        self.dio[i] = (values >> i) & 1
+                self.send(ACK)
+        elif code == 'b':
+            self.send(ACK)
+            self.sendU16(sum([value << i for i,value in enumerate(self.dio)]))
+
+        if not ok:
+            self.send(NACK)
+        elif code not in ('M','I','L','E','A','Y','G','V','v','X','K','b'):
+            self.resetState = 0
+        self.end(start)
+
+    def write(self,data):
+        self.rx.extend(bytearray(data))
+        while len(self.rx) > 0:
+            size = self.frameSize()
+            if size == 0:
+                break
+            frame = self.rx[:size]
+            del self.rx[:size]
+            self.process(frame)
+
+    # Missing responses behave as a timeout
+    def read(self,size=1):
+        data = bytes(self.tx[:size])
+        del self.tx[:size]
+        return data
+
+    def inWaiting(self):
+        return len(self.tx)
+
+    def flushInput(self):
+        self.tx = bytearray()
+
+    def isOpen(self):
+        return self.opened
+
+    def close(self):
+        self.opened = False
+
+    # All emulated boards share one calibration
+    def boardSerial(self):
+        return "Emulator"
+
+'''
+@ReplayTransport@
+ReplayTransport(records,check,realtime,serial)
+Transport that replays a recorded board session
+Host writes are matched against the recorded ones and
+recorded responses are served back to the host
+
+Required parameter:
+  records : Session file name or list of (direction,data) or
+            (direction,data,time) records in session order
+            Direction is 'w' for host writes and 'r' for
+            board responses
+
+Optional parameters:
+     check : Check that host writes are equal to the recorded ones
+             (Defaults to True)
+  realtime : Serve responses with the recorded timing
+             (Defaults to False)
+    serial : Serial of the recorded board used to find
+             its stored calibration (Defaults to "")
+
+See also startRecording
+Returns the transport object
+Included in slab.py
+'''
+class ReplayTransport(object):
+
+    def __init__(self,records,check=True,realtime=False,serial=""):
+        if isinstance(records,str):
+            records = loadSession(records)
+        self.records = [(rec[0],bytearray(rec[1])) for rec in records]
+        self.times = [rec[2] if len(rec) > 2 else 0.0 for rec in records]
+        self.check = check
+        self.realtime = realtime
+        self.serial = serial
+        self.start = None  # Replay start time
+        self.pos = 0       # Current record
+        self.offset = 0    # Position inside the current record
+        self.opened = True
+
+    # Skip consumed records
+    def advance(self):
+        while (self.pos < len(self.records)
+               and self.offset >= len(self.records[self.pos][1])):
+            self.pos = self.pos + 1
+            self.offset = 0
+
+    # Get up to size bytes of the current record if it has
+    # the given direction
+    def take(self,direction,size):
+        self.advance()
+        if self.pos >= len(self.records):
+            raise SlabEx("Replay reached the end of the session")
+        kind,data = self.records[self.pos]
+        if kind != direction:
+            raise SlabEx("Replay diverged from the recorded session")
+        if self.start is None:
+            self.start = time.time() - self.times[self.pos]
+        # Wait till the response was received in the session
+        if self.realtime and kind == 'r' and self.offset == 0:
+            delay = self.start + self.times[self.pos] - time.time()
+            if delay > 0.0:
+                time.sleep(delay)
+        chunk = data[self.offset:self.offset+size]
+        self.offset = self.offset + len(chunk)
+        return chunk
+
+    def write(self,data):
+        data = bytearray(data)
+        while len(data) > 0:
+            chunk = self.take('w',len(data))
+            if self.check and chunk != data[:len(chunk)]:
+                raise SlabEx("Replay diverged from the recorded session")
+            del data[:len(chunk)]
+
+    def read(self,size=1):
+        data = bytearray()
+        while len(data) < size:
+            data.extend(self.take('r',size-len(data)))
+        return bytes(data)
+
+    def inWaiting(self):
+        self.advance()
+        count = 0
+        pos,offset = self.pos,self.offset
+        while pos < len(self.records) and self.records[pos][0] == 'r':
+            count = count + len(self.records[pos][1]) - offset
+            pos,offset = pos + 1,0
+        return count
+
+    def flushInput(self):
+        self.advance()
+        while self.pos < len(self.records) and self.records[self.pos][0] == 'r':
+            self.pos = self.pos + 1
+            self.offset = 0
+
+    def isOpen(self):
+        return self.opened
+
+    def close(self):
+        self.opened = False
+
+    def boardSerial(self):
+        return self.serial
+
+'''
+Transport wrapper that records a session in a binary log
+Used by startRecording
+
+Log format:
+  8 byte header "SLABREC1"
+  Records of consecutive bytes in the same direction
+    byte : Direction ('w' host write or 'r' board response)
+    u32  : Microseconds since the previous record
+    u16  : Data size
+    Data bytes
+'''
+class RecorderTransport(object):
+
+    def __init__(self,transport,filename):
+        self.transport = transport
+        self.file = open(filename,'wb')
+        self.file.write(SESSION_HEADER)
+        self.direction = None       # Direction of the pending record
+        self.data = bytearray()     # Data of the pending record
+        self.last = time.time()     # Time of the last record
+
+    # Add data to the log
+    def log(self,direction,data):
+        if direction != self.direction:
+            self.flush()
+            self.direction = direction
+            now = time.time()
+            self.delta = int((now - self.last)*1e6)
+            self.last = now
+        self.data.extend(bytearray(data))
+
+    # Write the pending record
+    def flush(self):
+        data = self.data
+        while len(data) > 0:
+            chunk = data[:65535]
+            self.file.write(struct.pack('<BIH',ord(self.direction),
+                                        min(self.delta,0xFFFFFFFF),len(chunk)))
+            self.file.write(bytes(chunk))
+            data = data[65535:]
+            self.delta = 0
+        self.data = bytearray()
+
+    def write(self,data):
+        self.log('w',data)
+        self.transport.write(data)
+
+    def read(self,size=1):
+        data = self.transport.read(size)
+        self.log('r',data)
+        return data
+
+    def inWaiting(self):
+        return self.transport.inWaiting()
+
+    # The timeout is the one of the recorded transport
+    @property
+    def timeout(self):
+        return getattr(self.transport,"timeout",None)
+
+    @timeout.setter
+    def timeout(self,value):
+        if hasattr(self.transport,"timeout"):
+            self.transport.timeout = value
+
+    def flushInput(self):
+        # Discarded data is recorded so the replay can discard it too
+        nchar = self.transport.inWaiting()
+        if nchar > 0:
+            self.log('r',self.transport.read(nchar))
+        self.transport.flushInput()
+
+    def isOpen(self):
+        return self.transport.isOpen()
+
+    # Serial of the recorded board so the calibration store
+    # uses the same board key while recording
+    def boardSerial(self):
+        if hasattr(self.transport,"boardSerial"):
+            return self.transport.boardSerial()
+        return ""
+
+    # Ends the recording without closing the transport
+    def stop(self):
+        self.flush()
+        self.file.close()
+        return self.transport
+
+    def close(self):
+        self.stop()
+        self.transport.close()
+
+'''
+@startRecording@
+startRecording(filename)
+Records all the data exchanged with the board in a binary
+session file until stopRecording or disconnect is called
+The session can be replayed without a board with
+connect(transport=ReplayTransport(filename))
+
+Required parameter:
+  filename : Name of the session file
+
+Returns nothing
+Included in slab.py
+'''
+def startRecording(filename):
+    global ser
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if isinstance(ser,RecorderTransport):
+        raise SlabEx("Session is already being recorded")
+    ser = RecorderTransport(ser,fprefix + filename)
+    message(1,"Recording session to " + fprefix + filename)
+
+'''
+@stopRecording@
+stopRecording()
+Ends the recording started with startRecording
+
+Returns nothing
+Included in slab.py
+'''
+def stopRecording():
+    global ser
+    if not isinstance(ser,RecorderTransport):
+        raise SlabEx("Session is not being recorded")
+    ser = ser.stop()
+    message(1,"Session recording ends")
+
+'''
+@loadSession@
+loadSession(filename)
+Loads a session file recorded with startRecording
+
+Required parameter:
+  filename : Name of the session file
+
+Returns a list of (direction,data,time) records
+  direction : 'w' for host writes and 'r' for board responses
+       data : Bytes exchanged
+       time : Seconds since the start of the session
+Included in slab.py
+'''
+def loadSession(filename):
+    with open(fprefix + filename,'rb') as f:
+        content = f.read()
+    if content[:len(SESSION_HEADER)] != SESSION_HEADER:
+        raise SlabEx("Not a SLab session file")
+    records = []
+    now = 0.0
+    pos = len(SESSION_HEADER)
+    size = struct.calcsize('<BIH')
+    while pos + size <= len(content):
+        direction,delta,length = struct.unpack('<BIH',content[pos:pos+size])
+        pos = pos + size
+        now = now + delta/1e6
+        data = bytearray(content[pos:pos+length])
+        pos = pos + length
+        # Records split at 64k continue the previous one
+        if records and delta == 0 and records[-1][0] == chr(direction):
+            records[-1][1].extend(data)
+        else:
+            records.append((chr(direction),data,now))
+    return records
+
+'''
+Check Magic 
+Check magic code in an opened serial connection
+returns 1 if board is correct or 0 otherwise
+'''
+def checkMagic():
+    global ser
+    global retryLevel
+    
+    # First we flush
+    ser.flushInput()
+    
+    startCommand('M') # Magic request
+    sendCRC()         # End of command
+        
+    # Check that it responds if not Linux
+    if not linux:
+        time.sleep(0.1)
+      
+        if ser.inWaiting() < 5:
+            return 0
+    
+    # Link errors mean that there is no good board
+    retryLevel = retryLevel + 1
+    try:
+        read = getByte()
+        if read != ACK:
+            return 0
+    
+        # Check all magic bytes
+        for char in magic:
+            # Obtain the byte value of received character 
+            read = getByte()
+            # Exit if the magic does not match
+            if read != char:
+                return 0
+       
+        # Check CRC
+        checkCRC()
+    except LinkError:
+        return 0
+    finally:
+        retryLevel = retryLevel - 1
+       
+    # If we arrive here, magic is good
+    return 1    
+
+'''
+Open a serial connection with the given port
+Includes the Linux especific operations
+'''    
+def openSerial(com_port):
+    global ser
+    ser = SerialTransport(com_port)
+    
+'''
+Detect and open COM port
+Only returns if the board is detected
+'''
+def detectCom():
+    global ser
+    global com_port
+    
+    # Check if there is a saved last port
+    try:
+        with open(fprefix + LAST_COM_FILE,'rb') as f:
+            com_port = pickle.load(f) 
+    except:
+        pass
+    else:
+        try:
+            message(1,"Trying last valid port " + str(com_port))
+            openSerial(com_port)
+        except:
+            pass
+        else:    
+            if checkMagic():
+                message(1,"Board detected")
+                return   
+        message(1,"Last used port is not valid")
+        message(1,"Searching for port")
+    
+    # Get a list of ports to tests
+    if sys.platform.startswith('win'):
+        ports = ['COM%s' % (i + 1) for i in range(256)]
+    elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
+        # this excludes your current terminal "/dev/tty"
+        ports = glob.glob('/dev/tty[A-Za-z]*')
+    elif sys.platform.startswith('darwin'):
+        ports = glob.glob('/dev/tty.*')
+    else:
+        raise SlabEx('Platform not supported in autodetect')
+            
+    # Test each port    
+    for p in ports:
+        try:
+            message(2,"Testing port " +str(p))
+            # Port to try
+            openSerial(p)
+            
+            if checkMagic():
+                message(1,"Board detected at port " + str(p))
+                com_port = p
+                return
+            ser.close()
+        except (OSError, serial.SerialException):
+            pass
+    raise SlabEx('COM Autodetect Fail')    
+
+    
+#################### PRIVATE FUNCTIONS ###########################
+
+'''
+Convert a U16 value in float
+Truncates to the limits
+Parameter:
+  value : U16 value between 0 an 65535
+Returns float between 0.0 and 9.9998
+'''   
+def u16toFloat(value):
+    if value < 0:
+        value = 0
+    if value > 65535:
+        value = 65535
+    return value / 65536.0
+   
+'''
+Convert a float value to U16
+Truncates in the limits
+Parameter:
+  value : Float value between 0.0 and 9.9998
+Returns u16 between 
+'''   
+def floatToU16(fvalue):
+    value = int(fvalue*65536.0)
+    if value < 0:
+        value = 0
+    if value > 65535:
+        value = 65535
+    return value    
+
+'''
+Send a message to screen
+Parameters:
+    level : 1 Normal for verbose 2
+            2 Extensive for verbose 3
+'''
+def message(level,message):
+    # Check level errors    
+    if level < 1 or level > 2:
+        raise SlabEx("Internal Error : Bad message level")
+    # Print message depending on level    
+    if level < verbose:
+        print(message)
+        
+'''
+Calibrates one reading 0.0...1.0
+Returns real ratiometric from read ADC ratiometric 
+If data is outside of the calibration table, it returns 
+the data without any calibration.
+Parameters:
+  input  : Float value to calibrate in table2 domain
+  list1 : List of correct values
+  list2 : List of incorrect values
+Returns the calibrated value
+'''  
+def dc_cal(input,list1,list2):  
+    n = min(len(list1),len(list2))
+    if n < 2:
+        return input
+    # Locate upper limit with a binary search
+    # so dense tables are as fast as short ones
+    i = bisect.bisect_left(list2,input,0,n)
+    # Don't calibrate if we are out of the table
+    if i == 0 or i == n:
+        return input
+    # Calbrate the value
+    prevx = list1[i-1]
+    prevy = list2[i-1]
+    alpha = (input - prevy)/(list2[i] - prevy)
+    value = prevx + alpha*(list1[i] - prevx)
+    return value
+    
+'''
+Vector version of dc_cal
+Calibrates all values 0.0...1.0 of an array at once
+Values outside of the calibration table are not calibrated
+Parameters:
+  input : Array of values to calibrate in table2 domain
+  list1 : List of correct values
+  list2 : List of incorrect values
+Returns a NumPy array with the calibrated values
+'''
+def dc_calVector(input,list1,list2):
+    input = np.asarray(input,dtype=float)
+    n = min(len(list1),len(list2))
+    if n < 2:
+        return input
+    x = np.asarray(list1[:n],dtype=float)
+    y = np.asarray(list2[:n],dtype=float)
+    value = np.interp(input,y,x)
+    # Don't calibrate if we are out of the table
+    outside = (input <= y[0]) | (input > y[-1])
+    return np.where(outside,input,value)
+
+'''
+Set the DAC calibration registry
+All code that changes the DAC calibration uses this
+function so the table of each channel always matches
+the shared table of written values
+Parameters:
+   x : Ratiometric values written on the DACs
+  ys : List with the real ratiometric values of each DAC
+       Missing DACs are not calibrated
+'''
+def registerDACcal(x,ys):
+    global dacx,dac1y,dac2y,dac3y,dac4y,dacCalData
+    ys = list(ys) + [[]]*(4-len(ys))
+    dacx = x
+    dac1y,dac2y,dac3y,dac4y = ys[:4]
+    dacCalData = [dac1y,dac2y,dac3y,dac4y]
+
+'''
+Calibrated ratiometric value to write on a DAC
+Works with single values and arrays
+Parameters:
+  channel : DAC number
+    ratio : Wanted ratiometric value or array of them
+Returns the ratiometric value or array to write
+'''
+def dacCalRatio(channel,ratio):
+    if scipy and not isinstance(ratio,numbers.Number):
+        return dc_calVector(ratio,dacx,dacCalData[channel-1])
+    return dc_cal(ratio,dacx,dacCalData[channel-1])
+
+'''
+Counts to write on a DAC to get a voltage
+Performs calibration if available
+Works with single values and arrays
+Parameters:
+  channel : DAC number
+    value : Voltage or array of voltages
+Returns the counts or a NumPy array of counts
+'''
+def dacCounts(channel,value):
+    if scipy and not isinstance(value,numbers.Number):
+        ratio = np.asarray(value,dtype=float)/vref
+        return ratio2countsVector(dacCalRatio(channel,ratio))
+    return ratio2counts(dacCalRatio(channel,voltage2ratio(value)))
+
+'''
+Uncalibrated ADC ratiometric value for a real one
+It is the reverse of the ADC calibration
+Used to set levels the board compares with readings
+Parameters:
+  channel : ADC number
+    ratio : Real ratiometric value
+Returns the ratiometric value the ADC reads
+'''
+def adcRawRatio(channel,ratio):
+    return dc_cal(ratio,adcCalData[channel-1],xcal)
+      
+'''
+Get firmware string
+This command don't use CRC
+'''    
+def getFirmwareString():
+    startCommand('F')
+
+    # No CRC ends this command so its record is closed here
+    try:
+
+        cad = "" 
+
+        # Check that it responds if not Linux
+        if not linux:
+            time.sleep(0.2);
+            nchar = ser.inWaiting()
+            if nchar < 1 :
+                return "Unknown"
+   
+            for i in range(0,nchar):
+                car = ser.read().decode("utf-8")
+                if (not car == '\n') and (not car == '\r'):
+                    cad = cad + car
+            return cad        
+        else:
+            car = ser.read().decode("utf-8")
+            while not car == '\n':
+                if car == "":
+                    linkError("Timeout reading the firmware string")
+                cad = cad + car
+                car = ser.read().decode("utf-8")
+            ser.read() # Flush '\r'
+            return cad     
+    finally:
+        if statsEnabled:
+            statsEnd()
+
+'''
+Read one pin name
+'''
+def readPinName():
+    name = ""
+    while True:
+        car = chr(getByte())
+        if car == '$':
+            raise SlabEx("Unexpected end of pin list")
+        if car == '|':
+            return name        
+        name = name + str(car)    
+   
+'''
+Get the board capabilities
+'''
+def getBoardCaps():
+    global ndacs,nadcs,buff_size,max_sample,min_sample,vdd
+    global maxSFfresponse
+    global vref,dac_bits,adc_bits
+    global ndio
+
+    startCommand('I')  # Get board capabilities
+    sendCRC()          # End of command
+    
+    # Check response
+    time.sleep(0.1)
+    flush = 0
+    if not ser.inWaiting() == 25:   # Data size + 2 (ACK and CRC)
+        message(1,"Unexpected Board Data")
+        flush = 1
+    # Check ACK    
+    checkACK()    
+    # Get data
+    ndacs = getByte()
+    nadcs = getByte()
+    buff_size = getU16()
+    max_sample = getFloat()
+    min_sample = getFloat()  
+    vdd  =  getFloat()
+    maxSFfresponse = getFloat()
+    vref = getFloat()
+    dac_bits = getByte()
+    adc_bits = getByte()
+    ndio = getByte()
+    rState = getByte()
+   
+    if flush:
+        # Flush buffer
+        ser.flushInput()
+    else:
+        checkCRC()
+    
+    if rState:
+        message(1,"Board at reset state")
+    else:
+        message(1,"Board out of reset state")
+
+'''
+Get the pin lists of the board
+'''
+def getPinLists():
+    global dacPinList,adcPinList,dioPinList
+
+    dacPinList=[]
+    adcPinList=[]
+    dioPinList=[]
+    startCommand('L')
+    sendCRC()          # End of command
+    
+    checkACK()
+    for i in range(0,ndacs):
+        dacPinList.append(readPinName())
+    for i in range(0,nadcs):
+        adcPinList.append(readPinName()) 
+    for i in range(0,ndio):
+        dioPinList.append(readPinName())         
+            
+    # Get the final $
+    car = chr(getByte())
+    if car != '$':
+        raise SlabEx("[P] Bad termination in pin list")
+           
+    checkCRC()
+    # Flush buffer
+    ser.flushInput()
+   
+'''
+Identifies the connected board
+'''
+def getBoardData():
+    global board_name
+    global pipeSupport,pipeDepth
+    global portSupport
+
+    print("Getting board data")
+    
+    # Get firmware string
+    board_name = getFirmwareString()
+    message(1,"Connected to " + board_name)
+
+    # Enable pipelining if the board supports it
+    pipeSupport = firmwarePipelining(board_name)
+    if pipeSupport:
+        pipeDepth = PIPE_DEPTH
+    else:
+        pipeDepth = 1
+
+    # Port wide digital I/O was added in v1.3
+    portSupport = firmwareVersion(board_name) >= (1,3)
+
+    # Read only commands are retried after link errors
+    retryCommand('I',getBoardCaps)
+    retryCommand('L',getPinLists)
+   
+'''
+Ratiometric read of one analog ADC channel
+Does not perform any calibration
+Parameters:
+   n :Channel can be a number 1,2,3,4
+Returns the ratiometric reading between 0.0 and 1.0   
+'''    
+def readChannel(n):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if n > nadcs:
+        raise SlabEx("Invalid ADC number")        
+    acum = 0.0     
+    '''
+    # This code has been moved to the hardware board
+    for i in range(0,dcroundings):
+        startCommand('A')
+        sendByte(n);
+        sendCRC()          # End of command
+        
+        checkACK()
+        value = getU16()
+        checkCRC()
+        
+        fvalue = u16toFloat(value)
+        acum = acum + fvalue
+    fvalue = acum / dcroundings 
+    '''
+    value = retryCommand('A',readChannelCounts,n)
+    
+    fvalue = u16toFloat(value)
+    
+    return fvalue  
+
+'''
+Read the counts of one analog ADC channel
+Parameters:
+   n : Channel number
+Returns the u16 reading
+'''
+def readChannelCounts(n):
+    startCommand('A')
+    sendByte(n);
+    sendCRC()          # End of command
+        
+    checkACK()
+    value = getU16()
+    checkCRC() 
+    return value
+	
+'''
+Ratiometric write of one analog DAC channel
+Does not perform any calibration
+Parameters:
+      n : DAC to set 1,2 (or 3 if three DACs)
+  value : Value to set 0.0 to 1.0
+'''    
+def writeChannel(n,value):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if n > ndacs:    
+        raise SlabEx("Invalid DAC number")        
+    data = ratio2counts(value)
+    
+    startCommand('D')
+    sendByte(n)
+    sendU16(data) 
+    sendCRC()
+    
+    checkACK()
+    checkCRC()
+
+'''
+Convert ratiometric level to counts
+Generate exception if out of range
+Parameter:
+   ratio : Value between 0.0 and 1.0
+Returns uint 16   
+'''  
+def ratio2counts(ratio):
+    if ratio < -0.001:
+        raise SlabEx("Ratiometric value cannot be below 0.0")
+    if ratio > 1.001:
+        raise SlabEx("Ratiometric value cannot be above 1.0")
+
+    data = floatToU16(ratio)
+            
+    return data    
+
+'''
+Vector version of ratio2counts
+Generate exception if any value is out of range
+Parameter:
+   ratio : Array of values between 0.0 and 1.0
+Returns a NumPy array of uint 16
+'''
+def ratio2countsVector(ratio):
+    ratio = np.asarray(ratio,dtype=float)
+    if len(ratio) == 0:
+        return np.zeros(0,dtype=np.uint16)
+    if np.min(ratio) < -0.001:
+        raise SlabEx("Ratiometric value cannot be below 0.0")
+    if np.max(ratio) > 1.001:
+        raise SlabEx("Ratiometric value cannot be above 1.0")
+    # Truncate as floatToU16 does
+    data = np.clip(np.trunc(ratio*65536.0),0,65535)
+    return data.astype(np.uint16)
+
+'''
+Convert voltage value to ratiometric value
+'''    
+def voltage2ratio(value):
+    if value < -0.001:
+        raise SlabEx("Voltage value cannot be below 0 V")
+    if value > vref*1.001:
+        raise SlabEx("Voltage value cannot be above Vref")
+    return value/vref;
+    
+'''
+Convert voltage value to counts 
+'''  
+def voltage2counts(value):
+    return ratio2counts(voltage2ratio(value))
+       
+'''
+Message when SciPy is not loaded and we cannot plot
+'''       
+def cannotPlot(exception=False):
+    if not exception:
+        message(1,"")
+        message(1,"SciPy not loaded. Cannot plot")
+        message(1,"")
+    else:
+        raise SlabEx("SciPy not loaded. Cannot plot")
+       
+'''
+Generate an exception if scipy is not loaded
+'''  
+def checkSciPy():
+    if not scipy:
+        raise SlabEx("SciPy not loaded. Cannot execute")
+       
+#################### HELP CODE ###########################       
+
+# Help topic index cache
+helpIndex = None   # Dictionary of lowercase topic to [name,lines]
+helpStamp = None   # File names and mtimes the index was built from
+
+'''
+Parse the help file in a topic index
+Parameter:
+  filename : Help file to parse
+Returns a dictionary with the lowercase topics as keys
+Each entry is a list [topic name, list of lines]
+'''
+def _parseHelpFile(filename):
+    index = {}
+    entry = None
+    with open(filename, 'r') as hfile:
+        for line in hfile:
+            if line.startswith("#"):
+                continue
+            line = line.rstrip("\r\n")
+            if line.startswith("@#"):
+                break
+            if line.startswith("@"):
+                name = line.split("@")[1]
+                # First definition of a topic wins
+                if name.lower() in index:
+                    entry = None
+                else:
+                    entry = [name,[]]
+                    index[name.lower()] = entry
+            elif entry is not None:
+                entry[1].append(line)
+    return index
+
+'''
+Get the help topic index
+The index is built on first use and rebuilt only when
+the help files change. A prebuilt index generated by 
+generate_help.py is used if it is up to date.
+Returns the topic index dictionary
+'''
+def _getHelpIndex():
+    global helpIndex,helpStamp
+    
+    hname = fprefix + HELP_FILE
+    jname = fprefix + HELP_INDEX_FILE
+    
+    # Modification times (None if file does not exist)
+    try:
+        htime = os.path.getmtime(hname)
+    except OSError:
+        htime = None
+    try:
+        jtime = os.path.getmtime(jname)
+    except OSError:
+        jtime = None
+    
+    # Use cache if files have not changed
+    stamp = (hname,htime,jname,jtime)
+    if helpIndex is not None and stamp == helpStamp:
+        return helpIndex
+        
+    if htime is None and jtime is None:
+        raise SlabEx("Help file " + hname + " not found")
+    
+    # Prebuilt index is only used if not older than the help file    
+    if jtime is not None and (htime is None or jtime >= htime):
+        with open(jname, 'r') as jfile:
+            helpIndex = json.load(jfile)["topics"]
+    else:
+        helpIndex = _parseHelpFile(hname)
+    helpStamp = stamp    
+    return helpIndex
+
+'''
+@helpSearch@
+helpSearch(text)
+Search help topics that match a text
+Search is case insensitive
+
+Required parameter:
+   text : Text to search
+   
+Returns a list of topic names:
+   Topics that start with the text go first
+   Similar topics are added after them
+Included in slab.py   
+'''
+def helpSearch(text):
+    index = _getHelpIndex()
+    text = text.lower()
+    keys = sorted(index.keys())
+    # Prefix matches
+    found = [key for key in keys if key.startswith(text)]
+    # Fuzzy matches
+    for key in difflib.get_close_matches(text,keys,n=5,cutoff=0.6):
+        if key not in found:
+            found.append(key)
+    return [index[key][0] for key in found]
+
+'''
+@help@
+help(topic)
+Gives help information
+Topics are case insensitive
+Similar topics are suggested if the topic is not found
+
+Optional parameters:
+   topic : Text to give information about
+           (Defaults to "root")
+Returns nothing
+Included in slab.py           
+'''
+def help(topic="root"):
+    while (True):
+        print()
+        index = _getHelpIndex()
+        entry = index.get(topic.lower())
+        if entry is not None:
+            lines = entry[1]
+            maxlen = 0
+            for line in lines:
+                if len(line)+1 > maxlen:
+                    maxlen = len(line)+1
+            print((maxlen+1)*"-")
+            for line in lines:
+                print(" " + line)
+            print((maxlen+1)*"-")
+        else:
+            print("'" + topic + "' topic not found")
+            suggestions = helpSearch(topic)
+            if suggestions:
+                print("Related topics: " + ", ".join(suggestions))
+            print()        
+        print("root topic goes to main page")
+        print("Just hit return to exit help")
+        print()
+        topic = input("Help topic : ")
+        if topic == "":
+            print()
+            return
+       
+############# PUBLIC NO BOARD RELATED FUNCTIONS #################
+    
+'''
+@wait@
+wait(t)
+Wait the indicated time in seconds
+If the calibration self check is enabled and due
+it is performed during the wait
+
+Required parameter:
+    t : Time to wait in float seconds
+Returns nothing
+Included in slab.py 
+See also setSelfCheck
+'''    
+def wait(t):
+    end = time.time() + t
+    idleCheck(t)
+    remaining = end - time.time()
+    if remaining > 0.0:
+        time.sleep(remaining)
+    
+'''
+@pause@
+pause(message)
+Pause the script untill return is hit
+
+Optional parameter:
+  message : Message to show 
+            (Use default if not provided)
+Returns nothing 
+Included in slab.py            
+'''    
+def pause(message="Script Paused. Hit RETURN to continue"):
+    input(message)
+    
+    
+'''
+@setVerbose@
+setVerbose(level)
+Sets the verbose level
+
+Required parameter:
+   level : Verbose level 0, 1, 2 or 3
+           0 : No messages
+           1 : Only warnings
+           2 : Basic information
+           3 : Detailed information
+Returns previous verbose level 
+Included in slab.py   
+'''    
+def setVerbose(level):
+    global verbose
+    # Check
+    if level < 0 or level > 3:
+        raise SlabEx("Invalid verbose level")
+    # Set level
+    last_verbose = verbose
+    verbose = level    
+    return last_verbose
+    
+'''
+@setPipeDepth@
+setPipeDepth(depth)
+Sets the number of commands that can be sent to the board
+before waiting for the response of the first one
+Batched commands, like dcBatch, use this depth
+Only boards with firmware v1.3 or later support depths over 1
+
+Required parameter:
+   depth : Number of outstanding commands
+           1 means one command at a time
+Returns previous depth
+Included in slab.py
+'''
+def setPipeDepth(depth):
+    global pipeDepth
+    # Check
+    if depth < 1:
+        raise SlabEx("Pipe depth must be at least 1")
+    if depth > 1 and opened and not pipeSupport:
+        raise SlabEx("Board firmware does not support pipelining")
+    # Set depth
+    last_depth = pipeDepth
+    pipeDepth = int(depth)
+    return last_depth
+
+'''
+@setLinkTimeout@
+setLinkTimeout(value)
+Sets the base timeout for the board responses
+Each command adds to the base the time needed to transfer
+its data and, in transient measurements, the sampling time
+After a timeout the link is resynchronized and read only
+commands are retried (see setRetries)
+
+Optional parameter:
+  value : Base timeout in seconds (Defaults to 1.0)
+          None waits forever as in previous versions
+Returns previous timeout
+Included in slab.py
+'''
+def setLinkTimeout(value=TIMEOUT_BASE):
+    global linkTimeout
+    # Check
+    if value is not None and value <= 0:
+        raise SlabEx("Timeout must be positive")
+    # Set timeout
+    last_timeout = linkTimeout
+    linkTimeout = value
+    return last_timeout
+
+'''
+@setRetries@
+setRetries(number)
+Sets the number of retries of read only commands after a
+link error (timeout or CRC error)
+Those commands read ADCs, digital lines or board data
+Other commands are not retried as they can change the
+board state, but the link is resynchronized anyway
+
+Optional parameter:
+  number : Number of retries (Defaults to 2)
+           Zero disables the retries
+Returns previous number of retries
+Included in slab.py
+'''
+def setRetries(number=LINK_RETRIES):
+    global linkRetries
+    # Check
+    if number < 0:
+        raise SlabEx("Number of retries cannot be negative")
+    # Set retries
+    last_retries = linkRetries
+    linkRetries = int(number)
+    return last_retries
+
+'''
+@setStats@
+setStats(enable)
+Enables or disables the protocol statistics
+Enabling the statistics clears the previous ones
+
+For each command code it records the number of commands,
+errors, retries, bytes sent and received and histograms of
+the time used in each command phase:
+     tx : Command write until the response is requested
+   wait : Board processing until the first response byte
+     rx : Response transfer and decode
+  total : Complete command
+Time out of commands is counted as host time
+
+Optional parameter:
+  enable : True to record statistics (Defaults to True)
+Returns previous state
+Included in slab.py
+'''
+def setStats(enable=True):
+    global statsEnabled,statsData,statsCur,statsStart,statsLast,statsHost
+    last_state = statsEnabled
+    if enable:
+        statsData = {}
+        statsCur = None
+        statsStart = time.time()
+        statsLast = statsStart
+        statsHost = 0.0
+    statsEnabled = enable
+    return last_state
+
+'''
+@stats@
+stats()
+Gets the protocol statistics recorded since setStats
+
+Returns a dictionary with:
+   elapsed : Time since the statistics were enabled
+      host : Time out of commands
+      bins : Upper limits of the histogram bins (s)
+             The last histogram bin counts longer times
+  commands : Dictionary with the data of each command code
+             count, errors, nack, crc, timeout, retries,
+             bytesOut, bytesIn
+             and phases with sum, mean, min, max and hist
+             for each command phase
+Included in slab.py
+'''
+def stats():
+    commands = {}
+    for code in statsData:
+        data = dict(statsData[code])
+        phases = {}
+        for phase in STATS_PHASES:
+            pdata = dict(data["phases"][phase])
+            pdata["hist"] = list(pdata["hist"])
+            if data["count"] > 0:
+                pdata["mean"] = pdata["sum"]/data["count"]
+            else:
+                pdata["mean"] = 0.0
+            phases[phase] = pdata
+        data["phases"] = phases
+        commands[code] = data
+    if statsEnabled:
+        elapsed = time.time() - statsStart
+    else:
+        elapsed = statsLast - statsStart
+    return {"elapsed":elapsed,"host":statsHost,
+            "bins":list(STATS_BINS),"commands":commands}
+
+'''
+@statsExport@
+statsExport(filename)
+Saves the protocol statistics to a file
+The format depends on the file extension
+  .json : Full data as returned by stats
+  .csv  : One row for each command code
+
+Required parameter:
+  filename : Name of the file
+Returns nothing
+Included in slab.py
+'''
+def statsExport(filename):
+    data = stats()
+    name = fprefix + filename
+    if filename.lower().endswith(".json"):
+        with open(name,'w') as f:
+            json.dump(data,f,indent=1,sort_keys=True)
+    elif filename.lower().endswith(".csv"):
+        header = ["code","count","errors","nack","crc","timeout","retries",
+                  "bytesOut","bytesIn"]
+        for phase in STATS_PHASES:
+            header.extend([phase+"_mean",phase+"_min",phase+"_max"])
+        header.extend(["total_hist_"+"{:.3g}".format(limit) for limit in data["bins"]])
+        header.append("total_hist_over")
+        with open(name,'w') as f:
+            writer = csv.writer(f,lineterminator="\n")
+            writer.writerow(header)
+            for code in sorted(data["commands"]):
+                cdata = data["commands"][code]
+                row = [code]
+                row.extend([cdata[key] for key in header[1:9]])
+                for phase in STATS_PHASES:
+                    pdata = cdata["phases"][phase]
+                    row.extend([pdata["mean"],pdata["min"],pdata["max"]])
+                row.extend(cdata["phases"]["total"]["hist"])
+                writer.writerow(row)
+    else:
+        raise SlabEx("Statistics files must be .json or .csv")
+    message(1,"Statistics saved to " + name)
+
+'''
+@setFilePrefix@
+setFilePrefix(prefix)
+Set file prefix for all external files
+
+Optional parameter:
+  prefix : Prefix to use (Defaults to none)
+Returns nothing  
+Included in slab.py 
+
+See also setCalPrefix
+''' 
+def setFilePrefix(prefix=""):
+    global fprefix
+    fprefix = prefix
+    
+'''
+@setCalPrefix@
+setCalPrefix(prefix)
+Set file prefix for calibration files
+It adds after file prefix if present
+
+Optional parameter:
+  prefix : Prefix to use (Defaults to none)
+Returns nothing  
+Included in slab.py 
+
+See also setFilePrefix
+''' 
+def setCalPrefix(prefix=""):
+    global calprefix
+    calprefix = prefix    
+    
+    
+'''
+@save@
+save(filename,data)
+Saves a variable on a file
+Adds .sav extension to filename
+
+Parameters:
+  filename : Name of the file (with no extension)
+  data : Variable to store
+  
+Returns nothing  
+Included in slab.py 
+'''    
+def save(filename,data):
+    with open(filename+".sav",'wb') as f:
+        pickle.dump(data,f)
+    message(1,"Data saved")
+
+'''
+@load@
+load(filename)
+Loads a variable from a file
+Adds .sav extension to filename
+
+Parameters:
+  filename : Name of the file (with no extension)
+  
+Returns variable contained in the file
+Included in slab.py 
+'''    
+def load(filename):
+    with open(filename+".sav",'rb') as f:
+        data = pickle.load(f)
+    message(1,"Data loaded")    
+    return data
+    
+################ CALIBRATION STORE ####################
+
+'''
+Identity of the connected board
+Uses the firmware string, the pin lists and the board id
+given in connect or else the serial number of the USB
+device if the transport provides it
+Returns a dictionary
+'''
+def boardIdentity():
+    serial_id = ""
+    if board_id is not None:
+        serial_id = str(board_id)
+    elif hasattr(ser,"boardSerial"):
+        serial_id = ser.boardSerial()
+    return {"firmware" : board_name,
+            "pins"     : [dacPinList,adcPinList,dioPinList],
+            "serial"   : serial_id}
+
+'''
+Key of a board in the calibration store
+Parameter:
+  identity : Dictionary returned by boardIdentity
+Returns a string
+'''
+def boardKey(identity):
+    text = json.dumps(identity,sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+'''
+Read the calibration store file
+Returns the store as a dictionary
+'''
+def readCalStore():
+    try:
+        with open(fprefix + calprefix + CAL_STORE_FILE,'r') as f:
+            store = json.load(f)
+    except (IOError,OSError,ValueError):
+        return {"version":CAL_STORE_VERSION,"boards":{}}
+    if store.get("version",0) > CAL_STORE_VERSION:
+        raise SlabEx("Calibration store is from a newer SLab version")
+    return store
+
+'''
+Write the calibration store file
+The file is replaced only after it is completely written
+Parameter:
+  store : Dictionary to write
+'''
+def writeCalStore(store):
+    filename = fprefix + calprefix + CAL_STORE_FILE
+    with open(filename + ".tmp",'w') as f:
+        json.dump(store,f,indent=1)
+    try:
+        os.replace(filename + ".tmp",filename)
+    except AttributeError:
+        # Python 2 cannot replace files in Windows
+        if os.path.exists(filename):
+            os.remove(filename)
+        os.rename(filename + ".tmp",filename)
+
+'''
+Entry of the connected board in a calibration store
+Creates the entry if it does not exist
+Parameter:
+  store : Store dictionary
+Returns the board entry
+'''
+def calStoreBoard(store):
+    identity = boardIdentity()
+    boards = store["boards"]
+    key = boardKey(identity)
+    if key not in boards:
+        boards[key] = {"identity":identity,"revisions":[],"drift":[]}
+    return boards[key]
+
+'''
+Add a record to the drift history of a board
+Only the last DRIFT_HISTORY records are kept
+Parameters:
+   board : Board entry of the store
+  record : Dictionary to add
+'''
+def addDrift(board,record):
+    drift = board["drift"]
+    drift.append(record)
+    del drift[:-DRIFT_HISTORY]
+
+'''
+Current calibration as a dictionary of lists
+'''
+def calSnapshot():
+    def floats(table):
+        return [float(value) for value in table]
+    return {"adc"  : {"x":floats(xcal),
+                      "y":[floats(y) for y in [ycal1,ycal2,ycal3,ycal4]]},
+            "dac"  : {"x":floats(dacx),
+                      "y":[floats(y) for y in [dac1y,dac2y,dac3y,dac4y]]},
+            "vdd"  : vdd,
+            "vref" : vref}
+
+'''
+Largest change between two calibration tables
+Tables are compared at the points of the new one
+Returns the change or None if they cannot be compared
+'''
+def calTableChange(old,new):
+    change = None
+    for y0,y1 in zip(old["y"],new["y"]):
+        if len(y0) < 2 or len(y1) < 2:
+            continue
+        # Correct values at the readings of the new table
+        # that are inside the old one
+        y1 = np.asarray(y1)
+        x1 = np.asarray(new["x"])[:len(y1)]
+        inside = (y1 >= y0[0]) & (y1 <= y0[-1])
+        if not np.any(inside):
+            continue
+        x0 = np.interp(y1[inside],y0,old["x"][:len(y0)])
+        value = float(np.max(np.abs(x0 - x1[inside])))
+        if change is None or value > change:
+            change = value
+    return change
+
+'''
+Set all calibration tables to empty
+'''
+def calReset():
+    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
+    xcal,ycal1,ycal2,ycal3,ycal4 = [],[],[],[],[]
+    adcCalData = [ycal1,ycal2,ycal3,ycal4]
+    registerDACcal([],[])
+
+'''
+Set the calibration from a store revision
+Parameter:
+  entry : Revision dictionary
+'''
+def calApply(entry):
+    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
+    global vdd,vref
+    xcal = entry["adc"]["x"]
+    ycal1,ycal2,ycal3,ycal4 = entry["adc"]["y"]
+    adcCalData = [ycal1,ycal2,ycal3,ycal4]
+    registerDACcal(entry["dac"]["x"],entry["dac"]["y"])
+    vdd = entry["vdd"]
+    vref = entry["vref"]
+
+'''
+Store the current calibration as a new revision
+of the connected board
+The change from the previous revision is added
+to the drift history of the board
+Parameter:
+  reason : Calibration that has changed
+'''
+def calStoreSave(reason):
+    global calRevision
+    if not opened:
+        return
+    store = readCalStore()
+    board = calStoreBoard(store)
+    revisions = board["revisions"]
+    entry = calSnapshot()
+    entry["revision"] = revisions[-1]["revision"] + 1 if revisions else 1
+    entry["time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    entry["reason"] = reason
+    if revisions:
+        last = revisions[-1]
+        addDrift(board,{"time":entry["time"],
+                        "revision":entry["revision"],
+                        "source":"calibration",
+                        "adc":calTableChange(last["adc"],entry["adc"]),
+                        "dac":calTableChange(last["dac"],entry["dac"])})
+    revisions.append(entry)
+    del revisions[:-CAL_HISTORY]
+    writeCalStore(store)
+    calRevision = entry["revision"]
+    message(1,"Calibration revision " + str(calRevision) + " stored for this board")
+
+'''
+Load the last calibration revision of the connected board
+Returns True if the board has a stored calibration
+'''
+def calStoreLoad():
+    global calRevision
+    identity = boardIdentity()
+    if identity["serial"] == "":
+        warn("Board has no serial number. Boards of the same model "
+             + "share the stored calibration. Use boardId in connect")
+    board = readCalStore()["boards"].get(boardKey(identity))
+    if board is None or not board["revisions"]:
+        return False
+    entry = board["revisions"][-1]
+    calApply(entry)
+    calRevision = entry["revision"]
+    message(1,"Calibration revision " + str(calRevision) + " from "
+               + entry["time"] + " loaded for this board")
+    return True
+
+'''
+Load the calibration files
+They are not associated to any board
+'''
+def loadCalibrationFiles():
+    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
+    global vdd,vref
+    global calRevision
+    
+    calRevision = 0
+    loaded = False
+
+    # Try to load ADC calibration data
+    try:
+        with open(fprefix + calprefix + ADC_CAL_FILE,'rb') as f:
+            xcal,ycal1,ycal2,ycal3,ycal4 = pickle.load(f) 
+    except:
+        message(1,"No ADC calibration data found")
+    else:
+        message(1,"ADC Calibration data loaded")
+        # All output adc calibration tables    
+        adcCalData = [ycal1,ycal2,ycal3,ycal4]
+        loaded = True
+        
+    # Try to load DAC calibration data
+    try:
+        with open(fprefix + calprefix + DAC_CAL_FILE,'rb') as f:
+            data = pickle.load(f) 
+    except:
+        message(1,"No DAC calibration data found")
+    else:
+        message(1,"DAC Calibration data loaded")
+        # All output dac calibration tables    
+        registerDACcal(data[0],data[1:])
+        loaded = True
+        
+    # Try to load Vdd and Vref calibration data
+    try:
+        with open(fprefix + calprefix + VDD_CAL_FILE,'rb') as f:
+            vdd,vref = pickle.load(f)
+    except:
+        pass
+    else:
+        message(1,"Vdd loaded from calibration as " + str(vdd) + " V")
+        message(1,"Vref loaded as " + str(vref) + " V")
+        loaded = True
+        
+    if loaded:
+        warn("Calibration files are not associated to this board")
+
+'''
+@calibrationHistory@
+calibrationHistory()
+Calibration revisions stored for the connected board
+Boards are identified by their firmware string, their
+pin lists and the serial number of their USB device
+or the boardId given in connect
+The last revision is loaded on connect
+
+Returns a list of (revision,time,reason) tuples
+  reason is the calibration that changed:
+    "adc", "dac", "vdd" or "vref"
+Included in slab.py
+See also useCalibration
+'''
+def calibrationHistory():
+    if not opened:
+        raise SlabEx("Not connected to board")
+    board = readCalStore()["boards"].get(boardKey(boardIdentity()))
+    if board is None:
+        return []
+    return [(entry["revision"],entry["time"],entry["reason"])
+            for entry in board["revisions"]]
+
+'''
+@useCalibration@
+useCalibration(revision)
+Use a stored calibration revision of the connected board
+The stored revisions are not modified
+
+Required parameter:
+  revision : Revision number as given by calibrationHistory
+
+Returns nothing
+Included in slab.py
+See also calibrationHistory
+'''
+def useCalibration(revision):
+    global calRevision
+    if not opened:
+        raise SlabEx("Not connected to board")
+    board = readCalStore()["boards"].get(boardKey(boardIdentity()))
+    entries = [] if board is None else board["revisions"]
+    for entry in entries:
+        if entry["revision"] == revision:
+            calApply(entry)
+            calRevision = revision
+            message(1,"Using calibration revision " + str(revision))
+            return
+    raise SlabEx("Calibration revision not found")
+
+################ CALIBRATION SELF CHECK ####################
+
+'''
+@setSelfCheck@
+setSelfCheck(period,dac,adc,threshold,action)
+Configures the calibration drift self check
+The check sets the loopback DAC to several known levels
+and compares the loopback ADC readings with them
+It runs in the wait calls when period has elapsed
+since the last check and the wait is long enough
+Connect the loopback DAC to the loopback ADC and do not
+use them in the circuit under test
+
+Optional parameters:
+     period : Time between checks in seconds
+              Zero disables the check (Defaults to 600)
+        dac : Loopback DAC (Defaults to the last DAC)
+        adc : Loopback ADC (Defaults to the last ADC)
+  threshold : Maximum drift in Volt (Defaults to 0.01)
+     action : Action when the drift is above threshold
+                "warn"  : Show a warning
+                "error" : Raise an exception
+                Or a function that gets the check result
+                and can, for instance, recalibrate
+              (Defaults to "warn")
+
+Returns nothing
+Included in slab.py
+See also selfCheck and selfCheckStats
+'''
+def setSelfCheck(period=600.0,dac=0,adc=0,threshold=0.01,action="warn"):
+    global checkPeriod,checkDac,checkAdc,checkThreshold,checkAction
+    global checkLast,checkDuration,checkData
+    if period < 0.0:
+        raise SlabEx("Invalid self check period")
+    if threshold <= 0.0:
+        raise SlabEx("Invalid drift threshold")
+    if not callable(action) and action not in ("warn","error"):
+        raise SlabEx("Invalid self check action")
+    checkPeriod = period
+    checkDac = dac
+    checkAdc = adc
+    checkThreshold = threshold
+    checkAction = action
+    # First check at the first idle gap it fits in
+    # Its duration is estimated from the settling waits
+    checkLast = 0.0
+    checkDuration = len(CHECK_LEVELS)*CHECK_SETTLE
+    checkData = {"checks":0,"exceeded":0,"last":0.0,"max":0.0,"sum":0.0}
+
+'''
+@selfCheck@
+selfCheck()
+Performs a calibration drift self check now
+See setSelfCheck for the loopback channels, threshold
+and action
+The result is added to the drift history of the board
+in the calibration store
+
+Returns a dictionary with:
+    time : Time of the check
+   drift : Largest error at the checked levels (V)
+  offset : Mean error at the checked levels (V)
+     dac : Loopback DAC
+     adc : Loopback ADC
+Included in slab.py
+See also setSelfCheck and selfCheckStats
+'''
+def selfCheck():
+    global checkLast,checkDuration
+    if not opened:
+        raise SlabEx("Not connected to board")
+    dac = checkDac if checkDac else ndacs
+    adc = checkAdc if checkAdc else nadcs
+    if dac < 1 or dac > ndacs:
+        raise SlabEx("Invalid loopback DAC")
+    if adc < 1 or adc > nadcs:
+        raise SlabEx("Invalid loopback ADC")
+
+    start = time.time()
+    errors = []
+    # Check readings are not points of the sweep in progress
+    saved = list(settleLog)
+    try:
+        for level in CHECK_LEVELS:
+            value = level*vref
+            reading = dcBatch([(dac,value)],[adc],CHECK_SETTLE)[0]
+            errors.append(reading - value)
+    finally:
+        settleLog[:] = saved
+    drift = max([abs(error) for error in errors])
+    record = {"time":time.strftime("%Y-%m-%d %H:%M:%S"),
+              "drift":drift,
+              "offset":sum(errors)/len(errors),
+              "dac":dac,
+              "adc":adc}
+
+    # Statistics
+    checkData["checks"] += 1
+    checkData["last"] = drift
+    checkData["sum"] += drift
+    if drift > checkData["max"]:
+        checkData["max"] = drift
+
+    # Drift history of the board
+    store = readCalStore()
+    history = dict(record)
+    history["source"] = "selfcheck"
+    history["revision"] = calRevision
+    addDrift(calStoreBoard(store),history)
+    writeCalStore(store)
+
+    checkLast = time.time()
+    checkDuration = checkLast - start
+    message(2,"Calibration self check drift: " + "{:.4f}".format(drift) + " V")
+
+    if drift > checkThreshold:
+        checkData["exceeded"] += 1
+        text = ("Calibration drift of " + "{:.4f}".format(drift)
+                + " V at DAC" + str(dac) + " to ADC" + str(adc))
+        if checkAction == "error":
+            raise SlabEx(text)
+        if checkAction == "warn":
+            warn(text)
+        else:
+            checkAction(record)
+    return record
+
+'''
+Calibration self check in an idle gap
+Only checks if it is due and it fits in the gap
+Parameter:
+  t : Duration of the gap (s)
+'''
+def idleCheck(t):
+    global checkBusy
+    if checkPeriod <= 0.0 or not opened or checkBusy:
+        return
+    if time.time() - checkLast < checkPeriod:
+        return
+    if t < checkDuration:
+        return
+    checkBusy = True
+    try:
+        selfCheck()
+    finally:
+        checkBusy = False
+
+'''
+@selfCheckStats@
+selfCheckStats()
+Statistics of the calibration self checks
+since the last setSelfCheck
+
+Returns a dictionary with:
+    checks : Number of checks
+  exceeded : Checks with drift above threshold
+      last : Drift on the last check (V)
+       max : Maximum drift (V)
+      mean : Mean drift (V)
+Included in slab.py
+See also setSelfCheck
+'''
+def selfCheckStats():
+    data = dict(checkData)
+    if data["checks"] > 0:
+        data["mean"] = data["sum"]/data["checks"]
+    else:
+        data["mean"] = 0.0
+    del data["sum"]
+    return data
+
+################ PUBLIC BASIC DC FUNCTIONS ####################
+
+'''
+@printBoardInfo@
+printBoardInfo()
+Shows board information on screen
+Returns nothing
+Included in slab.py 
+'''
+def printBoardInfo():
+    if not opened:
+        raise SlabEx("No board connected")
+    print("")
+    print("Board : " + board_name)
+    print("  COM port : " + str(com_port))
+    print("  Reference Vref voltage : " + str(vref) + " V")
+    print("  Power Vdd voltage : " + str(vdd) + " V")
+    print("  " + str(ndacs) + " DACs with " + str(dac_bits) + " bits")
+    print("  " + str(nadcs) + " ADCs with " + str(adc_bits) + " bits")
+    print("  " + str(ndio) + " Digital I/O lines")
+    print("  DAC Pins " + str(dacPinList))
+    print("  ADC Pins " + str(adcPinList))
+    print("  DIO Pins " + str(dioPinList))
+    print("  Buffer Size : " + str(buff_size) + " samples")
+    print("  Maximum Sample Period : " + str(max_sample) + " s")
+    print("  Minimum Sample Period for Transient Async: " + str(min_sample) + " s")
+    print("  Maximum Sample Frequency for Frequency Response : " + str(maxSFfresponse) + " Hz")
+    print("")
+ 
+  
+'''
+@disconnect@
+disconnect()
+Disconnect from the board
+Returns nothing
+Included in slab.py 
+'''  
+def disconnect():
+    global opened
+    if not opened:
+        raise SlabEx("Not connected to board")
+    ser.close()
+    opened = 0
+    message(1,"Disconnected from the board")
+    if nwarns > 0:
+        message(1,str(nwarns) + " warnings since connect")
+  
+ 
+'''
+@connect@
+connect(portIdent,transport,boardId)
+Open the connection with the hardware board
+Must be called before any other function that uses it
+
+Optional parameters:
+   portIdent : Identifier of the COM port 
+               In windows it is COMx where x is a number
+               Use "tcp://host:port" for a board served
+               with serveBoard
+               (Defaults to Autodetect)
+   transport : Transport object to use instead of a port
+               See the link topic for available transports
+               (Defaults to None)
+     boardId : Identifier of the board in the calibration store
+               Needed for boards with no USB serial number
+               (Defaults to None, use the USB serial number)
+Returns nothing
+Included in slab.py 
+'''
+def connect(portIdent=-1,transport=None,boardId=None):
+    global ser,opened
+    global com_port,board_id
+    global nwarns
+    global tranSamples
+    
+    # Check if already connected
+    if opened:
+        message(1,"Already connected")
+        disconnect()
+    
+    com_port = portIdent
+    board_id = boardId
+        
+    if transport is not None:
+        ser = transport
+    elif str(portIdent).startswith("tcp://"):
+        try:
+            ser = openBridge(portIdent)
+        except (socket.error,ValueError):
+            raise SlabEx("Cannot connect to board server. Check address")
+    elif portIdent == -1:
+        detectCom()
+    else:    
+        try:    
+            openSerial(com_port)
+        except:
+            raise SlabEx("Cannot open connection. Check port")
+    
+    if not ser.isOpen():
+        raise SlabEx("Cannot open connection. Check port")
+         
+    # Get firmware string
+    #board_name = getFirmwareString()
+    #message(1,"Connected to " + board_name)
+
+    # Retry the magic check after a resynchronization
+    if not checkMagic() and not resync(): 
+        raise SlabEx("Bad magic from board. Check Firmware")
+            
+    # Set board as opened
+    opened = 1    
+    
+    # Transient storage is not known
+    tranSamples = 0
+    
+    # Save good com port
+    if isinstance(ser,SerialTransport):
+        with open(fprefix + LAST_COM_FILE,'wb') as f:
+            pickle.dump(com_port, f)
+    
+    # Get information about the board
+    getBoardData()
+                    
+    # Calibration of a previous board is not valid
+    calReset()
+    
+    # Calibration stored for this board
+    # or else the calibration files
+    if not calStoreLoad():
+        loadCalibrationFiles()
+  
+    message(1,"")
+    
+    # Erase warn count
+    nwarns = 0
+
+'''
+@setVdd@
+setVdd(value,persistent)
+Set Vdd supply voltage
+
+Required parameter:
+  value : Value to set (in Volt)
+  
+Optional parameter:
+  persistent : Makes value persistent in a file
+               (Defaults to False)
+
+Returns nothing  
+Included in slab.py              
+'''  
+def setVdd(value,persistent=False):
+    global vdd
+    # Check connection
+    if not opened:
+        raise SlabEx("Not connected to board")
+    # Check vdd value
+    if value < 3.0:
+        raise SlabEx("Vdd value too low")
+    # Removed to expand functionality at high voltages    
+    # if value > 4.0:
+    #    raise SlabEx("Vdd value too high")
+    vdd = value
+    
+    # Save if persistent
+    if persistent:
+        message(1,"Saving Vdd and Vref data to " + fprefix + calprefix + VDD_CAL_FILE)
+        with open(fprefix + calprefix + VDD_CAL_FILE,'wb') as f:
+            pickle.dump([vdd,vref], f)
+        calStoreSave("vdd")
+            
+'''
+@setVref@
+setVref(value,persistent)
+Set Vref reference value for DACs and ADCs
+
+Required parameter:
+  value : Value to set (in Volt)
+  
+Optional parameter:
+  persistent : Makes value persistent in a file
+               (Defaults to False)
+
+Returns nothing
+Included in slab.py                
+'''  
+def setVref(value,persistent=False):
+    global vref
+    # Check connection
+    if not opened:
+        raise SlabEx("Not connected to board")
+    # Check vref value
+    if value < 3.0:
+        raise SlabEx("Vref value too low")
+    # Removed to expand functionality at high voltages    
+    # if value > 4.0:
+    #    raise SlabEx("Vref value too high")
+    vref = value
+    
+    # Save if persistent
+    if persistent:
+        message(1,"Saving Vdd and Vref data to " + fprefix + calprefix + VDD_CAL_FILE)
+        with open(fprefix + calprefix + VDD_CAL_FILE,'wb') as f:
+            pickle.dump([vdd,vref], f)            
+        calStoreSave("vref")
+  
+'''
+@writeDAC@
+writeDAC(channel,value)
+Write a ratiometric value to one DAC
+Performs calibration if available
+
+Required parameteres:
+ channel : DAC number
+   value : Value to set from 0.0 to 1.0 
+Returns nothing
+Included in slab.py    
+'''  
+def writeDAC(channel,value):   
+    # Calibrate value    
+    value = dacCalRatio(channel,value)
+    
+    # Send to board
+    writeChannel(channel,value)  
+
+ 
+'''
+@setVoltage@
+setVoltage(channel,value)
+Sets the voltage value of one DAC
+Performs calibration if available
+
+Required parameters:
+ channel : DAC to write
+   value : Voltage to set
+Returns nothing
+Included in slab.py    
+'''   
+def setVoltage(channel,value):
+    value = voltage2ratio(value)
+    writeDAC(channel,value)
+ 
+
+'''
+@readADC@
+readADC(channel)
+Read the ratiometric value at one ADC
+Uses calibration data if available
+
+Rquired parameter:
+  n : ADC number
+Returns a ratiometric value between 0.0 and 1.0
+Included in slab.py 
+'''            
+def readADC(channel):
+    fvalue = readChannel(channel)
+    return dc_cal(fvalue,xcal,adcCalData[channel-1])  
+    
+    
+'''
+@readVoltage@
+readVoltage(ch1,ch2)
+Reads a differential voltage between two ADCs at ch1 and ch2
+If ch2 is ommited, returns voltage between ch1 and GND
+If any channel is zero, it is considered as GND
+Return the voltage
+Included in slab.py 
+'''    
+def readVoltage(ch1,ch2=0):
+    if ch1 == 0:
+        pvalue = 0.0
+    else:    
+        pvalue = vref*readADC(ch1)
+    if ch2 == 0:
+        nvalue = 0.0
+    else:
+        nvalue = vref*readADC(ch2)
+    return pvalue - nvalue 
+
+'''
+@rCurrent@
+rCurrent(r,ch1,ch2)
+Reads the voltage on a resistor and computes current from it
+If any channel is zero, it is considered as GND
+
+Parameters:
+   r : Resistor value
+  n1 : Positive terminal ADC
+  n2 : Negative terminal ADC
+       If omited it is considered to be GND
+Returns the resistor current 
+Included in slab.py       
+'''    
+def rCurrent(r,ch1,ch2=0):
+    v = readVoltage(ch1,ch2)
+    i = v/r
+    return i
+    
+'''
+@setDCreadings@
+setDCreadings(number)
+Sets the number of readings to average on each DC mesurement
+Parameter:
+  number : Number of values to read
+Returns last value of this number
+Included in slab.py   
+'''
+def setDCreadings(number):
+    global dcroundings
+    lastValue = dcroundings
+    # Check
+    if number < 1:
+        raise SlabEx("Number of readings must be greater or equal than 1")
+    if number > 65535:
+        raise SlabEx("Number of readings too big")
+    dcroundings = int(number)
+    
+    # Send command
+    startCommand('N')
+    sendU16(dcroundings) 
+    sendCRC()
+    
+    checkACK()
+    checkCRC()
+
+    return lastValue
+
+'''
+@dcBatch@
+dcBatch(dacs,adcs,wt)
+Sets several DACs and reads several ADCs as batches of
+pipelined commands. This is faster than using setVoltage
+and readVoltage for each channel
+Performs calibration if available
+
+Optional parameters:
+  dacs : List of (channel,voltage) pairs to set
+         (Defaults to none)
+  adcs : List of ADCs to read (Defaults to none)
+    wt : Time to wait between set and read (Defaults to 0)
+         Sets and reads go in the same batch if it is zero
+         With adaptive settling it is the maximum wait
+
+Returns a list with the voltages read at each ADC
+Included in slab.py
+See also setSettle
+'''
+def dcBatch(dacs=[],adcs=[],wt=0.0):
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")
+    counts = []
+    for channel,value in dacs:
+        if channel < 1 or channel > ndacs:
+            raise SlabEx("Invalid DAC number")
+        counts.append(dacCounts(channel,value))
+    for channel in adcs:
+        if channel < 1 or channel > nadcs:
+            raise SlabEx("Invalid ADC number")
+
+    # Queue DAC writes
+    for (channel,value),data in zip(dacs,counts):
+        low,high = splitU16(data)
+        pipeCommand('D',[channel,low,high])
+
+    # Settling wait
+    # It is not an idle gap so no self check is done
+    results = None
+    if wt > 0.0:
+        pipeFlush()
+        if settleTol > 0.0 and len(adcs) > 0:
+            results,elapsed = settleRead(adcs,wt)
+        else:
+            time.sleep(wt)
+            elapsed = wt
+        settleLog.append(elapsed)
+
+    if results is None:
+        # Queue ADC reads
+        for channel in adcs:
+            pipeCommand('A',[channel],getU16)
+
+        # Only ADC results are returned
+        results = pipeFlush()
+        results = results[len(results)-len(adcs):]
+    voltages = []
+    for channel,value in zip(adcs,results):
+        fvalue = dc_cal(u16toFloat(value),xcal,adcCalData[channel-1])
+        voltages.append(vref*fvalue)
+    return voltages
+
+'''
+@adcCalibrate@
+adcCalibrate()
+Second stage of board calibration
+Calibrates ADCs against DAC1
+Stores calibration data on ADC_CAL_FILE file
+Returns nothing
+Included in slab.py 
+'''   
+def adcCalibrate():
+    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
+    
+    print()
+    print("Calibration of ADCs")
+    print()
+    print("Connect the DAC 1 output to all ADC inputs")
+    print("Use the buffers in all connections")
+    print()   
+    input("Press [Return] to continue")
+    
+    # Increase number of readings for better calibration
+    lastDCR=setDCreadings(1000)
+    
+    # Define input calibration range and steps
+    # xcal = np.arange(0.0,1.1,0.1)
+    xcal = []
+    for x in range(0,11):
+        xcal.append(x/10.0)
+    
+    # Output range is now empty
+    ycal1 = []
+    ycal2 = []
+    ycal3 = []
+    ycal4 = []
+    
+    # Obtain calibration data
+    # We use readChannel because it does not depend on
+    # previous calibrations
+    message(1,"Performing ADC calibration")
+    for x in xcal:
+        message(2,"  Calibrate at " + str(x))
+        writeDAC(1,x)        # Set DAC value
+        time.sleep(0.1)      # Wait a little
+        a1 = readChannel(1)  # ADC read
+        a2 = readChannel(2)
+        a3 = readChannel(3)
+        a4 = readChannel(4)
+        ycal1.append(a1)     # Append values
+        ycal2.append(a2)
+        ycal3.append(a3)
+        ycal4.append(a4)
+    
+    prev1=-1;
+    # Check monotony
+    for x,y1,y2,y3,y4 in zip(xcal,ycal1,ycal2,ycal3,ycal4):
+        if prev1!=-1:
+            if y1 < prev1:
+                raise SlabEx("Channel 1 non monotonous")
+            if y2 < prev2:
+                raise SlabEx("Channel 2 non monotonous")
+            if y3 < prev3:
+                raise SlabEx("Channel 3 non monotonous")
+            if y4 < prev4:
+                raise SlabEx("Channel 4 non monotonous")               
+        prev1 = y1
+        prev2 = y2
+        prev3 = y3
+        prev4 = y4
+    
+    # Show and save calibration data
+    _storeAndShowADCcalibration()
+            
+    # Restore the number of ADC readings
+    setDCreadings(lastDCR)
+            
+    print() 
+    print("Calibration of ADCs completed")
+    print()    
+   
+'''
+Stores ADC calibration data
+Internal function
+'''
+def _storeAndShowADCcalibration():
+    global adcCalData
+
+    # Show graph is we have SciPy
+    if not scipy:
+        cannotPlot()
+    else:    
+        plt.figure(facecolor="white")     # White border
+        # Show curves of the calibrated ADCs
+        for i,ycal in enumerate([ycal1,ycal2,ycal3,ycal4]):
+            if len(ycal) == len(xcal):
+                pl.plot(xcal,ycal,label="ADC"+str(i+1))
+
+        pl.xlabel('DAC1 Value')                         # Set X label
+        pl.ylabel('ADC 1,2,3,4 Values')                 # Set Y label
+        pl.title('ADC Ratiometric Calibration Curves')  # Set title
+
+        pl.legend(loc='lower right')
+        pl.grid()
+        showPlot()
+
+    # Save of calibration data
+    message(1,"Saving calibration data to " + fprefix +  calprefix + ADC_CAL_FILE)
+    with open(fprefix + calprefix +  ADC_CAL_FILE,'wb') as f:
+        pickle.dump([xcal,ycal1,ycal2,ycal3,ycal4], f)
+        
+    # All calibration tables    
+    adcCalData = [ycal1,ycal2,ycal3,ycal4]    
+    
+    calStoreSave("adc")
+   
+'''
+Stores DAC calibration data
+Internal function
+Parameter:
+ n : Number of DACs to show
+'''   
+def _storeAndShowDACcalibration(n):
+
+    # Plot if we have SciPy
+    if not scipy:
+        cannotPlot()
+    else:    
+        plt.figure(facecolor="white")     # White border
+        pl.plot(dacx,dac1y,label="DAC1")  # Show curves
+    
+        if n >= 2:
+            pl.plot(dacx,dac2y,label="DAC2")
+        if n >= 3:
+            pl.plot(dacx,dac3y,label="DAC3")
+
+        pl.xlabel('DAC Value')                          # Set X label
+        pl.ylabel('Real Ratiometric Values')            # Set Y label
+        pl.title('DAC Ratiometric Calibration Curves')  # Set title
+
+        pl.legend(loc='lower right')
+        pl.grid()
+        showPlot()
+
+    message(1,"Saving calibration data to "+ fprefix + calprefix + DAC_CAL_FILE)
+    with open(fprefix + calprefix + DAC_CAL_FILE,'wb') as f:
+        pickle.dump([dacx,dac1y,dac2y,dac3y,dac4y], f)
+     
+    # All calibration tables    
+    registerDACcal(dacx,[dac1y,dac2y,dac3y,dac4y])
+    
+    calStoreSave("dac")
+   
+'''
+@dacCalibrate@
+dacCalibrate()
+Third stage of board calibration
+Calibrates DAC(i) against ADC(i)
+Stores calibration data on DAC_CAL_FILE file
+Returns nothing
+Included in slab.py 
+'''   
+def dacCalibrate():
+    global dacx,dac1y,dac2y,dac3y,dac4y,dacCalData
+    
+    print()
+    print("Calibration of DACs")
+    print()
+    print("Connect the DAC outputs to ADC inputs with same number")
+    print("DAC 1 to ADC 1 and DAC2 to ADC2 and son on...")
+    print()    
+    input("Press [Return] to continue")
+    
+    # Increase number of readings for better calibration
+    lastDCR=setDCreadings(1000)
+    
+    # Define input calibration range and steps
+    # dacx = np.arange(0.0,1.1,0.1)
+    dacx = []
+    for x in range(0,11):
+        dacx.append(x/10.0)
+    
+    # Output range is now empty
+    dac1y = []
+    dac2y = []
+    dac3y = []
+    dac4y = []
+    
+    # Obtain calibration data
+    # We use previusly calibrated ADC channels
+    message(1,"Performing DAC calibration")
+    for x in dacx:
+        message(2,"  Calibrate at " + str(x))
+        writeChannel(1,x)       # Set DAC values without calibration
+        writeChannel(2,x)
+        if ndacs >= 3:
+            writeChannel(3,x)
+        time.sleep(0.1)    # Wait a little
+        a1 = readADC(1)    # ADC ratiometric read (with calibration)
+        a2 = readADC(2)
+        dac1y.append(a1)   # Append read values
+        dac2y.append(a2)
+        if ndacs>=3:
+            a3 = readADC(3)    
+            dac3y.append(a3)
+    
+    # Check monotony of each calibrated DAC
+    for i,table in enumerate([dac1y,dac2y,dac3y][:ndacs]):
+        for prev,y in zip(table,table[1:]):
+            if y < prev:
+                raise SlabEx("Channel " + str(i+1) + " non monotonous")
+    
+    # Show and save calibration data
+    _storeAndShowDACcalibration(ndacs)
+     
+    # Restore the number of ADC readings
+    setDCreadings(lastDCR) 
+     
+    print() 
+    print("Calibration of DACs completed")
+    print()     
+   
+'''
+Raw sweep for the dense calibration
+Writes DAC codes and reads ADCs in pipelined batches
+Does not perform any calibration
+Parameters:
+    dacs : List of DACs to write at each point
+    adcs : List of ADCs to read at each point
+  points : Number of sweep points
+      wt : Settling time after each write (s)
+Returns a tuple with:
+  Array of DAC ratiometric values written
+  List of arrays of ADC ratiometric readings
+'''
+def _calSweep(dacs,adcs,points,wt):
+    data = ratio2countsVector(np.linspace(0.0,1.0,points))
+    readings = [[] for channel in adcs]
+    for value in data:
+        low,high = splitU16(int(value))
+        for channel in dacs:
+            pipeCommand('D',[channel,low,high])
+        if wt > 0.0:
+            pipeFlush()
+            time.sleep(wt)
+        for channel in adcs:
+            pipeCommand('A',[channel],getU16)
+        # Only ADC results are used
+        results = pipeFlush()
+        results = results[len(results)-len(adcs):]
+        for vector,value in zip(readings,results):
+            vector.append(value)
+    ratios = [np.array(vector)/65536.0 for vector in readings]
+    return data/65536.0,ratios
+
+'''
+Monotone smoothing of calibration readings
+Pool adjacent violators gives the closest non decreasing
+curve and a moving average then removes the noise
+The moving average of a monotone curve is also monotone
+Parameters:
+       y : Array of readings
+  window : Length of the moving average
+Returns the smoothed array
+'''
+def _monotoneFit(y,window):
+    # Each block is [sum,count]
+    blocks = []
+    for value in y:
+        blocks.append([value,1])
+        while (len(blocks) > 1 and
+               blocks[-2][0]*blocks[-1][1] > blocks[-1][0]*blocks[-2][1]):
+            total,count = blocks.pop()
+            blocks[-1][0] += total
+            blocks[-1][1] += count
+    fit = np.concatenate([np.full(count,total/count) for total,count in blocks])
+    if window > 1:
+        # Pad with the end values so the ends are not bent
+        left = window//2
+        right = window - 1 - left
+        fit = np.concatenate((np.full(left,fit[0]),fit,np.full(right,fit[-1])))
+        fit = np.convolve(fit,np.ones(window)/window,mode='valid')
+    return fit
+
+'''
+Dense calibration table from sweep data
+Keeps only the points where the readings increase
+so saturated ends do not give flat segments
+Parameters:
+  x : Array of correct values
+  y : Array of smoothed readings
+Returns two lists: correct values and readings
+'''
+def _denseTable(x,y):
+    keep = [0]
+    for i in range(1,len(y)):
+        if y[i] > y[keep[-1]]:
+            keep.append(i)
+    return [float(x[i]) for i in keep],[float(y[i]) for i in keep]
+
+'''
+Check the parameters of a dense calibration
+'''
+def _checkDense(points,readings,smooth):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    checkSciPy()
+    if points < 11:
+        raise SlabEx("Dense calibration needs at least 11 points")
+    if readings < 1:
+        raise SlabEx("Invalid number of readings")
+    if smooth < 1 or smooth > points//4:
+        raise SlabEx("Invalid smoothing window")
+
+'''
+@adcCalibrateDense@
+adcCalibrateDense(points,readings,smooth,wt)
+Dense alternative to the second stage of board calibration
+Calibrates ADCs against DAC1 on hundreds of points
+Sweeps the raw DAC1 codes with pipelined batched reads
+and fits a monotone smoothed curve to the readings
+Uses the DAC1 calibration of the first stage
+Stores calibration data on ADC_CAL_FILE file
+
+Optional parameters:
+    points : Number of sweep points (Defaults to 256)
+  readings : ADC readings averaged at each point
+             (Defaults to 100)
+    smooth : Points in the moving average (Defaults to 5)
+        wt : Settling time at each point (Defaults to 1ms)
+
+Requires SciPy
+Returns nothing
+Included in slab.py
+See also adcCalibrate
+'''
+def adcCalibrateDense(points=256,readings=100,smooth=5,wt=0.001):
+    global xcal,ycal1,ycal2,ycal3,ycal4,adcCalData
+
+    _checkDense(points,readings,smooth)
+
+    print()
+    print("Dense calibration of ADCs")
+    print()
+    print("Connect the DAC 1 output to all ADC inputs")
+    print("Use the buffers in all connections")
+    print()
+    input("Press [Return] to continue")
+
+    lastDCR = setDCreadings(readings)
+    start = time.time()
+
+    message(1,"Performing dense ADC calibration")
+    codes,ratios = _calSweep([1],range(1,nadcs+1),points,wt)
+
+    # Real DAC1 values from the first stage calibration
+    real = dc_calVector(codes,dac1y,dacx)
+
+    tables = []
+    for channel,ratio in enumerate(ratios):
+        x,y = _denseTable(real,_monotoneFit(ratio,smooth))
+        if len(x) < 2:
+            raise SlabEx("Channel " + str(channel+1) + " does not respond")
+        tables.append((x,y))
+
+    # All tables share the correct values
+    # so readings are resampled at the ADC1 ones
+    xcal = tables[0][0]
+    ycal = [tables[0][1]]
+    for x,y in tables[1:]:
+        ycal.append(list(np.interp(xcal,x,y)))
+    while len(ycal) < 4:
+        ycal.append([])
+    ycal1,ycal2,ycal3,ycal4 = ycal
+
+    message(1,"Calibrated " + str(len(xcal)) + " points in "
+               + "{:.1f}".format(time.time()-start) + " s")
+
+    _storeAndShowADCcalibration()
+
+    setDCreadings(lastDCR)
+
+    print()
+    print("Dense calibration of ADCs completed")
+    print()
+
+'''
+@dacCalibrateDense@
+dacCalibrateDense(points,readings,smooth,wt)
+Dense alternative to the third stage of board calibration
+Calibrates DAC(i) against ADC(i) on hundreds of points
+Sweeps the raw DAC codes with pipelined batched reads
+and fits a monotone smoothed curve to the readings
+Uses the ADC calibration of the second stage
+Stores calibration data on DAC_CAL_FILE file
+
+Optional parameters:
+    points : Number of sweep points (Defaults to 256)
+  readings : ADC readings averaged at each point
+             (Defaults to 100)
+    smooth : Points in the moving average (Defaults to 5)
+        wt : Settling time at each point (Defaults to 1ms)
+
+Requires SciPy
+Returns nothing
+Included in slab.py
+See also dacCalibrate
+'''
+def dacCalibrateDense(points=256,readings=100,smooth=5,wt=0.001):
+    global dacx,dac1y,dac2y,dac3y,dac4y,dacCalData
+
+    _checkDense(points,readings,smooth)
+    n = min(ndacs,nadcs)
+
+    print()
+    print("Dense calibration of DACs")
+    print()
+    print("Connect the DAC outputs to ADC inputs with same number")
+    print("DAC 1 to ADC 1 and DAC2 to ADC2 and son on...")
+    print()
+    input("Press [Return] to continue")
+
+    lastDCR = setDCreadings(readings)
+    start = time.time()
+
+    message(1,"Performing dense DAC calibration")
+    codes,ratios = _calSweep(range(1,n+1),range(1,n+1),points,wt)
+
+    tables = []
+    for channel,ratio in enumerate(ratios):
+        # Real values from the second stage calibration
+        real = dc_calVector(ratio,xcal,adcCalData[channel])
+        x,y = _denseTable(codes,_monotoneFit(real,smooth))
+        if len(x) < 2:
+            raise SlabEx("Channel " + str(channel+1) + " does not respond")
+        tables.append((x,y))
+
+    # All tables share the DAC values
+    # so readings are resampled at the DAC1 ones
+    dacx = tables[0][0]
+    dacy = [tables[0][1]]
+    for x,y in tables[1:]:
+        dacy.append(list(np.interp(dacx,x,y)))
+    while len(dacy) < 4:
+        dacy.append([])
+    dac1y,dac2y,dac3y,dac4y = dacy
+
+    message(1,"Calibrated " + str(len(dacx)) + " points in "
+               + "{:.1f}".format(time.time()-start) + " s")
+
+    _storeAndShowDACcalibration(n)
+
+    setDCreadings(lastDCR)
+
+    print()
+    print("Dense calibration of DACs completed")
+    print()
+
+'''
+@manualCalibrateDAC1@
+manualCalibrateDAC1()
+First stage of board calibration
+Performs a manual calibration of DAC 1 against a voltage meter
+Also calibrates Vdd and Vref
+Returns nothing
+Included in slab.py 
+'''   
+def manualCalibrateDAC1():  
+    global vdd,vref,dacx,dac1y,dac2y,dac3y,dac4y
+    print()
+    print("Manual calibration of DAC 1")
+    print("You will need a voltage measurement instrument (VM)" )
+    print()
+    print("Put VM between the Vdd terminal and GND")
+    print("Write down the voltage value and press enter")
+    print()
+    vdd = float(input("Voltage value [Volt]: "))
+    print()
+    print("Put VM between the buffered DAC 1 output and GND")
+    print("Write down the voltage value and press enter each time it is asked")
+    print()
+    
+    # Increase number of readings for better calibration
+    lastDCR=setDCreadings(1000)
+    
+    dacx  = [0.0,0.02,0.1,0.5,0.9,0.98,1.0]
+    voltages = []
+    
+    prevv = -1.0
+    for x in dacx:
+        writeChannel(1,x)
+        y = float(input("Voltage value [Volt]: "))
+        voltages.append(y)
+        if y < prevv:
+            raise SlabEx("Non monotonous. Cannot calibrate")
+        prevv = y
+        
+    # Stores vdd and vref calibration
+    if voltages[3]*2.0 > voltages[6] :
+        setVref(voltages[3]*2.0, persistent=True)
+    else:    
+        setVref(voltages[-1], persistent=True) 
+
+    # Convert to ratiometric    
+    dac1y = []
+    for v in voltages:
+        dac1y.append(v/vref)
+        
+    # Tables of other DACs used the old DAC values
+    # so they are no longer valid
+    dac2y,dac3y,dac4y = [],[],[]
+        
+    # Store calibration
+    _storeAndShowDACcalibration(1)  
+
+    # Restore the number of ADC readings
+    setDCreadings(lastDCR) 
+    
+    print() 
+    print("Manual calibration of DAC 1 completed")
+    print()    
+    
+
+'''
+@checkCalibration@
+checkCalibration()
+Fourth and last stage of board calibration
+Checks the board calibration
+Shows the curves of DACs connected to ADCs
+Returns nothing
+Included in slab.py 
+'''    
+def checkCalibration():
+
+    print()
+    print("Calibration check")
+    print()
+    print("Connect the DAC outputs to ADC inputs with same number")
+    print("DAC 1 to ADC 1 and DAC2 to ADC2 and son on...")
+    print("Connect the rest of ADCs to DAC 1")
+    print()    
+    input("Press [Return] to continue")
+
+    # Increase number of readings for better calibration
+    lastDCR=setDCreadings(400)
+    
+    vmin = 0.1
+    vmax = vref - 0.1
+
+    R1 = dcSweep(1,vmin,vmax,0.2)
+    R2 = dcSweep(2,vmin,vmax,0.2)
+    if ndacs > 2:
+        R3 = dcSweep(3,vmin,vmax,0.2)
+
+    x = R1[0]
+    y1 = R1[1]
+    y2 = R2[2]
+    if ndacs > 2:
+        y3 = R3[3]
+    else:
+        y3 = R1[3]
+    y4 = R1[4]
+
+    for i in range(1,ndacs+1):
+        setVoltage(i,1.0)
+    
+    message(1,"")
+    message(1,"DAC outputs shall be now 1V")
+    message(1,"They will be zero after closing the plot")
+    message(1,"")
+    
+    plot1n(x,[y1,y2,y3,y4],"Final curves","DAC (V)","ADC (V)",["Ch1","Ch2","Ch3","Ch4"])
+    
+    zero()
+    
+    
+    # Restore the number of ADC readings
+    setDCreadings(lastDCR) 
+    
+    
+
+'''
+@dcPrint@
+dcPrint()
+Show readings all four ADC channels on screen
+Returns nothing
+Included in slab.py  
+'''
+def dcPrint():
+    a1 = readVoltage(1);
+    a2 = readVoltage(2);
+    a3 = readVoltage(3);
+    a4 = readVoltage(4);
+    print("ADC DC Values")
+    print("  ADC1 = "+"{0:.3f}".format(a1)+" V")
+    print("  ADC2 = "+"{0:.3f}".format(a2)+" V")
+    print("  ADC3 = "+"{0:.3f}".format(a3)+" V")
+    print("  ADC4 = "+"{0:.3f}".format(a4)+" V")
+    print()
+    
+'''
+@zero@
+zero()
+Set all DACs to ratiometric zero
+Does not use calibration
+Returns nothing
+Included in slab.py 
+'''    
+def zero():
+    for i in range(1,ndacs+1):
+        writeChannel(i,0.0);  
+    message(2,"All DACs at zero")        
+  
+'''
+@dcLive@
+dcLive(n,wt,single,returnData)
+Prints live values of ADC voltages
+Use CTRL+C to exit
+
+Optional parameters:
+          n : Number of ADCs to show (Defaults to 4)
+         wt : Wait time, in seconds, between measurements (Defaults to 0.2)
+     single : Read only the ADC number n
+ returnData : Return obtained data
+
+Included in slab.py
+'''
+def dcLive(n=4,wt=0.2,single=False,returnData=False):
+    # Initial checks
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if n < 1 or n > 4:
+        raise SlabEx("Invalid number of ADCs")
+    
+    # Generate output lists
+    data=[]
+    if not single:
+        for i in range(0,n):
+            data.append([])
+    
+    print("Live voltage readings:")
+    print()
+    try:
+        while True:
+            sys.stdout.write("\r")
+            if single:
+                a = readVoltage(n)
+                sys.stdout.write(" ADC%d: " % n)
+                sys.stdout.write("%f V" % a)
+                if returnData:
+                    data.append(a)
+            else:
+                for i in range(1,n+1):
+                    a = readVoltage(i)
+                    sys.stdout.write(" ADC%d: " % i)
+                    sys.stdout.write("%f V" % a)
+                    if returnData:
+                        data[i-1].append(a)
+            sys.stdout.write("    ")
+            wait(wt)
+    except:
+        print()
+        print("End of live measurements")
+        print()
+        
+    # Compose return data if enabled    
+    if returnData:
+        if not scipy:
+            return data
+        else:    
+            if single:
+                return np.array(data)
+            elif n == 1:
+                return np.array(data[0])
+            else:
+                ret = []
+                for i in range(0,n):
+                    ret.append(np.array(data[i]))
+                return ret    
+        
+  
+########### CALIBRATE ALIAS COMMANDS ############################
+
+'''
+@cal1@
+cal1()
+Alias for the manualCalibrateDAC1 command
+Included in slab.py
+'''
+def cal1():
+    manualCalibrateDAC1()
+
+'''
+@cal2@
+cal2()
+Alias for the adcCalibrate command
+Included in slab.py
+'''    
+def cal2():
+    adcCalibrate()
+  
+'''
+@cal3@
+cal3()
+Alias for the dacCalibrate command
+Included in slab.py
+'''     
+def cal3():
+    dacCalibrate()
+ 
+'''
+@cal4@
+cal4()
+Alias for the checkCalibration command
+Included in slab.py
+'''      
+def cal4():
+    checkCalibration()   
+ 
+################ PUBLIC COMPLEX DC FUNCTIONS ####################
+
+'''
+@dcSweep@
+dcSweep(ndac,v1,v2,vi,wt)
+Performs a DC Sweep on a DAC and reads all ADCs at each point
+
+Required parameters:
+  ndac : DAC to sweep
+    v1 : Start voltage
+    v2 : End voltage
+    
+Optional parameters    
+    vi : Increment (Defaults to 0.1 V)
+    wt : Wait time at each step (Defaults to 0.1 s)
+    
+Returns a list of vectors
+   Vector 0 is the DAC value
+   Vectorns 1 onward are ADC values    
+
+Included in slab.py    
+'''
+
+def dcSweep(ndac,v1,v2,vi=0.1,wt=0.1):
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if v1 < 0.0:
+        raise SlabEx("Voltage cannot be below 0 volts")
+    if v1 > vref:
+        raise SlabEx("Voltage cannot be over Vref")
+    if v2 < 0.0:
+        raise SlabEx("Voltage cannot be below 0 volts")
+    if v2 > vref:
+        raise SlabEx("Voltage cannot be over Vref")        
+    if ndac < 1 or ndac > ndacs:
+        raise SlabEx("Invalid DAC number")
+
+    checkSciPy()
+            
+    message(1,"Performing mesurements...")        
+            
+    # Settle times of this sweep
+    del settleLog[:]
+            
+    # Initialize outputs
+    a1 = []
+    a2 = []
+    a3 = []
+    a4 = []   
+           
+    # Perform the measurements       
+    xrange = np.arange(v1,v2,vi)
+    for x in xrange:
+        message(2,"  DAC at " + str(x) + " V")
+        v = dcBatch([(ndac,x)],[1,2,3,4],wt)
+        a1.append(v[0])
+        a2.append(v[1])
+        a3.append(v[2])
+        a4.append(v[3])
+        
+    message(1,"Measurement ends")    
+    if settleTol > 0.0 and len(settleLog) > 0:
+        message(1,"Mean settle time " + "{:.4f}".format(np.mean(settleLog)) + " s")
+
+    # Return results
+    return xrange,np.array(a1),np.array(a2),np.array(a3),np.array(a4)
+    
+'''
+@setSettle@
+setSettle(tolerance,interval)
+Configures adaptive settling for DC sweeps
+After each DAC change the ADCs are read again and again
+until two successive readings agree within the tolerance
+The wait time of the DC commands is then the maximum wait
+It is used by dcBatch, dcSweep, dcGrid and the DC curves
+of the slab_dc submodule
+
+The time between readings doubles after each reading so
+slow circuits are not taken as settled too early
+
+Optional parameters:
+  tolerance : Maximum change between readings in Volt
+              Zero uses fixed wait times (Defaults to 0)
+   interval : Time between the first two readings
+              (Defaults to 1 ms)
+
+Returns nothing
+Included in slab.py
+See also settleTimes
+'''
+def setSettle(tolerance=0.0,interval=0.001):
+    global settleTol,settleInterval
+    if tolerance < 0.0:
+        raise SlabEx("Tolerance cannot be negative")
+    if interval < 0.0:
+        raise SlabEx("Interval cannot be negative")
+    settleTol = tolerance
+    settleInterval = interval
+
+'''
+@settleTimes@
+settleTimes()
+Settle time of each point of the last DC sweep
+Without adaptive settling it is the fixed wait time
+
+Returns an array with the settle times in seconds
+Included in slab.py
+See also setSettle
+'''
+def settleTimes():
+    checkSciPy()
+    return np.array(settleLog)
+
+'''
+Read ADCs until two successive readings agree
+Readings agree if no ADC changes more than settleTol
+The time between readings starts at settleInterval
+and doubles after each reading
+Parameters:
+  adcs : List of ADCs to read
+  tmax : Maximum time to wait (s)
+Returns a tuple with:
+  List of the last readings in counts
+  Settle time (s)
+'''
+def settleRead(adcs,tmax):
+    tol = settleTol*65536.0/vref
+    interval = settleInterval
+    start = time.time()
+    last = None
+    while True:
+        for channel in adcs:
+            pipeCommand('A',[channel],getU16)
+        counts = pipeFlush()
+        elapsed = time.time() - start
+        if last is not None:
+            change = max([abs(a - b) for a,b in zip(counts,last)])
+            if change <= tol:
+                return counts,elapsed
+        if elapsed >= tmax:
+            return counts,elapsed
+        last = counts
+        time.sleep(min(interval,tmax - elapsed))
+        interval = 2.0*interval
+
+'''
+@dcGrid@
+dcGrid(outer,inner,adcs,wt,serpentine)
+Performs a 2-D DC sweep on two DACs and reads
+several ADCs at each point of the grid
+The full grid is planned and calibrated before measuring
+With no wait time each inner sweep is sent to the board
+as only one batch of pipelined commands
+
+Required parameters:
+  outer : Outer sweep as (dac,v1,v2,vi) tuple
+          The outer DAC is set once for each inner sweep
+  inner : Inner sweep as (dac,v1,v2,vi) tuple
+          Values go from v1 to v2 (not included) in vi steps
+  
+Optional parameters:
+        adcs : List of ADCs to read (Defaults to [1,2,3,4])
+          wt : Wait time after each DAC change
+               (Defaults to 0 s)
+  serpentine : Reverse the inner sweep on every other outer
+               value so DACs only change in small steps
+               (Defaults to True)
+
+Returns a dictionary:
+   "outer" : Vector of outer DAC values
+   "inner" : Vector of inner DAC values
+   "ADCn"  : 2-D array of readings for each ADC read
+             Rows go with outer values and columns with
+             inner values, regardless of the serpentine order
+   "settle" : 2-D array of settle times of each point
+              Only with adaptive settling (see setSettle)
+
+Requires SciPy
+Included in slab.py
+See also dcSweep
+'''
+def dcGrid(outer,inner,adcs=[1,2,3,4],wt=0.0,serpentine=True):
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")
+    checkSciPy()
+    odac,o1,o2,oi = outer
+    idac,i1,i2,ii = inner
+    for dac in (odac,idac):
+        if dac < 1 or dac > ndacs:
+            raise SlabEx("Invalid DAC number")
+    if odac == idac:
+        raise SlabEx("Outer and inner sweeps need different DACs")
+    for channel in adcs:
+        if channel < 1 or channel > nadcs:
+            raise SlabEx("Invalid ADC number")
+    if wt < 0.0:
+        raise SlabEx("Wait time cannot be negative")
+
+    # Plan the grid
+    ovalues = np.arange(o1,o2,oi)
+    ivalues = np.arange(i1,i2,ii)
+    if len(ovalues) == 0 or len(ivalues) == 0:
+        raise SlabEx("Empty sweep range")
+    ocounts = dacCounts(odac,ovalues)
+    icounts = dacCounts(idac,ivalues)
+    raw = np.zeros((len(adcs),len(ovalues),len(ivalues)))
+    adaptive = settleTol > 0.0 and wt > 0.0
+    settle = np.zeros((len(ovalues),len(ivalues)))
+    del settleLog[:]
+
+    message(1,"Performing 2-D sweep of " + str(raw[0].size) + " points...")
+
+    # Each slot is None for writes or (adc,row,column) for reads
+    slots = []
+    def flush():
+        for slot,value in zip(slots,pipeFlush()):
+            if slot is not None:
+                adc,row,column = slot
+                raw[adc,row,column] = value
+        del slots[:]
+
+    def queueWrite(dac,count):
+        low,high = splitU16(int(count))
+        pipeCommand('D',[dac,low,high])
+        slots.append(None)
+        # Adaptive settling waits at the inner points only
+        if wt > 0.0 and not adaptive:
+            flush()
+            time.sleep(wt)
+
+    for row,ocount in enumerate(ocounts):
+        message(2,"  DAC" + str(odac) + " at " + str(ovalues[row]) + " V")
+        queueWrite(odac,ocount)
+        columns = range(len(ivalues))
+        if serpentine and row % 2:
+            columns = reversed(columns)
+        for column in columns:
+            if adaptive:
+                # Reads are repeated until the point settles
+                low,high = splitU16(int(icounts[column]))
+                pipeCommand('D',[idac,low,high])
+                slots.append(None)
+                flush()
+                counts,elapsed = settleRead(adcs,wt)
+                raw[:,row,column] = counts
+                settle[row,column] = elapsed
+                settleLog.append(elapsed)
+                continue
+            queueWrite(idac,icounts[column])
+            for adc,channel in enumerate(adcs):
+                pipeCommand('A',[channel],getU16)
+                slots.append((adc,row,column))
+        # Without waits the full inner sweep is one batch
+        flush()
+
+    message(1,"Measurement ends")
+
+    # Calibrate all readings at once
+    result = {"outer":ovalues,"inner":ivalues}
+    if adaptive:
+        result["settle"] = settle
+    for adc,channel in enumerate(adcs):
+        ratio = dc_calVector(raw[adc]/65536.0,xcal,adcCalData[channel-1])
+        result[adcNames[channel-1]] = ratio*vref
+    return result
+
+################## PUBLIC PLOTTING FUNCTIONS ####################
+
+
+'''
+Plot two magnitudes using log if needed
+Used by the plot11, plot1n and plotnn commands
+'''
+def plotXY(x,y,label="",logx=False,logy=False):
+    if not logx and not logy:
+        pl.plot(x,y,label=label)
+        return
+    if logx and not logy:
+        pl.semilogx(x,y,label=label)
+        return
+    if logy and not logx:
+        pl.semilogy(x,y,label=label)
+        return
+    if logx and logy:
+        pl.loglog(x,y,label=label)
+        return
+
+'''
+@setPlotReturnData@
+setPlotReturnData(value)
+Configures if plot commands shoud return the plotted data
+
+Optional parameters:
+  value : By default is False
+Returns nothing 
+Included in slab.py  
+'''
+def setPlotReturnData(value=False):
+    global plotReturnData
+    plotReturnData = value
+
+'''
+@setPlotMode@
+setPlotMode(mode,path,format)
+Configures how plot commands render their figures
+Useful to run plot commands in unattended scripts
+
+Possible modes are:
+  pmInteractive : Show plot and wait for window close
+  pmNonBlocking : Show plot and continue execution
+         pmFile : Save plot to file (no display needed)
+         pmNone : Don't render any plot
+         
+Modes use the slab namespace
+
+Optional parameters:
+    mode : Plot mode (Defaults to pmInteractive)
+    path : Path prefix for saved plots (Defaults to none)
+  format : Format for saved plots, 'png' or 'svg'
+           (Defaults to 'png')
+           
+Files are named plot0001, plot0002... after the file prefix and path
+Use setPlotReturnData(True) to also obtain the data of plot commands
+           
+Returns previous plot mode 
+Included in slab.py  
+'''
+def setPlotMode(mode=pmInteractive,path="",format="png"):
+    global plotMode,plotPath,plotFormat,plotBackend
+    # Checks
+    if mode < pmInteractive or mode > pmNone:
+        raise SlabEx("Invalid plot mode")
+    if format != "png" and format != "svg":
+        raise SlabEx("Plot format must be 'png' or 'svg'")
+    checkSciPy()
+    # Select backend
+    # File and none modes use Agg so no display is needed
+    if mode == pmFile or mode == pmNone:
+        if plotBackend is None:
+            plotBackend = matplotlib.get_backend()
+            plt.switch_backend("Agg")
+    else:
+        if plotBackend is not None:
+            plt.switch_backend(plotBackend)
+            plotBackend = None
+    # Set mode
+    lastMode = plotMode
+    plotMode = mode
+    plotPath = path
+    plotFormat = format
+    return lastMode
+
+'''
+Renders the current figure following the plot mode
+Used by all plot commands instead of show
+'''
+def showPlot():
+    global plotCount
+    if plotMode == pmInteractive:
+        pl.show()
+        pl.close()
+    elif plotMode == pmNonBlocking:
+        pl.show(block=False)
+        pl.pause(0.001)
+    elif plotMode == pmFile:
+        plotCount = plotCount + 1
+        filename = fprefix + plotPath + "plot" + "{:04d}".format(plotCount) + "." + plotFormat
+        pl.savefig(filename,format=plotFormat)
+        pl.close()
+        message(1,"Plot saved to " + filename)
+    else:
+        pl.close()
+
+'''
+@plot11@
+plot11(x,y,title,xt,yt,logx,logy)
+Plot one input against one output
+If x is an empty list [], a sequence number
+will be used for the x axis
+
+Required parameters:
+  x : Horizontal vector
+  y : Vertical vector
+  
+Optional parameters:
+  title : Plot title (Defaults to none)
+     xt : Label for x axis (Defaults to none)
+     yt : Label for y axis (Defaults to none)
+   logx : Use logarithmic x axis (Defaults to False)
+   logy : Use logarithmic x axis (Defaults to False)
+
+Returns nothing
+Included in slab.py      
+'''
+def plot11(x,y,title="",xt="",yt="",logx=False,logy=False):
+
+    # Check if SciPy is loaded
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+       
+    # Generate sequence if x is not provided
+    if len(x) == 0:
+        x = np.arange(0,len(y))
+       
+    plt.figure(facecolor="white")   # White border
+    plotXY(x,y,logx=logx,logy=logy)
+    pl.xlabel(xt)
+    pl.ylabel(yt)
+    pl.title(title)
+    pl.grid()
+    showPlot()
+    
+'''
+@plot1n@
+plot1n(x,ylist,title,xt,yt,labels,location,logx,logy)
+Plot one input against several outputs
+If x is an empty list [], a sequence number
+will be used for the x axis
+
+Required parameters:
+      x : Horizontal vector
+  ylist : List of vertical vectors
+  
+Optional parameters:
+    title : Plot title (Defaults to none)
+       xt : Label for x axis (Defaults to none)
+       yt : Label for y axis (Defaults to none)
+   labels : List of legend labels (Defaults to none)
+ location : Location for legend (Defaults to 'best')
+     logx : Use logarithmic x axis (Defaults to False)
+     logy : Use logarithmic x axis (Defaults to False)
+
+Returns nothing
+Included in slab.py     
+'''
+def plot1n(x,ylist,title="",xt="",yt="",labels=[],location='best',logx=False,logy=False):
+
+    # Check if SciPy is loaded
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Generate sequence is x is not provided
+    if len(x) == 0:
+        x = np.arange(0,len(ylist[0]))        
+        
+    plt.figure(facecolor="white")   # White border
+    if labels == []:
+        for y in ylist:
+            plotXY(x,y,logx=logx,logy=logy)
+            #pl.plot(x,y)
+    else:
+        for y,lbl in zip(ylist,labels):
+            plotXY(x,y,label=lbl,logx=logx,logy=logy)
+            #pl.plot(x,y,label=lbl)
+    pl.xlabel(xt)
+    pl.ylabel(yt)
+    pl.title(title)
+    pl.grid()
+    if not labels == []:
+        pl.legend(loc=location)
+    showPlot()
+  
+'''
+@plotnn@
+plotnn(xlist,ylist,title,xt,yt,labels,location,logx,logy)
+Plot several curves with different inputs and outputs
+
+Required parameters:
+  xlist : List of horizontal vector
+  ylist : List of vertical vectors
+  
+Optional parameters:
+    title : Plot title (Defaults to none)
+       xt : Label for x axis (Defaults to none)
+       yt : Label for y axis (Defaults to none)
+   labels : List of legend labels (Defaults to none)
+ location : Location for legend (Defaults to 'best')
+     logx : Use logarithmic x axis (Defaults to False)
+     logy : Use logarithmic x axis (Defaults to False)
+
+Returns nothing
+Included in slab.py     
+'''
+def plotnn(xlist,ylist,title="",xt="",yt="",labels=[],location='best',logx=False,logy=False):
+
+    # Check if SciPy is loaded
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    plt.figure(facecolor="white")   # White border
+    if labels == []:
+        for x,y in zip(xlist,ylist):
+            plotXY(x,y,logx=logx,logy=logy)
+    else:
+        for x,y,lbl in zip(xlist,ylist,labels):
+            plotXY(x,y,label=lbl,logx=logx,logy=logy)
+    pl.xlabel(xt)
+    pl.ylabel(yt)
+    pl.title(title)
+    pl.grid()
+    if not labels == []:
+        pl.legend(loc=location)
+    showPlot()
+  
+    
+######################### DC SWEEP PLOT ############################
+
+'''
+@dcSweepPlot@
+dcSweepPlot(ndac,v1,v2,vi,na,wt,returnData)
+Plots the results of a DC sweep
+
+Required parameters: 
+ ndac : DAC to sweep
+   v1 : Initial value (in Volt)
+   v2 : End of range (in Volt)
+  
+Optional parameters:  
+  vi : Step (defaults to 0.1V)  
+  na : Number of ADCs to show (defaults to 4)
+  wt : Waiting time between steps (defaults to 0.1s)
+  returnData : Enable return of plot data (Defaults to False)
+  
+Returns plot data if enabled (see also setPlotReturnData)
+Included in slab.py 
+''' 
+def dcSweepPlot(ndac,v1,v2,vi=0.1,na=4,wt=0.1,returnData=False):
+
+    # Check if SciPy is loaded
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform a DC sweep
+    res = dcSweep(1,v1,v2,vi,wt)
+    
+    if na == 1:
+        # Plot result
+        message(1,"Drawing curve")
+        plot11(res[0],res[1],"V(V) Plot","DAC"+str(ndac)+" (V)","ADC1 (V)")
+        ret = [res[0],res[1]]
+    else:
+        ylist=[]
+        labels=[]
+        ret=[res[0]]
+        for i in range(0,na):
+            ylist.append(res[i+1])
+            ret.append(res[i+1])
+            labels.append("ADC"+str(i+1))
+        plot1n(res[0],ylist,"DC Sweep Plot","DAC"+str(ndac)+" (V)","ADC(V)",labels)
+    
+    if plotReturnData or returnData:
+        return ret
+   
+   
+######################### REALTIME PLOT ############################   
+
+'''
+@realtimePlot@
+realtimePlot(nadc,wt,returnData)
+Plots ADC data in real time
+
+Optional parameters:
+        nadc : Number of ADCs to read (Defaults to 1)
+          wt : Wait time between read (Defaults to 0.2s)
+           n : Number of points to show (Defaults to All)
+  returnData : Returns captured data if true (Defaults to False)
+  
+Returns a time+nadc list if returnData is true  
+Included in slab.py   
+'''
+def realtimePlot(nadc=1,wt=0.2,n=0,returnData=False):
+
+    nn=int(n)
+
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")  
+    if nadc < 1 or nadc > nadcs:
+        raise SlabEx("Invalid number of ADCs")
+    
+    # Initialize the data arrays    
+    vt = []
+    va = []
+    for i in range(0,nadc):
+        va.append([])
+        
+    message(1,"Entering realtime plot")
+    message(1,"Close the graph window to exit")
+
+    #plt.ion()    
+    
+    fig=plt.figure(facecolor="white")   # White border
+    ax=fig.add_subplot(1,1,1)
+    pl.xlabel("time (s)")
+    pl.ylabel("Value (V)")
+    pl.title("Realtime Plot")
+    pl.grid()
+    
+    labels=[]
+    for i in range(0,nadc):
+        labels.append("ADC"+str(i+1))
+        
+    toffs=-1.0
+    try:    
+        while True:
+            t = time.time()
+            if toffs < 0.0:
+                toffs=t
+            t=t-toffs    
+            vt.append(t)
+            
+            for i in range(0,nadc):
+                value = readVoltage(i+1)
+                va[i].append(value)
+                
+            ax.cla()    
+            ax.grid()
+            pl.xlabel("time (s)")
+            pl.ylabel("Value (V)")
+            pl.title("Realtime Plot") 
+            
+            for i in range(0,nadc):
+                if nn:
+                    ax.plot(vt[-nn:-1], va[i][-nn:-1], label=labels[i])
+                else:
+                    ax.plot(vt, va[i], label=labels[i])
+                
+            if nadc>1:
+                pl.legend(loc='lower right')   
+            
+            fig.canvas.draw()
+            plt.pause(wt)
+               
+    except:
+        print()
+        print("End of realtime measurements")
+        print()
+
+    plt.close()
+
+    plot1n(vt,va,"Measurement Plot","time (s)","Value (V)",labels)   
+
+    if plotReturnData or returnData:
+        ret = vt
+        ret.extend(va)
+        return ret 
+    
+
+   
+################ PUBLIC BASIC TRANSIENT FUNCTIONS ####################    
+
+'''
+@setSampleTime@
+setSampleTime(st)
+Set sample time for time measurements
+Resolution on sample time is limited so value set 
+can be different of the input value
+Check your hardware board limits
+
+Required parameter:
+  st : Sample time (float seconds)
+  
+Returns real sample time set
+Included in slab.py   
+'''
+def setSampleTime(st):
+    global sampleTime
+    
+    # Check
+    if st > 100.0:
+        raise SlabEx("Sample time too high")
+    if st < 0.000005:  
+        raise SlabEx("Sample time too low") 
+        
+    startCommand('R')
+    sampleTime = sendFloat(st)
+    sendCRC()
+    
+    checkACK()
+    checkCRC()
+    
+    return sampleTime
+ 
+
+'''
+Set the timeout for a transient measurement
+The response comes after all samples have been taken
+Parameter:
+  extra : Additional board time before the sampling ends (s)
+          None if the board can wait forever
+          (Defaults to 0)
+'''
+def transientTimeout(extra=0.0):
+    samples = tranSamples
+    if samples == 0:
+        samples = buff_size
+    if extra is None:
+        applyTimeout(None)
+    else:
+        words = tranChannels + (1 if tranDigital else 0)
+        applyTimeout(commandTimeout(2*samples*words,
+                                    samples*sampleTime + extra))
+
+'''
+Receive the sample dump of a transient measurement
+It is called after the response code
+Parameters:
+      zero : Function that gets the number of samples and
+             returns the sample at time zero
+             (Defaults to the first sample)
+  channels : ADC of each analog vector
+             (Defaults to ADC1, ADC2...)
+       raw : Return ADC counts instead of calibrated voltages
+             (Defaults to False)
+Returns a list of vectors
+  Vector 0 is time
+  Next vectors are the ADC readings
+  Last vectors are the digital lines (0 or 1)
+'''
+def getTransientData(zero=None,channels=None,raw=False):
+    na = getByte()
+    nd = getByte()
+    samples = getU16()
+    if channels is None:
+        channels = range(1,na+1)
+    elif na != len(channels):
+        raise SlabEx("Internal Error: Only one ADC should be read")
+    tsample = 0 if zero is None else zero(samples)
+
+    result = []
+    if scipy:
+        result.append((np.arange(samples) - tsample)*sampleTime)
+        for channel in channels:
+            counts = getU16Block(samples)
+            if raw:
+                result.append(counts)
+            else:
+                ratio = counts/65536.0
+                result.append(dc_calVector(ratio,xcal,adcCalData[channel-1])*vref)
+        if nd:
+            # Bit n-1 of each word is line n
+            words = getU16Block(samples).astype('<u2')
+            bits = np.unpackbits(words.view(np.uint8).reshape(-1,2),
+                                 axis=1,bitorder='little')
+            for line in range(nd):
+                result.append(bits[:,line])
+        return result
+
+    result.append([(s - tsample)*sampleTime for s in range(samples)])
+    for channel in channels:
+        vector = []
+        for s in range(0,samples):
+            if raw:
+                vector.append(getU16())
+                continue
+            fvalue = dc_cal(getU16()/65536.0,xcal,adcCalData[channel-1])
+            vector.append(fvalue * vref)
+        result.append(vector)
+    if nd:
+        words = [getU16() for s in range(samples)]
+        for line in range(nd):
+            result.append([(word >> line) & 1 for word in words])
+    return result
+
+'''
+Name of one vector of a transient result
+Digital lines are the last vectors of the result
+Parameters:
+       i : Vector position (1 is the first ADC)
+  length : Number of vectors in the result
+'''
+def tranLabel(i,length):
+    na = length - 1 - tranDigital
+    if i <= na:
+        return adcNames[i-1]
+    return "DIO" + str(i-na)
+
+'''
+Check of storage space
+Gives exception if there is not enough space
+'''
+def checkBuffSpace(samples,na,nd=0):
+    # Assert
+    if nd < 0 or nd > ndio:
+        raise SlabEx("Invalid number of digital lines")
+        
+    # Calculate space    
+    # All digital lines use one extra word for each sample
+    space = buff_size - w_points - w_points2
+    if nd:
+        required = samples * (na + 1)
+    else:
+        required = samples * na 
+    if space < required:
+        raise SlabEx("Not enough buffer space. Only " + str(space) + " samples free")
+ 
+'''
+@setTransientStorage@
+setTransientStorage(samples,na,nd)
+Set storage for samples in transient time measurements
+Check your hardware board limits
+
+Required parameters:
+  samples : Number of samples to obtain
+  
+Optional parameters:  
+  na : Number of ADC analog signals to record
+       (Defaults to 1)
+  nd : Number of digital lines to record, from line 1
+       They need firmware v1.3 or later
+       (Defaults to 0)
+       
+Measurements return the digital lines as vectors of
+0 and 1 values after the ADC readings
+       
+Returns nothing
+Included in slab.py 
+
+This command has an alias tranStore
+'''    
+def setTransientStorage(samples,na=1,nd=0):
+    global tranSamples,tranChannels,tranDigital
+    if nd and firmwareVersion(board_name) < (1,3):
+        raise SlabEx("Board firmware does not support digital capture")
+    
+    # Check space
+    checkBuffSpace(samples,na,nd)
+    
+    startCommand('S')
+    sendByte(na)
+    sendByte(nd)
+    sendU16(samples)
+    sendCRC()
+    
+    checkACK()
+    checkCRC()
+    
+    # Store to compute transient timeouts
+    tranSamples = samples
+    tranChannels = na
+    tranDigital = nd
+   
+'''
+@tranStore@
+tranStore(samples,na,nd)
+Alias for the command setTransientStorage
+Included in slab.py 
+'''   
+def tranStore(samples,na=1,nd=0):
+    setTransientStorage(samples,na,nd)
+   
+'''
+@transientAsync@
+transientAsync()
+Performs an asynchronous transient measurement
+
+Returns a list of vectors
+  Vector 0 is time
+  Vectors 1 onward are ADC readings
+  Last vectors are the digital lines, if any
+  
+Included in slab.py  
+See also setSampleTime and setTransientStorage  
+'''   
+def transientAsync():
+
+    message(1,"Performing transient measurement..." )
+   
+    startCommand('Y')
+    sendCRC()
+    
+    transientTimeout()
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")
+    
+    message(1,"Mesurement ends. Receiving data")
+    
+    result = getTransientData()
+
+    checkCRC()    
+        
+    message(1,"Data received")
+        
+    return result    
+        
+'''
+@transientTriggered@
+transientTriggered(level,mode,timeout)
+Performs a triggered transient measurement
+Mesuremenst will be centered at the trigger point
+
+Required parameters:
+  level : Trigger level (float voltage)
+  
+Optional parameters:  
+   mode : Trigger mode (tmodeRise or tmodeFall)
+          (Defaults to tmodeRise)
+   timeout : Timeout in integer seconds (Defaults to no timeout)       
+   
+Returns a list of vectors
+  Vector 0 is time
+  Vectors 1 onward are ADC readings   
+  Last vectors are the digital lines, if any
+   
+Included in slab.py    
+See also setSampleTime and setTransientStorage     
+''' 
+def transientTriggered(level,mode=tmodeRise,timeout=0):
+    # Check timeout
+    timeout = int(timeout)
+    if timeout > 255:
+        raise SlabEx("Timeout limited to 255 seconds")
+    if timeout < 0:
+        raise SlabEx("Timeout cannot be negative")
+    # Trigger is on ADC1 so it must be stored
+    if tranChannels == 0:
+        raise SlabEx("Triggered measurements need at least one analog input")
+
+    # Convert level to uint16 considering calibration
+    ratio = voltage2ratio(level)
+    counts = ratio2counts(adcRawRatio(1,ratio))
+        
+    message(1,"Performing transient triggered measurement...")
+        
+    startCommand('G')
+    sendU16(counts)
+    sendByte(mode)
+    sendByte(timeout)
+    sendCRC()
+    
+    # Zero timeout waits forever for the trigger
+    if timeout == 0:
+        transientTimeout(None)
+    else:
+        transientTimeout(timeout)
+    
+    # Receive data
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")
+    if code == 2:
+        checkCRC();
+        raise SlabEx("Timeout error")
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")        
+
+    
+    message(1,"Mesurement ends. Receiving data")
+    
+    # Trigger is at the sample before the middle
+    result = getTransientData(lambda samples: samples / 2 - 1)
+
+    checkCRC()    
+        
+    message(1,"Data received")
+        
+    return result          
+    
+'''
+@stepResponse@
+stepResponse(v1,v2,t)
+Obtains the Step Response for a circuit
+  1/5 of measurement time will be before the step
+  4/5 of measurement time will be after the step
+  
+Required parameters:
+       v1 : Start voltage
+       v2 : End voltage
+       
+Optional parameters:       
+    tinit : Time before start in seconds (defaults to 1 s)
+    
+Returns a list of vectors
+  Vector 0 is time
+  Vectors 1 onward are ADC readings   
+  Last vectors are the digital lines, if any
+
+Included in slab.py   
+See also setSampleTime and setTransientStorage       
+'''   
+def stepResponse(v1,v2,tinit=1.0):
+    message(1,"Performing step response...")
+   
+    setVoltage(1,v1)
+    time.sleep(tinit)
+    counts = dacCounts(1,v2)
+    
+    readADC(1);  # Precharge ADC inputs
+    readADC(2);  # and discard the reading
+    readADC(3);
+    readADC(4);
+    
+    startCommand('P')
+    sendU16(counts)
+    sendCRC()
+    
+    # Receive data
+    transientTimeout()
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")           
+    
+    message(1,"Mesurement ends. Receiving data")
+    
+    # Step is at one fifth of the samples
+    result = getTransientData(lambda samples: samples / 5)
+        
+    checkCRC()
+
+    setVoltage(1,v1)
+    
+    message(1,"Data received")
+        
+    return result      
+        
+################## OVERSAMPLING ####################
+
+'''
+@Decimator@
+Decimator(factor,mode,order,taps)
+Lowpass filter and decimator for oversampled data
+Keeps its state between calls so long signals can be
+processed in consecutive blocks
+Uses scipy.signal if available
+
+Required parameter:
+  factor : Decimation factor
+
+Optional parameters:
+   mode : Filter type (Defaults to "cic")
+            "cic" : Cascaded integrator comb filter
+            "fir" : Windowed sinc filter
+  order : Number of CIC stages (Defaults to 3)
+   taps : Number of FIR taps (Defaults to 10*factor+1)
+
+Methods:
+  process(block) : Returns the decimated values of a block
+  reset()        : Clears the filter state
+
+Attributes:
+  delay : Filter delay in input samples
+   bits : Resolution gain in bits for white noise
+
+Returns the decimator object
+Included in slab.py
+'''
+class Decimator(object):
+
+    def __init__(self,factor,mode="cic",order=3,taps=0):
+        checkSciPy()
+        self.factor = int(factor)
+        if self.factor < 1:
+            raise SlabEx("Decimation factor must be at least 1")
+        if mode == "cic":
+            if order < 1:
+                raise SlabEx("CIC order must be at least 1")
+            # A CIC filter has the response of cascaded moving averages
+            box = np.ones(self.factor)
+            h = np.ones(1)
+            for i in range(int(order)):
+                h = np.convolve(h,box)
+        elif mode == "fir":
+            if taps < 1:
+                taps = 10*self.factor + 1
+            # Cutoff at the output Nyquist frequency
+            n = np.arange(taps) - (taps - 1)/2.0
+            h = np.sinc(n/self.factor)*np.blackman(taps)
+        else:
+            raise SlabEx("Unknown decimation filter mode")
+        self.taps = h/np.sum(h)
+        self.delay = (len(self.taps) - 1)/2.0
+        # Noise power gain of the filter
+        self.bits = max(0.0,-0.5*math.log(np.sum(self.taps**2),2))
+        try:
+            from scipy.signal import upfirdn
+        except ImportError:
+            upfirdn = None
+        self.upfirdn = upfirdn
+        self.reset()
+
+    def reset(self):
+        self.tail = None  # Last input samples
+        self.phase = 0    # Input samples before the next output
+
+    def process(self,block):
+        block = np.asarray(block,dtype=float)
+        nt = len(self.taps) - 1
+        if self.tail is None:
+            if len(block) == 0:
+                return np.zeros(0)
+            # Start as if the first value was always there
+            self.tail = np.full(nt,block[0])
+        x = np.concatenate((self.tail,block))
+        # Outputs end at x positions nt+phase, nt+phase+factor...
+        count = max(0,(len(x) - nt - self.phase + self.factor - 1)//self.factor)
+        if count == 0:
+            out = np.zeros(0)
+        elif self.upfirdn is not None:
+            # Polyphase filter only computes the needed outputs
+            pad = (-nt) % self.factor
+            data = np.concatenate((np.zeros(pad),x[self.phase:]))
+            first = (nt + pad)//self.factor
+            out = self.upfirdn(self.taps,data,down=self.factor)[first:first+count]
+        else:
+            out = np.convolve(x,self.taps,'valid')[self.phase::self.factor][:count]
+        self.phase = nt + self.phase + count*self.factor - len(x)
+        self.tail = x[len(x)-nt:]
+        return out
+
+'''
+@tranOversample@
+tranOversample(rate,samples,na,mode,order)
+Performs an oversampled asynchronous transient measurement
+The board samples at the fastest possible rate and
+the data is filtered and decimated to the requested rate
+This reduces the noise as it averages several readings
+for each output sample
+The effective resolution is shown after the measurement
+
+Sample time and storage are changed by this command
+
+Required parameters:
+     rate : Output sample rate (Hz)
+  samples : Number of output samples
+
+Optional parameters:
+     na : Number of ADC analog signals to record
+          (Defaults to 1)
+   mode : Decimation filter (Defaults to "cic")
+          See Decimator for the available filters
+  order : Order of the CIC filter (Defaults to 3)
+
+Returns a list of vectors
+  Vector 0 is time
+  Vectors 1 onward are ADC readings
+
+Included in slab.py
+See also Decimator
+'''
+def tranOversample(rate,samples,na=1,mode="cic",order=3):
+    checkSciPy()
+    if not opened:
+        raise SlabEx("Not connected to board")
+
+    # Fastest sample time for the analog channels
+    fastest = min_sample*na
+    factor = int(1.0/(rate*fastest))
+    while factor > 1 and quantizeFloat(1.0/(factor*rate)) < fastest:
+        factor = factor - 1
+    if factor < 1:
+        raise SlabEx("Sample rate too high for oversampling")
+    st = quantizeFloat(1.0/(factor*rate))
+    if st > max_sample:
+        raise SlabEx("Sample rate too low")
+
+    # Skip the outputs that use data before the capture
+    decimators = [Decimator(factor,mode,order) for i in range(na)]
+    skip = int(math.ceil((len(decimators[0].taps) - 1.0)/factor))
+    raw = (samples + skip)*factor
+    space = buff_size - w_points - w_points2
+    if raw*na > space:
+        raise SlabEx("Not enough buffer space. Only "
+                     + str(space//(na*factor) - skip) + " output samples fit")
+
+    message(1,"Oversampling " + str(factor) + " times")
+    setSampleTime(st)
+    setTransientStorage(raw,na)
+    data = transientAsync()
+
+    # Time at the center of each output filter
+    delay = decimators[0].delay
+    result = [(np.arange(skip,skip+samples)*factor - delay)*st]
+    for i in range(na):
+        result.append(decimators[i].process(data[i+1])[skip:skip+samples])
+
+    bits = decimators[0].bits
+    message(1,"Effective resolution " + "{:.1f}".format(adc_bits + bits)
+            + " bits (" + "{:.1f}".format(bits) + " bits gain)")
+    return result
+
+################## PUBLIC AC PLOT FUNCTIONS ####################        
+
+'''
+@tranAsyncPlot@
+tranAsyncPlot(returnData)
+Plots an asynchronous transient measurement
+
+Optional parameter:
+  returnData : Enable return of plot data (Defaults to False)
+
+Returns plot data if enabled
+  Vector 0 is time
+  Vectors 1 onward are ADC readings
+  Last vectors are the digital lines, if any
+
+Included in slab.py   
+See also setSampleTime, setTransientStorage and setPlotReturnData
+'''
+def tranAsyncPlot(returnData=False):
+
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform measurement
+    res = transientAsync()
+    # Plot result
+    message(1,"Drawing curves")
+    plt.figure(facecolor="white")   # White border
+    for i in range(1,len(res)):
+        if (len(res) == 2):
+            # Only one plot
+            pl.plot(res[0],res[i])
+        else:    
+            # More than one plot
+            pl.plot(res[0],res[i],label=tranLabel(i,len(res)))
+    pl.xlabel("Time (s)")
+    pl.ylabel("Voltage (V)")
+    pl.title("Async Transient Plot")
+    if (len(res) > 2):
+        # More than one plot
+        pl.legend(loc='lower right')        
+    pl.grid()
+    showPlot()
+    
+    if plotReturnData or returnData:
+        return res    
+
+'''
+@tranTriggeredPlot@
+tranTriggeredPlot(level,mode,timeout,returnData)
+Plots a triggered transient measurement
+Mesuremenst will be centered at the trigger point
+
+Required parameters:
+  level : Trigger level (float voltage)
+  
+Optional parameters:  
+   mode : Trigger mode (tmodeRise or tmodeFall)
+          (Defaultst to tmodeRise)
+   timeout : Timeout in integer seconds (Defaults to no timeout)           
+   returnData : Enable return of plot data (Defaults to False)
+   
+Returns plot data if enabled
+  Vector 0 is time
+  Vectors 1 onward are ADC readings   
+  Last vectors are the digital lines, if any
+
+Included in slab.py   
+See also setSampleTime, setTransientStorage and setPlotReturnData
+'''
+def tranTriggeredPlot(level,mode=tmodeRise,timeout=0,returnData=False):
+
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform measurement
+    res = transientTriggered(level,mode,timeout)
+    # Plot result
+    message(1,"Drawing curves")
+
+    plt.figure(facecolor="white")   # White border
+    for i in range(1,len(res)):
+        if (len(res) == 2):
+            # Only one plot
+            pl.plot(res[0],res[i])
+        else:    
+            # More than one plot
+            pl.plot(res[0],res[i],label=tranLabel(i,len(res)))
+    pl.xlabel("Time (s)")
+    pl.ylabel("Voltage (V)")
+    pl.title("Transient Triggered Plot")
+    if (len(res) > 2):
+        # More than one plot
+        pl.legend(loc='lower right')        
+    pl.grid()
+    showPlot()
+    
+    if plotReturnData or returnData:
+        return res    
+
+'''
+@stepPlot@  
+stepPlot(v1,v2,tinit,returnData)  
+Plots the Step Response for a circuit
+  1/5 of measurement time will be before the step
+  4/5 of measurement time will be after the step
+  
+Required parameters:
+  v1 : Start voltage
+  v2 : End voltage
+       
+Optional parameters:       
+  tinit : Time before start in seconds (defaults to 1 s)
+  returnData : Enable return of plot data (Defaults to False)
+    
+Returns plot data if enabled (see setPlotReturnData) 
+  Vector 0 is time
+  Vectors 1 onward are ADC readings   
+  Last vectors are the digital lines, if any
+
+Included in slab.py   
+See also setSampleTime, setTransientStorage and setPlotReturnData
+'''
+def stepPlot(v1,v2,tinit=1.0,returnData=False):
+
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform measurement
+    res = stepResponse(v1,v2,tinit)
+    # Plot result
+    message(1,"Drawing curves")
+    plt.figure(facecolor="white")   # White border
+    for i in range(1,len(res)):
+        if (len(res) == 2):
+            # Only one plot
+            pl.plot(res[0],res[i])
+        else:    
+            # More than one plot
+            pl.plot(res[0],res[i],label=tranLabel(i,len(res)))
+    pl.xlabel("Time (s)")
+    pl.ylabel("Voltage (V)")
+    pl.title("Step Response Plot")
+    if (len(res) > 2):
+        # More than one plot
+        pl.legend(loc='lower right')        
+    pl.grid()
+    showPlot()
+    
+    if plotReturnData or returnData:
+        return res    
+ 
+################## WAVETABLE COMMANDS #################
+
+'''
+@loadWavetable@
+loadWavetable(list,second=False)
+Load one wavetable on the hardware board
+Loading a primary wavetable erases the secondary if present
+
+Required parameters:
+  list : List of values of the wavetable
+         If empty [] the wavetable will be erased
+    
+Optional parameters:
+  second : Load secondary wavetable for DAC2
+           (Defaults to false)    
+
+Included in slab.py            
+Returns nothing
+'''
+def loadWavetable(list,second=False): 
+    global w_idle,w_idle2,w_points,w_points2
+
+    # Get list size
+    size = len(list)
+        
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")    
+    if size > buff_size :
+        raise SlabEx("Wavetable too big")
+        
+    # Additional check for secondary wavetable
+    if second:
+        if size > buff_size - w_points:
+            raise SlabEx("Not enough space for secondary wavetable")
+            
+    # The secondary wavetable goes to DAC2
+    channel = 2 if second else 1
+        
+    # Convert all values to counts before sending anything
+    if scipy:
+        counts = dacCounts(channel,np.asarray(list,dtype=float))
+    else:
+        counts = [dacCounts(channel,value) for value in list]
+        
+    # Update wavetable information
+    if not second:
+        w_points = size      # Size of main wavetable
+        if size > 0:         # Iddle value (Volt) 
+            w_idle = list[0]    
+        else:
+            w_idle = -1        
+        w_idle2 = -1         # Eliminate secondary wavetable
+        w_points2 = 0
+        code = 'W'
+    else:
+        w_points2 = size     # Size of secondary wavetable
+        if size > 0:
+            w_idle2 = list[0]    # Iddle value (Volt)
+        else:
+            w_idle2 = -1
+        code = 'w'
+        
+    # Send the full command in one write    
+    low,high = splitU16(size)
+    sendFrame(code,[low,high],counts)
+    
+    checkACK()
+    checkCRC()    
+        
+    if not second and size > 0:    
+        # Inform on frequency only on main wave
+        fmax = 1.0/(w_points * min_sample)
+        fmin = 1.0/(w_points * max_sample)
+        message(1,str(w_points) + " point wave loaded")
+        message(1,"Wave frequency must be between " + "{:.6f}".format(fmin) + " and " + "{:.2f}".format(fmax) + " Hz")
+        frequency = 1.0 /(sampleTime * w_points)
+        message(1,"Current frequency is " + str(frequency) + " Hz")
+        
+    # Inform on space
+    space = buff_size - w_points - w_points2
+    message(1,"Remaining buffer space is " + str(space) + " samples")
+ 
+'''
+@waveSquare@
+waveSquare(v1,v2,npoints,returnList,second)
+Loads square wavetable omn the hardware board
+
+Required parameters:
+       v1 : Start value
+       v2 : End value
+  npoints : Number of points for a full wave
+    
+Optional parameters:    
+ returnList : Request a return list (Default False)
+     second : Load on secondary table
+              (Defaults to false) 
+               
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+''' 
+def waveSquare(v1,v2,npoints,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+        
+    # Create wave
+    if scipy:
+        point = np.arange(npoints)
+        list = np.where(point < npoints/2.0,1.0*v1,1.0*v2)
+    else:
+        list = []
+        for point in range(0,npoints):
+            if point < npoints/2.0:
+                list.append(v1)
+            else:
+                list.append(v2)
+            
+    # Program wave 
+    loadWavetable(list,second)
+    
+    # Return list
+    if returnList:
+        return list
+
+'''
+@wavePulse@
+wavePulse(v1,v2,npoints,n1,returnList,second)
+Loads a pulse wavetable on the hardware board
+
+Parameters:
+       v1 : Start value
+       v2 : End value
+  npoints : Number of points for a full wave 
+       n1 : Number of points at v1
+           
+Optional parameters:    
+ returnList : Request a return list (Default False)
+     second : Load on secondary table
+              (Defaults to false)   
+              
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+''' 
+def wavePulse(v1,v2,npoints,n1,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+        
+    # Create wave
+    if scipy:
+        point = np.arange(npoints)
+        list = np.where(point < n1,1.0*v1,1.0*v2)
+    else:
+        list = []
+        for point in range(0,npoints):
+            if point < n1:
+                list.append(v1)
+            else:
+                list.append(v2)
+            
+    # Program wave 
+    loadWavetable(list,second)    
+    
+    # Return list
+    if returnList:
+        return list
+    
+'''
+@waveTriangle@
+waveTriangle(v1,v2,npoints,returnList,second)
+Loads a triangle wavetable on the hardware board
+
+Parameters:
+       v1 : Minimum value
+       v2 : Maximum value
+  npoints : Number of points for a full wave 
+           
+Optional parameters:    
+ returnList : Request a return list (Default False)
+     second : Load on secondary table
+              (Defaults to false)   
+              
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+'''
+def waveTriangle(v1,v2,npoints,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+
+    # Create wave
+    if scipy:
+        point = (np.arange(npoints) + npoints//4) % npoints
+        rise = v1 + 2.0*(v2-v1)*point/npoints
+        fall = v1 + 2.0*(v2-v1)*(npoints - point)/npoints
+        list = np.where(point < npoints/2.0,rise,fall)
+    else:
+        list = []
+        for point in range(0,npoints):
+            point = (point + npoints//4) % npoints
+            if point < npoints/2.0:
+                value = v1 + 2.0*(v2-v1)*point/npoints
+            else:
+                value = v1 + 2.0*(v2-v1)*(npoints - point)/npoints
+            list.append(value)
+        
+    # Program wave 
+    loadWavetable(list,second)  
+
+    # Return list
+    if returnList:
+        return list
+    
+'''
+@waveSawtooth@
+waveSawtooth(v1,v2,npoints,returnList,second)
+Loads a sawtooth wavetable on the hardware board
+
+Parameters:
+       v1 : Start value
+       v2 : End value
+  npoints : Number of points for a full wave 
+           
+Optional parameters:    
+ returnList : Request a return list (Default False)
+     second : Load on secondary table
+              (Defaults to false)     
+   
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+'''
+def waveSawtooth(v1,v2,npoints,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+        
+    # Create wave
+    if scipy:
+        list = v1*1.0 + (v2*1.0-v1*1.0)*np.arange(npoints)/npoints
+    else:
+        list = []
+        for point in range(0,npoints):
+            value = v1*1.0 + (v2*1.0-v1*1.0)*point/npoints
+            list.append(value)
+        
+    # Program wave 
+    loadWavetable(list,second) 
+
+    # Return list
+    if returnList:
+        return list   
+
+'''
+@waveSine@
+waveSine(v1,v2,npoints,phase,returnList,second)
+
+Generates a sine wavetable
+Parameters:
+       v1 : Minimum value
+       v2 : Maximum value
+  npoints : Number of points for a full wave 
+           
+Optional parameters:    
+      phase : Phase of the signal (deg) (Defaults to 0)
+ returnList : Request a return list (Default False)
+     second : Load on secondary table
+              (Defaults to false)     
+   
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+'''
+def waveSine(v1,v2,npoints,phase=0.0,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+
+    # Create wave
+    phase = phase*math.pi/180.0
+    mean = (v1 + v2)/2.0
+    amplitude = (v2 - v1)/2.0
+    if scipy:
+        angle = 2.0*math.pi*np.arange(npoints)/npoints+phase
+        list = mean + amplitude*np.sin(angle)
+    else:
+        list = []
+        for point in range(0,npoints):
+            value = mean + amplitude*math.sin(2.0*math.pi*point/npoints+phase)
+            list.append(value)
+        
+    # Program wave 
+    loadWavetable(list,second)  
+
+    # Return list
+    if returnList:
+        return list     
+ 
+'''
+@waveCosine@
+waveCosine(v1,v2,npoints,returnList,second)
+
+Generates a cosine wavetable
+Parameters:
+       v1 : Minimum value
+       v2 : Maximum value
+  npoints : Number of points for a full wave 
+           
+Optional parameters:    
+       phase : Phase of the signal (deg) (Defaults to 0)
+  returnList : Request a return list (Default False)
+      second : Load on secondary table
+               (Defaults to false)     
+   
+If returnList is True, returns the table of loaded values
+The table is a NumPy array if SciPy is loaded
+Included in slab.py 
+'''
+def waveCosine(v1,v2,npoints,phase=0.0,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if npoints < 4:
+        raise SlabEx("Not enough points for wave")
+
+    # Create wave
+    phase = phase*math.pi/180.0
+    mean = (v1 + v2)/2.0
+    amplitude = (v2 - v1)/2.0
+    if scipy:
+        angle = 2.0*math.pi*np.arange(npoints)/npoints+phase
+        list = mean + amplitude*np.cos(angle)
+    else:
+        list = []
+        for point in range(0,npoints):
+            value = mean + amplitude*math.cos(2.0*math.pi*point/npoints+phase)
+            list.append(value)
+        
+    # Program wave 
+    loadWavetable(list,second)  
+
+    # Return list
+    if returnList:
+        return list  
+        
+'''
+@waveNoise@
+waveNoise(vm,vstd,n,returnList,second)
+
+Generates a noise wavetable
+Based on a normal distribution
+Samples are truncated between 0 and Vref
+
+Parameters:
+    vm : Mean value
+  vstd : Standard deviation
+     n : Number of points
+           
+Optional parameters:    
+   returnList : Request a return list (Default False)
+       second : Load on secondary table
+                (Defaults to false)     
+   
+If returnList is True, returns the table of loaded values
+Included in slab.py 
+'''
+def waveNoise(vm,vstd,n,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if n < 4:
+        raise SlabEx("Not enough points for wave")
+
+    # Create wave
+    list = np.random.normal(loc=vm,scale=vstd,size=n)
+    list = np.clip(list,0.0,vref)
+        
+    # Program wave 
+    loadWavetable(list,second)  
+
+    # Return list
+    if returnList:
+        return list          
+ 
+'''
+@waveRandom@
+waveRandom(v1,v2,n,returnList,second)
+
+Generates a random wavetable
+Based on a uniform distribution
+Samples will be random values between v1 and v2
+
+Parameters:
+   v1 : Minimum voltage
+   v2 : Maximum voltage
+    n : Number of points
+           
+Optional parameters:    
+   returnList : Request a return list (Default False)
+       second : Load on secondary table
+                (Defaults to false)     
+   
+If returnList is True, returns the table of loaded values
+Included in slab.py 
+'''
+def waveRandom(v1,v2,n,returnList=False,second=False):
+    # Check
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if n < 4:
+        raise SlabEx("Not enough points for wave")
+    if v1 >= v2 :
+        raise SlabEx("v1 must be lower than v2")
+
+    # Create wave
+    list = v1 + (v2-v1)*np.random.random(size=n)
+        
+    # Program wave 
+    loadWavetable(list,second)  
+
+    # Return list
+    if returnList:
+        return list   
+ 
+'''
+@setWaveFrequency@
+setWaveFrequency(freq)
+Set wave frequency by changing sample frequency 
+
+Required parameters:
+   freq : Wave frequency in Hz
+   
+Return sampleTime set
+Included in slab.py 
+'''   
+def setWaveFrequency(freq):
+    # Checks
+    if freq <= 0.0:
+        raise SlabEx("Frequency cannot be negative or zero")
+    if w_idle == -1:
+        raise SlabEx("No wave loaded")
+    # Calculate sample time
+    st = 1.0/(w_points * freq)
+    if st < min_sample:
+        raise SlabEx("Frequency too high")
+    if st > max_sample:
+        raise SlabEx("Frequency too low")
+    # Change sample time
+    st = setSampleTime(st)
+    frequency = 1/(st * w_points)
+    message(1,"Sample time set to " +str(st) + " s")
+    message(1,"Wave frequency set to " +str(frequency) + " Hz")
+    return st
+
+'''
+@wavePlan@
+wavePlan(freq,cycles,na,space,minpoints)
+Plans the wavetable size and sample time for a wave frequency
+The sample time is quantized exactly as the board will
+receive it so the real frequency is known in advance
+
+The plan minimizes the frequency error. Plans with the same
+error are sorted by capture time and then the biggest table
+is selected
+
+Required parameters:
+   freq : Wave frequency in Hz
+   
+Optional parameters:
+     cycles : Wave cycles to capture (Defaults to 1)
+         na : Number of ADC channels to capture (Defaults to 1)
+      space : Buffer space for wavetable and samples
+              (Defaults to all the buffer as a new primary
+               wavetable frees the previous ones)
+  minpoints : Minimum number of wave points (Defaults to 4)
+
+Returns a tuple with:
+  Number of wavetable points
+  Number of samples to capture on each channel
+  Sample time
+  Real wave frequency
+  
+The plan can be used with setSampleTime and setTransientStorage
+Included in slab.py 
+'''
+def wavePlan(freq,cycles=1,na=1,space=-1,minpoints=4):
+    # Checks
+    if freq <= 0.0:
+        raise SlabEx("Frequency cannot be negative or zero")
+    if cycles <= 0.0:
+        raise SlabEx("Cycles must be positive")
+    if na < 1:
+        raise SlabEx("At least one ADC channel is needed")
+    if space == -1:
+        if not opened:
+            raise SlabEx("Not connected to board")
+        space = buff_size
+        
+    # Table sizes that fit in the buffer     
+    nmax = int(space/(1.0 + cycles*na))
+    # Table sizes that give a valid sample time
+    nmax = min(nmax,int(1.0/(freq*min_sample))+1)
+    nmin = max(minpoints,int(1.0/(freq*max_sample)))
+    
+    best = None
+    for n in range(nmin,nmax+1):
+        samples = int(round(cycles*n))
+        if samples < 1 or n + samples*na > space:
+            continue
+        st = quantizeFloat(1.0/(n*freq))
+        if st < min_sample or st > max_sample:
+            continue
+        frequency = 1.0/(st*n)
+        error = abs(frequency-freq)/freq
+        # Rounding removes float noise from the comparisons
+        key = (round(error,9),round(samples*st,9),-n)
+        if best is None or key < best[0]:
+            best = (key,(n,samples,st,frequency))
+            
+    if best is None:
+        raise SlabEx("No valid plan for this frequency")
+    return best[1]
+    
+    
+ 
+################## WAVE RESPONSE COMMANDS ################# 
+ 
+'''
+@waveResponse@
+waveResponse(npre,tinit,dual,raw)
+Obtain the response of a circuit against a wave
+
+Measurement sequence:
+  1) Set DAC1 to first wave sample during tinit
+  2) Send npre waves to DAC1
+  3) Start measurement as set on setTransientStorage
+     During this time wave continues to be generated
+
+Optional parameters:  
+  npre : Number of waves before measurement (default to zero)
+ tinit : Time iddle before first wave (default to zero)
+  dual : Use dual DAC generation (defaults to False)
+   raw : Return ADC counts instead of voltages (defaults to False)
+ 
+Returns a list of vectors:
+  Vector 0 is time
+  Vectors 1 onward are ADC readings          
+  Last vectors are the digital lines, if any
+      
+Included in slab.py       
+See also setWaveFrequency and setTransientStorage
+''' 
+def waveResponse(npre = 0,tinit = 1.0,dual=False,raw=False):
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")  
+    if npre < 0:
+        raise SlabEx("Invalid number of waves")
+    if w_idle < 0:
+        raise SlabEx("Wavetable not loaded")
+    if dual and w_idle2 < 0:
+        raise SlabEx("Secondary wavetable not loaded")
+
+    message(1,"Performing wave measurement...")
+        
+    # Idle start
+    if tinit > 0.0:
+        setVoltage(1,w_idle)
+        if dual:
+            setVoltage(2,w_idle2)
+        time.sleep(tinit)
+      
+    # Send command
+    if not dual:
+        startCommand('V')
+    else:
+        startCommand('v')
+    sendU16(npre)
+    sendCRC()
+    
+    transientTimeout(npre*w_points*sampleTime)
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")          
+        
+    message(1,"Mesurement ends. Receiving data")    
+        
+    result = getTransientData(raw=raw)
+        
+    checkCRC()    
+
+    # Return to iddle
+    setVoltage(1,w_idle)  
+    
+    message(1,"Data received")
+        
+    return result    
+ 
+'''
+@singleWaveResponse@
+singleWaveResponse(channel,npre,tinit,raw)
+Obtain the response of a circuit against a wave
+Response is obtained only on the selected channel
+regardless of the setting on setTransientStorage
+
+Measurement sequence:
+  1) Set DAC1 to first wave sample during tinit
+  2) Send npre waves to DAC1
+  3) Start measurement as set on setTransientStorage
+     During this time wave continues to be generated
+
+Optional parameters: 
+ channel : ADC channel to read (default to 1)
+    npre : Number of waves before measurement (default to zero)
+   tinit : Time iddle before first wave (default to zero)
+     raw : Return ADC counts instead of voltages (default to False)
+ 
+Returns a list of two:
+  Vector 0 is time
+  Vectors 1 is ADC readings          
+      
+Included in slab.py       
+See also setWaveFrequency and setTransientStorage
+''' 
+def singleWaveResponse(channel = 1,npre = 0,tinit = 1.0,raw=False):
+
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")  
+    if npre < 0:
+        raise SlabEx("Invalid number of waves")
+    if channel < 1 or channel > 4:
+        raise SlabEx("Invalid channel number")
+    if w_idle < 0:
+        raise SlabEx("Wavetable not loaded")
+
+    message(1,"Performing wave measurement at ADC " + str(channel) + " ...")
+            
+    # Idle start
+    if tinit > 0.0:
+        setVoltage(1,w_idle)
+        time.sleep(tinit)
+      
+    # Send command
+    startCommand('X')
+    sendByte(channel)
+    sendU16(npre)
+    sendCRC()
+    
+    transientTimeout(npre*w_points*sampleTime)
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")          
+        
+    message(1,"Mesurement ends. Receiving data")    
+        
+    result = getTransientData(channels=[channel],raw=raw)
+        
+    checkCRC()    
+
+    # Return to iddle
+    setVoltage(1,w_idle)  
+    
+    message(1,"Data received")
+        
+    return result  
+ 
+'''
+@waveAverage@
+waveAverage(n,snr,channel,npre,tinit,dual)
+Obtain the mean response of a circuit against a wave
+Repeats a wave measurement up to n times and averages
+the ADC counts of all captures
+As every capture starts in sync with the wave, noise
+power in the mean decreases as 1/n
+
+Required parameter:
+     n : Maximum number of captures
+
+Optional parameters:
+     snr : Stop when the mean reaches this SNR in dB
+           Measured on the first ADC vector
+           Zero captures always n waves (default to zero)
+ channel : ADC channel to read as in singleWaveResponse
+           Zero reads the channels set on setTransientStorage
+           as in waveResponse (default to zero)
+    npre : Number of waves before measurement (default to zero)
+   tinit : Time iddle before first wave (default to one)
+    dual : Use dual DAC generation (defaults to False)
+           Not available if channel is not zero
+
+Returns a tuple of two lists of vectors:
+  Mean response as returned by waveResponse
+  Variance of each sample among captures (V^2)
+    Vector 0 is time
+    Next vectors are the variance of each mean vector
+  The variance of each mean value is the variance
+  divided by the number of captures
+
+Digital lines give the fraction of captures where
+the line was 1
+
+Requires SciPy
+Included in slab.py
+See also waveResponse and singleWaveResponse
+'''
+def waveAverage(n,snr=0.0,channel=0,npre=0,tinit=1.0,dual=False):
+    checkSciPy()
+    if n < 1:
+        raise SlabEx("Invalid number of captures")
+    if channel and dual:
+        raise SlabEx("Dual generation needs channel zero")
+
+    # Integer accumulators of counts and squared counts
+    acc = None
+    acc2 = None
+    count = 0
+    ratio = 0.0
+    while count < n:
+        if channel:
+            data = singleWaveResponse(channel,npre,tinit,raw=True)
+        else:
+            data = waveResponse(npre,tinit,dual,raw=True)
+        if acc is None:
+            time_vector = data[0]
+            acc = [np.zeros(len(v),dtype=np.int64) for v in data[1:]]
+            acc2 = [np.zeros(len(v),dtype=np.int64) for v in data[1:]]
+        for i,vector in enumerate(data[1:]):
+            vector = np.asarray(vector,dtype=np.int64)
+            acc[i] += vector
+            acc2[i] += vector*vector
+        count = count + 1
+
+        # Early stop when the mean has enough SNR
+        if count > 1:
+            var = (acc2[0] - acc[0]*acc[0]/float(count))/(count-1)
+            noise = np.mean(var)/count
+            signal = np.var(acc[0]/float(count)) - noise
+            if noise > 0.0 and signal > 0.0:
+                ratio = 10.0*math.log10(signal/noise)
+            if snr > 0.0 and noise > 0.0 and ratio >= snr:
+                break
+
+    # Analog vectors go first
+    if channel:
+        channels = [channel]
+    else:
+        channels = range(1,len(acc)-tranDigital+1)
+
+    mean = [time_vector]
+    variance = [time_vector]
+    for i in range(len(acc)):
+        counts = acc[i]/float(count)
+        if count > 1:
+            var = (acc2[i] - acc[i]*counts)/(count-1)
+        else:
+            var = np.zeros(len(counts))
+        if i < len(channels):
+            # Convert using the slope of the calibration curve
+            cal = adcCalData[channels[i]-1]
+            value = dc_calVector(counts/65536.0,xcal,cal)*vref
+            step = 1.0/65536.0
+            slope = (dc_calVector(counts/65536.0+step,xcal,cal)
+                   - dc_calVector(counts/65536.0-step,xcal,cal))*vref/2.0
+            mean.append(value)
+            variance.append(var*slope*slope)
+        else:
+            mean.append(counts)
+            variance.append(var)
+
+    message(1,"Averaged " + str(count) + " captures")
+    if count > 1:
+        message(1,"SNR of mean: " + "{:.1f}".format(ratio) + " dB")
+
+    return mean,variance
+
+'''
+@wavePlay@
+wavePlay(n,tinit,dual)
+Generates wave withou measuring
+
+Generation sequence:
+  1) Set DAC1 to first wave sample during tinit
+  2) Send n waves to DAC1
+
+Optional parameters:  
+     n : Number of waves to send (default to one)
+           Zero means infinite (Use HALT to end)
+ tinit : Time iddle before first wave (default to zero)
+  dual : Use dual DAC generation (defaults to False)
+
+Returns nothing  
+Included in slab.py 
+      
+See also setWaveFrequency
+''' 
+def wavePlay(n = 1,tinit = 1.0,dual=False):
+    # Checks
+    if not opened:
+        raise SlabEx("Not connected to board")  
+    if n < 0:
+        raise SlabEx("Invalid number of waves")
+    if w_idle < 0:
+        raise SlabEx("Wavetable not loaded")
+    if dual and w_idle2 < 0:
+        raise SlabEx("Secondary wavetable not loaded")
+
+    message(1,"Sending wave...")
+        
+    # Idle start
+    if tinit > 0.0:
+        setVoltage(1,w_idle)
+        if dual:
+            setVoltage(2,w_idle2)
+        time.sleep(tinit)
+      
+    # Send command
+    if not dual:
+        startCommand('Q')
+    else:
+        startCommand('q')
+    sendU16(n)
+    sendCRC()
+    
+    # Zero waves play until halted
+    if n == 0:
+        applyTimeout(None)
+    else:
+        applyTimeout(commandTimeout(0,n*w_points*sampleTime))
+    checkACK()
+    
+    # Check for overrun or other errors
+    code = getByte()
+    if code == 1:
+        checkCRC()
+        raise SlabEx("Sample overrun")     
+    if code == 3:
+        checkCRC()
+        raise SlabEx("Halt from board")
+    if code != 0: 
+        raise SlabEx("Unknown transient response code")          
+        
+    message(1,"Wave play ends")    
+            
+    checkCRC()    
+
+    # Return to iddle
+    setVoltage(1,w_idle)  
+  
+ 
+'''
+@wavePlot@
+wavePlot(npre,tinit,dual,returnData)
+Plot the response of a circuit against a wave
+
+Measurement sequence:
+  1) Set DAC1 to first wave sample during tinit
+  2) Send npre waves to DAC1
+  3) Start measurement as set on setTransientStorage
+     During this time wave continues to be generated
+
+Optional parameters:  
+ npre : Number of waves before measurement (default to zero)
+ tinit : Time iddle before first wave (default to zero)
+ dual : Generate waves on both dacs (defaults to False)
+ returnData : Enables return of plot data (defaults to False)
+ 
+Returns plot data if enabled
+  Vector 0 is time
+  Vectors 1 onward are ADC readings          
+  Last vectors are the digital lines, if any
+      
+Included in slab.py       
+See also setWaveFrequency, setTransientStorage and setPlotReturnData
+'''     
+def wavePlot(n = 0,tinit = 1.0,dual=False,returnData=False):
+
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform measurement
+    res = waveResponse(n,tinit,dual)
+    
+    # Plot result
+    message(1,"Drawing curves")
+    plt.figure(facecolor="white")   # White border
+    for i in range(1,len(res)):
+        if (len(res) == 2):
+            # Only one plot
+            pl.plot(res[0],res[i])
+        else:    
+            # More than one plot
+            pl.plot(res[0],res[i],label=tranLabel(i,len(res)))
+    pl.xlabel("Time (s)")
+    pl.ylabel("Voltage (V)")
+    pl.title("Wave Response Plot")
+    if (len(res) > 2):
+        # More than one plot
+        pl.legend(loc='best')        
+    pl.grid()
+    showPlot()
+    
+    if plotReturnData or returnData:
+        return res           
+        
+'''
+@singleWavePlot@
+singleWavePlot(channel,npre,tinit,returnData)
+Plot the response of a circuit against a wave
+Response is obtained only on the selected channel
+regardless of the setting on setTransientStorage
+
+Measurement sequence:
+  1) Set DAC1 to first wave sample during tinit
+  2) Send npre waves to DAC1
+  3) Start measurement as set on setTransientStorage
+     During this time wave continues to be generated
+
+Optional parameters:  
+ channel : ADC channel to use (defaults to 1)
+ npre : Number of waves before measurement (default to zero)
+ tinit : Time iddle before first wave (default to zero)
+ returnData : Enables return of plot data (defaults to False)
+ 
+Returns plot data if enabled 
+  Vector 0 is time
+  Vectors 1 onward are ADC readings          
+      
+Included in slab.py       
+See also setWaveFrequency, setTransientStorage and setPlotReturnData
+'''     
+def singleWavePlot(channel=1,n=0,tinit = 1.0,returnData=False):
+
+    if not scipy:
+        cannotPlot(exception=True)
+        return
+
+    # Perform measurement
+    res = singleWaveResponse(channel,n,tinit)
+    
+    # Plot result
+    message(1,"Drawing curve")
+    plt.figure(facecolor="white")   # White border
+    pl.plot(res[0],res[1])
+    pl.xlabel("Time (s)")
+    pl.ylabel("Voltage (V)")
+    pl.title("Single Wave Response Plot")      
+    pl.grid()
+    showPlot()
+    
+    if plotReturnData or returnData:
+        return res              
+     
+################## CALCULATIONS WITH VECTORS ###################
+
+'''
+@highPeak@
+highPeak(vector)
+Returns the maximum of a vector
+Included in slab.py 
+'''
+def highPeak(vector):
+    value = max(vector)
+    return value
+    
+'''
+@lowPeak@
+lowPeak(vector)
+Returns the minimum of a vector
+Included in slab.py 
+'''   
+def lowPeak(vector):
+    value = min(vector)    
+    return value
+
+'''
+@peak2peak@
+peak2peak(vector)
+Returns the maximum to minimum difference of a vector
+Included in slab.py 
+'''     
+def peak2peak(vector):
+    value = max(vector)-min(vector)
+    return value
+    
+'''
+@mean@
+mean(vector)
+Returns the mean value of a vector
+Included in slab.py 
+'''     
+if scipy:   
+    def mean(vector):
+        return np.mean(vector)    
+    
+'''
+@halfRange@
+halfRange(vector)
+Returns the average between maximum and minimum of a vector
+Included in slab.py 
+'''  
+def halfRange(vector):  
+    return (max(vector)+min(vector))/2.0
+    
+'''
+@rms@
+rms(vector)
+Returns the RMS value of a vector
+Included in slab.py 
+''' 
+if scipy:   
+    def rms(vector):
+        return np.sqrt(np.mean(vector*vector))
+    
+'''
+@std@
+std(vector)
+Returns the standard deviation of a vector
+Included in slab.py 
+''' 
+if scipy:   
+    def std(vector):
+        return np.std(vector)
+   
+  
+'''
+@softReset@
+softReset()
+Generates a soft reset on the hardware board
+Board state is set to reset condition
+Returns nothing
+Included in slab.py 
+'''   
+def softReset():
+    global sampleTime
+    global w_idle,w_points,w_idle2,w_points2
+
+    # Send Command
+    startCommand('E')
+    sendCRC()
+    checkACK()
+    checkCRC()
+    
+    # Syncronize state
+    sampleTime = 0.001  # Default sample time of 1ms
+    w_idle = -1         # No wave loaded
+    w_points = 0 
+    w_idle2 = -1        # No secondary table loaded
+    w_points2 = 0
+    dcroundings = 10    # Default of 10 readings on DC
+    
+    # Generate message
+    message(1,"Hardware board at reset state")
+   
+################## DC DIGITAL IO ##############################
+
+'''
+@dioMode@
+dioMode(line,mode)
+Configures a digital I/O line mode
+
+Possible modes are:
+      mInput : Normal input mode
+     mPullUp : Input with Pull Up
+   mPullDown : Input with Pull Down
+     mOutput : Output Push Pull
+  mOpenDrain : Output with Open Drain
+  
+Modes use the slab namespace
+
+Required parameter:
+  line : Line to configure
+  
+Optional parameter:
+  mode : Mode to configure (Defaults to mInput)
+
+Returns nothing  
+Included in slab.py 
+'''
+def dioMode(line,mode=mInput):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if line < 1 or line > ndio:
+        raise SlabEx("Invalid digital I/O line")
+    startCommand('H')
+    sendByte(line)
+    sendByte(mode)
+    sendCRC()
+    checkACK()
+    checkCRC()
+    
+'''
+@dioWrite@
+dioWrite(line,value)
+Writes on a digital I/O line mode
+
+Required parameters:
+   line : Line to write
+  value : Value to write (True of False)
+
+Returns nothing 
+Included in slab.py  
+'''
+def dioWrite(line,value):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if line < 1 or line > ndio:
+        raise SlabEx("Invalid digital I/O line")
+    startCommand('J')
+    sendByte(line)
+    if value:
+        sendByte(1)
+    else:
+        sendByte(0)
+    sendCRC()
+    checkACK()
+    checkCRC()    
+   
+'''
+@dioRead@
+dioRead(line)
+Reads a digital I/O line mode
+
+Required parameter:
+   line : Line to read
+
+Returns state (True of False)
+Included in slab.py   
+'''
+def dioRead(line):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if line < 1 or line > ndio:
+        raise SlabEx("Invalid digital I/O line")
+    value = retryCommand('K',dioReadValue,line)
+    if value:
+        return True
+    else:
+        return False
+    
+'''
+Read the value of one digital line
+Parameters:
+   line : Line to read
+Returns the byte returned by the board
+'''
+def dioReadValue(line):
+    startCommand('K')
+    sendByte(line)
+    sendCRC()
+    checkACK()
+    value = getByte()
+    checkCRC()
+    return value
+
+'''
+Convert digital line numbers to a bit mask
+Parameters:
+   lines : Bit mask or list of line numbers
+Returns the bit mask
+'''
+def linesToMask(lines):
+    if not hasattr(lines,"__len__"):
+        mask = int(lines)
+    elif len(lines) == 0:
+        mask = 0
+    elif scipy:
+        lines = np.asarray(lines,dtype=int)
+        if np.any(lines < 1):
+            raise SlabEx("Invalid digital I/O line")
+        mask = int(np.bitwise_or.reduce(1 << (lines-1)))
+    else:
+        mask = 0
+        for line in lines:
+            if line < 1:
+                raise SlabEx("Invalid digital I/O line")
+            mask = mask | (1 << (line-1))
+    if mask < 0 or (mask >> ndio) != 0:
+        raise SlabEx("Invalid digital I/O line")
+    return mask
+
+'''
+Convert a list of line values to a bit mask
+Parameters:
+   values : Bit mask or list of values from line 1
+Returns the bit mask
+'''
+def valuesToMask(values):
+    if not hasattr(values,"__len__"):
+        return int(values)
+    if len(values) > ndio:
+        raise SlabEx("More values than digital I/O lines")
+    if scipy:
+        bits = np.asarray(values) != 0
+        return int(np.dot(bits,1 << np.arange(len(bits))))
+    mask = 0
+    for i,value in enumerate(values):
+        if value:
+            mask = mask | (1 << i)
+    return mask
+
+'''
+@dioWritePort@
+dioWritePort(mask,values)
+Writes several digital I/O lines at once
+Bit n-1 of the bit masks corresponds to line n
+With firmware v1.3 or later it uses only one command
+
+Required parameters:
+    mask : Lines to write
+           Bit mask or list of line numbers
+  values : Values to write
+           Bit mask or list of values (True or False)
+           starting at line 1
+
+Lines not in the mask don't change
+Returns nothing
+Included in slab.py
+'''
+def dioWritePort(mask,values):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    mask = linesToMask(mask)
+    values = valuesToMask(values)
+    if not portSupport:
+        # Older firmware writes one line at a time
+        for i in range(ndio):
+            if mask & (1 << i):
+                dioWrite(i+1,(values >> i) & 1)
+        return
+    startCommand('B')
+    sendU16(mask)
+    sendU16(values & mask)
+    sendCRC()
+    checkACK()
+    checkCRC()
+
+'''
+@dioReadPort@
+dioReadPort(returnList)
+Reads all digital I/O lines at once
+With firmware v1.3 or later it uses only one command
+
+Optional parameter:
+  returnList : Return a list instead of a bit mask
+               (Defaults to False)
+
+Returns a bit mask where bit n-1 is the state of line n
+or a list of states (True or False) starting at line 1
+Included in slab.py
+'''
+def dioReadPort(returnList=False):
+    if not opened:
+        raise SlabEx("Not connected to board")
+    if portSupport:
+        value = retryCommand('b',dioReadPortValue)
+    else:
+        # Older firmware reads one line at a time
+        value = 0
+        for i in range(ndio):
+            if dioRead(i+1):
+                value = value | (1 << i)
+    if not returnList:
+        return value
+    if scipy:
+        return ((value >> np.arange(ndio)) & 1).astype(bool).tolist()
+    return [bool((value >> i) & 1) for i in range(ndio)]
+
+'''
+Read the value of all the digital lines
+Returns the u16 returned by the board
+'''
+def dioReadPortValue():
+    startCommand('b')
+    sendCRC()
+    checkACK()
+    value = getU16()
+    checkCRC()
+    return value
+    
+################## CODE EXECUTED AT IMPORT ####################
+ 
+# Remove specific warnings if scipy was loaded 
+if scipy:
+    warnings.filterwarnings("ignore",".*GUI is implemented.*")
+ 
+# Show version information upon load
+message(1,"SLab Module")
+message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
+    
+# Indicate if we are running in script or interactive mode    
+if hasattr(sys, 'ps1'):
+    interactive = True
+    message(1,"Running interactively")
+else:
+    message(1,"Running from script")
+    interactive = False
+   
+# Message if we are in Linxu
+if linux:
+    message(2,"")
+    message(2,"System is Linux")
+
+# Give message if SciPy modules could not be loaded   
+if not scipy:
+    message(1,"")
+    message(1,"Cannot load SciPy modules")
+    message(1,"Functionality will be reduced")
+    
+message(1,"")    
+    
+    
+    
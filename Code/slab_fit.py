@@ -0,0 +1,259 @@
+'''
+Curve fit submodule for the SLab project
+It requires and imports slab.py
+
+Fits device models to the curves measured with the
+slab_dc submodule
+All fitters accept one curve or a family of curves
+A family is a 2-D array with one curve on each row as
+the ones returned by vDeviceCurve and iDeviceCurve
+All curves of a family are fitted at once
+
+History:
+
+Version 1.0 : First version (19/10/2026)
+
+'''
+
+from __future__ import print_function
+
+import slab
+import numpy as np                # Numpy for math calculations
+
+# Version information
+version_major = 1
+version_minor = 0
+version_date  = "19/10/2026"
+
+# Physical constants
+K_BOLTZMANN = 1.380649e-23        # Boltzmann constant (J/K)
+Q_ELECTRON  = 1.602176634e-19     # Electron charge (C)
+
+###################### INFO FOR THE HELP FILE ##########################
+
+'''
+@fit@
+Curve fit submodule command topics:
+
+  fitLinear
+  fitGain
+  fitDiode
+  diodeVoltage
+
+Currents are in mA and resistances in kOhm
+as in the slab_dc submodule
+'''
+
+########################## FIT ENGINE ##############################
+
+'''
+Convert fit inputs to a family of curves
+x can be one vector for all the curves or a family
+Returns x and y as 2-D arrays of the same shape and
+a flag that is true if y was only one curve
+'''
+def _family(x,y):
+    y = np.asarray(y,dtype=float)
+    single = (y.ndim == 1)
+    y = np.atleast_2d(y)
+    x = np.asarray(x,dtype=float)
+    if x.shape[-1] != y.shape[-1]:
+        raise slab.SlabEx("Input and output vectors must have the same size")
+    x = np.broadcast_to(np.atleast_2d(x),y.shape)
+    return x,y,single
+
+'''
+Least squares fit of each curve of a family
+  columns : List of 2-D arrays, one for each parameter
+        y : 2-D array with one curve on each row
+     mask : 2-D boolean array with the points to use
+Returns a 2-D array of parameters with one row for each
+curve and a vector with the rms error of each curve
+Curves with too few points give NaN parameters
+'''
+def _leastSquares(columns,y,mask):
+    design = np.where(mask[:,:,None],np.stack(columns,axis=2),0.0)
+    target = np.where(mask,y,0.0)
+    params = np.einsum('ckp,cp->ck',np.linalg.pinv(design),target)
+    error = np.einsum('cpk,ck->cp',design,params) - target
+    points = np.sum(mask,axis=1)
+    rms = np.sqrt(np.sum(error**2,axis=1)/np.maximum(points,1))
+    few = points < len(columns)
+    params[few] = np.nan
+    rms[few] = np.nan
+    return params,rms
+
+'''
+Prepare the fit results
+Results of only one curve are given as floats
+'''
+def _result(values,single):
+    if single:
+        for key in values:
+            values[key] = float(values[key][0])
+    return values
+
+'''
+Mask of the points inside an input range
+'''
+def _inRange(x,xmin,xmax):
+    mask = np.isfinite(x)
+    if xmin is not None:
+        mask = mask & (x >= xmin)
+    if xmax is not None:
+        mask = mask & (x <= xmax)
+    return mask
+
+######################### FIT COMMANDS #############################
+
+'''
+@fitLinear@
+fitLinear(x,y,xmin,xmax)
+Fits a line y = slope*x + offset
+
+Required parameters:
+  x : Input vector or family of input vectors
+  y : Output vector or family of output vectors
+
+Optional parameters:
+  xmin : Minimum input to use (Defaults to None, no limit)
+  xmax : Maximum input to use (Defaults to None, no limit)
+
+Returns a dictionary
+   "slope" : Slope of the line
+  "offset" : Output at zero input
+     "rms" : RMS error of the fit
+For a family each entry is a vector with one value per curve
+
+Example: Output conductance in mS of each curve
+         of a vDeviceCurve family
+  d = vDeviceCurve(...,returnData=True)
+  fitLinear(d["vo"],d["io"],1.0)["slope"]
+
+Included in slab_fit.py
+'''
+def fitLinear(x,y,xmin=None,xmax=None):
+
+    # Check if SciPy is loaded
+    slab.checkSciPy()
+
+    x,y,single = _family(x,y)
+    mask = _inRange(x,xmin,xmax) & np.isfinite(y)
+    params,rms = _leastSquares([x,np.ones_like(x)],y,mask)
+    return _result({"slope":params[:,0],"offset":params[:,1],"rms":rms},single)
+
+'''
+@fitGain@
+fitGain(vi,vo,margin,ref)
+Fits gain and offset of a transfer curve
+like the ones of op-amp circuits
+
+Only the linear region is used
+Points closer than margin to the lowest or
+the highest output are taken as saturated
+
+Required parameters:
+  vi : Input vector or family of input vectors
+  vo : Output vector or family of output vectors
+
+Optional parameters:
+  margin : Distance to the output limits (Defaults to 0.1 V)
+     ref : Output reference level (Defaults to 0 V)
+
+Returns a dictionary
+      "gain" : Gain of the linear region
+    "offset" : Output at zero input
+  "inOffset" : Input that gives the ref output
+       "low" : Lowest output
+      "high" : Highest output
+       "rms" : RMS error of the fit
+For a family each entry is a vector with one value per curve
+Included in slab_fit.py
+'''
+def fitGain(vi,vo,margin=0.1,ref=0.0):
+
+    # Check if SciPy is loaded
+    slab.checkSciPy()
+
+    vi,vo,single = _family(vi,vo)
+    low = np.nanmin(vo,axis=1)
+    high = np.nanmax(vo,axis=1)
+    mask = ((vo > low[:,None] + margin) & (vo < high[:,None] - margin)
+            & np.isfinite(vi))
+    params,rms = _leastSquares([vi,np.ones_like(vi)],vo,mask)
+    gain = params[:,0]
+    offset = params[:,1]
+    return _result({"gain":gain,"offset":offset,"inOffset":(ref - offset)/gain
+                   ,"low":low,"high":high,"rms":rms},single)
+
+'''
+@fitDiode@
+fitDiode(v,i,imin,temp)
+Fits the Shockley diode model with series resistance
+
+  V = n*Vt*ln(I/Is + 1) + I*Rs
+
+The model is linear on n, ln(Is) and Rs for currents well
+over Is, so the fit needs no iterations
+
+Required parameters:
+  v : Voltage vector or family of voltage vectors (V)
+  i : Current vector or family of current vectors (mA)
+
+Optional parameters:
+  imin : Minimum current to use (Defaults to 0.001 mA)
+  temp : Temperature in Celsius (Defaults to 25)
+
+Returns a dictionary
+   "n" : Emission coefficient
+  "is" : Saturation current (mA)
+  "rs" : Series resistance (kOhm)
+  "vt" : Thermal voltage used (V)
+ "rms" : RMS voltage error of the fit (V)
+For a family each entry is a vector with one value per curve
+
+Example: diode curve measured with curveVI
+  vd,id = curveVI(0,3,returnData=True)
+  fitDiode(vd,id)
+
+Included in slab_fit.py
+'''
+def fitDiode(v,i,imin=0.001,temp=25.0):
+
+    # Check if SciPy is loaded
+    slab.checkSciPy()
+
+    if imin <= 0.0:
+        raise slab.SlabEx("Minimum current must be positive")
+    i,v,single = _family(i,v)
+    mask = (i >= imin) & np.isfinite(v)
+    logi = np.log(np.where(mask,i,1.0))
+    params,rms = _leastSquares([logi,np.ones_like(i),i],v,mask)
+
+    vt = K_BOLTZMANN*(temp + 273.15)/Q_ELECTRON
+    nvt = params[:,0]
+    return _result({"n":nvt/vt,"is":np.exp(-params[:,1]/nvt),"rs":params[:,2]
+                   ,"vt":np.full(len(nvt),vt),"rms":rms},single)
+
+'''
+@diodeVoltage@
+diodeVoltage(i,fit)
+Evaluates a fitted diode model
+
+Required parameters:
+    i : Current vector (mA)
+  fit : Dictionary returned by fitDiode for one curve
+
+Returns a vector with the diode voltages
+Included in slab_fit.py
+'''
+def diodeVoltage(i,fit):
+    i = np.asarray(i,dtype=float)
+    return fit["n"]*fit["vt"]*np.log(i/fit["is"] + 1.0) + i*fit["rs"]
+
+################## CODE EXECUTED AT IMPORT ####################
+
+# Show version information upon load
+slab.message(1,"SLab Fit Submodule")
+slab.message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
+slab.message(1,"")
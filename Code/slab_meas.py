@@ -1,217 +1,576 @@
-'''
-Analyze submodule for the SLab project
-It requires and imports slab.py
-
-History:
-
-Version 1.0 : First version (7/4/2017)
-Version 1.1 : Compatibility with Python 3.x (1/3/2018)
-
-'''
-from __future__ import print_function
-
-import slab
-import numpy as np                # Numpy for math calculations
-import pylab as pl                # Pylab and Mathplotlib for plotting
-import matplotlib.pyplot as plt
-
-import math           # Math module
-import numbers        # Numbers module
-
-# Version information
-version_major = 1
-version_minor = 1
-version_date  = "1/3/2018"
-
-###################### INFO FOR THE HELP FILE ##########################
-
-'''
-@meas@
-Measure wave submodule command topics:
-
-   analyze
-   period
-   tcross
-'''   
-
-################### PRIVATE HELPER FUNCTIONS ###########################
-  
-'''
-Determine all times when a vector crosses value
-Parameters:
-  vector : Sequence of values
-   value : Value to cross
-    mode : Cross mode tmodeRise or tmodeFall 
-Returns a list of indexes 
-Included in slab_meas.py   
-'''
-def _xcross(vector,value,mode):
-    if mode == slab.tmodeRise:
-        pvalue = (value + slab.lowPeak(vector))/2.0
-    else:
-        pvalue = (value + slab.highPeak(vector))/2.0
-
-    list = []
-    
-    preset = False
-    for i in range(0,len(vector)):
-        v = vector[i]
-        if mode == slab.tmodeRise:
-            if v < pvalue:
-                preset = True
-            if preset:
-                if v > value:
-                    list.append(i)
-                    preset = False
-        else:
-            if v > pvalue:
-                preset = True
-            if preset:
-                if v < value:
-                    list.append(i)
-                    preset = False
-    return list  
-   
-   
-################### ANALYSIS COMMANDS #############################
-   
-'''
-@tcross@
-tcross(vector,value,mode,time,ts)
-Determine the times when a vector crosses a value
-
-Required parameters:
-  vector : Sequence of values
-   value : Value to cross
-   
-Optional parameters:   
-    mode : Cross mode tmodeRise (Default) or tmodeFall
-    time : Optional time vector
-      ts : Optional sample time  
-
-Returns a vector of cross instants:
-    Times if time vector is provided
-    Time from Ts if provided
-    Indexes if no time or Ts is provided 
-
-Included in slab_meas.py    
-'''
-def tcross(vector,value,mode=slab.tmodeRise,time=[],ts=-1):
-    listIn = _xcross(vector,value,mode)
-    listOut = []
-    if time != []:
-        for element in listIn:
-            listOut.append(time[element])
-        return listOut
-    if Ts != -1:
-        for element in listIn:
-            listOut.append(ts*element)
-        return listOut
-    return listIn  
-    
-
-'''
-@period@
-period(vector,time,ts,mode)
-Compute the period of a signal
-
-Period is computed from signal crossings at the halrange
-
-Required parameters:
-  vector : Sequence of values
-   
-Optional parameters:   
-    time : Optional time vector
-      ts : Optional sample time  
-    mode : Cross mode tmodeRise (Default) or tmodeFall      
-
-Returns a the mean period using:
-    time vector if provided
-    Ts if provided
-    Samples indexes if no time or Ts is provided 
-
-Included in slab_meas.py    
-'''  
-def period(vector,time=[],ts=-1,mode=slab.tmodeRise):
-    m = slab.halfRange(vector)
-    tlist = tcross(vector,m,mode,time,ts)
-    n = len(tlist)
-    if n < 2:
-        raise slab.SlabEx("Not enough edges for period")
-    sum = 0
-    for i in range(0,n-1):
-        sum = sum + tlist[i+1] - tlist[i]
-    return sum/(n-1)   
-    
-'''
-@analyze@
-analyze(data)
-Analize signal data and show results on screen
-
-Optional parameters:
-    data : data tuple to analyze
-              Pos 0 : Time vector
-              Pos 1 onward : Signal value vectors 
-              
-If data is not provided, a transientAsync command will be performed 
-
-Returns nothing
-Included in slab_meas.py         
-'''    
-def analyze(data=[]):
-    # Perform measurement if no data is provided
-    if len(data) == 0:
-        data = slab.transientAsync()         
-        vUnit = " V"
-        tUnit = " s"
-        fUnit = " Hz"
-    else:
-        vUnit = ""
-        tUnit = ""
-        fUnit = ""
-        
-    # Check if only one array/list is provided    
-    if isinstance(data[0],numbers.Number):
-        y = [data]
-        x = range(0,len(data))  # Generate x vector
-        tUnit = "samples"
-    else:
-        x = data[0]
-        y = data[1:]
-        print() 
-        print("Min time: " + str(x[0]) + tUnit)
-        print("Max time: " + str(x[-1]) + tUnit)
-        print("Total time: " + str(x[-1]-x[0]) +tUnit)
-       
-    print()    
-    for i in range(0,len(y)):
-    
-        print("Signal " + str(i+1))
-        print("   Mean: " + str(slab.mean(y[i])) + vUnit)
-        print("   Std Dev: " + str(slab.std(y[i])) + vUnit)
-        print()
-        print("   High Peak: " + str(slab.highPeak(y[i])) + vUnit)
-        print("   Low Peak: " + str(slab.lowPeak(y[i])) + vUnit)
-        print("   Peak2peak: " + str(slab.peak2peak(y[i])) + vUnit)
-        print("   Half Range: " + str(slab.halfRange(y[i])) + vUnit)
-        print("   RMS: " + str(slab.rms(y[i])) + vUnit)
-        
-        try:
-            per = period(y[i],x)
-        except:
-            pass
-        else:            
-            print()
-            print("   Mean period: " + str(per) + tUnit)
-            print("   Mean frequency: " + str(1/per) + fUnit)
-            
-        print()
-  
-################## CODE EXECUTED AT IMPORT ####################
-  
-# Show version information upon load
-slab.message(1,"SLab Analyze Submodule")
-slab.message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
-slab.message(1,"")
-
+'''
+Analyze submodule for the SLab project
+It requires and imports slab.py
+
+History:
+
+Version 1.0 : First version (7/4/2017)
+Version 1.1 : Compatibility with Python 3.x (1/3/2018)
+Version 1.2 : Batch analysis of saved captures (19/10/2026)
+
+'''
+from __future__ import print_function
+
+import slab
+import numpy as np                # Numpy for math calculations
+import pylab as pl                # Pylab and Mathplotlib for plotting
+import matplotlib.pyplot as plt
+
+import math           # Math module
+import numbers        # Numbers module
+import os             # Operating system module
+import glob           # File patterns
+import time           # Batch cache entry ages
+import pickle         # Saved captures
+import json           # Batch result cache
+import hashlib        # Capture file keys
+import csv            # Batch result export
+import multiprocessing  # Batch process pool
+
+# Version information
+version_major = 1
+version_minor = 2
+version_date  = "19/10/2026"
+
+# Cache of batch analysis results
+BATCH_CACHE_FILE = "Batch_Cache.json"
+BATCH_CACHE_VERSION = 2
+BATCH_CACHE_SIZE = 10000          # Maximum number of cached results
+
+###################### INFO FOR THE HELP FILE ##########################
+
+'''
+@meas@
+Measure wave submodule command topics:
+
+   analyze
+   measure
+   period
+   tcross
+   batchAnalyze
+   batchExport
+'''   
+
+################### PRIVATE HELPER FUNCTIONS ###########################
+  
+'''
+Determine all times when a vector crosses value
+Parameters:
+  vector : Sequence of values
+   value : Value to cross
+    mode : Cross mode tmodeRise or tmodeFall 
+Returns a list of indexes 
+Included in slab_meas.py   
+'''
+def _xcross(vector,value,mode):
+    if mode == slab.tmodeRise:
+        pvalue = (value + slab.lowPeak(vector))/2.0
+    else:
+        pvalue = (value + slab.highPeak(vector))/2.0
+
+    list = []
+    
+    preset = False
+    for i in range(0,len(vector)):
+        v = vector[i]
+        if mode == slab.tmodeRise:
+            if v < pvalue:
+                preset = True
+            if preset:
+                if v > value:
+                    list.append(i)
+                    preset = False
+        else:
+            if v > pvalue:
+                preset = True
+            if preset:
+                if v < value:
+                    list.append(i)
+                    preset = False
+    return list  
+   
+   
+################### ANALYSIS COMMANDS #############################
+   
+'''
+@tcross@
+tcross(vector,value,mode,time,ts)
+Determine the times when a vector crosses a value
+
+Required parameters:
+  vector : Sequence of values
+   value : Value to cross
+   
+Optional parameters:   
+    mode : Cross mode tmodeRise (Default) or tmodeFall
+    time : Optional time vector
+      ts : Optional sample time  
+
+Returns a vector of cross instants:
+    Times if time vector is provided
+    Time from Ts if provided
+    Indexes if no time or Ts is provided 
+
+Included in slab_meas.py    
+'''
+def tcross(vector,value,mode=slab.tmodeRise,time=[],ts=-1):
+    listIn = _xcross(vector,value,mode)
+    listOut = []
+    if len(time) > 0:
+        for element in listIn:
+            listOut.append(time[element])
+        return listOut
+    if ts != -1:
+        for element in listIn:
+            listOut.append(ts*element)
+        return listOut
+    return listIn  
+    
+
+'''
+@period@
+period(vector,time,ts,mode)
+Compute the period of a signal
+
+Period is computed from signal crossings at the halrange
+
+Required parameters:
+  vector : Sequence of values
+   
+Optional parameters:   
+    time : Optional time vector
+      ts : Optional sample time  
+    mode : Cross mode tmodeRise (Default) or tmodeFall      
+
+Returns a the mean period using:
+    time vector if provided
+    Ts if provided
+    Samples indexes if no time or Ts is provided 
+
+Included in slab_meas.py    
+'''  
+def period(vector,time=[],ts=-1,mode=slab.tmodeRise):
+    m = slab.halfRange(vector)
+    tlist = tcross(vector,m,mode,time,ts)
+    n = len(tlist)
+    if n < 2:
+        raise slab.SlabEx("Not enough edges for period")
+    sum = 0
+    for i in range(0,n-1):
+        sum = sum + tlist[i+1] - tlist[i]
+    return sum/(n-1)   
+    
+'''
+Separate the time and signal vectors of a data tuple
+A single vector uses the sample index as time
+Returns the time vector and a list of signal arrays
+'''
+def _signals(data):
+    if isinstance(data[0],numbers.Number):
+        return range(0,len(data)),[np.asarray(data,dtype=float)]
+    return data[0],[np.asarray(y,dtype=float) for y in data[1:]]
+
+'''
+@measure@
+measure(data)
+Measures signal data
+
+Required parameters:
+    data : data tuple to measure
+              Pos 0 : Time vector
+              Pos 1 onward : Signal value vectors 
+           or a single signal vector
+
+Returns a dictionary with the measurements of each signal
+The signal number is added to each name, from 1 onward
+  mean, std, high, low, p2p, half, rms, period, freq
+Period and frequency are NaN if the signal has not
+enough edges
+Included in slab_meas.py         
+'''    
+def measure(data):
+    x,y = _signals(data)
+    values = {}
+    for i,signal in enumerate(y):
+        n = str(i+1)
+        values["mean"+n] = slab.mean(signal)
+        values["std"+n] = slab.std(signal)
+        values["high"+n] = slab.highPeak(signal)
+        values["low"+n] = slab.lowPeak(signal)
+        values["p2p"+n] = slab.peak2peak(signal)
+        values["half"+n] = slab.halfRange(signal)
+        values["rms"+n] = slab.rms(signal)
+        # Same as period but with no exception
+        tlist = tcross(signal,values["half"+n],slab.tmodeRise,x)
+        if len(tlist) < 2:
+            values["period"+n] = float("nan")
+        else:
+            values["period"+n] = (tlist[-1] - tlist[0])/(len(tlist) - 1.0)
+        values["freq"+n] = 1.0/values["period"+n]
+    return values
+
+'''
+@analyze@
+analyze(data)
+Analize signal data and show results on screen
+
+Optional parameters:
+    data : data tuple to analyze
+              Pos 0 : Time vector
+              Pos 1 onward : Signal value vectors 
+              
+If data is not provided, a transientAsync command will be performed 
+
+Returns nothing
+Included in slab_meas.py         
+'''    
+def analyze(data=[]):
+    # Perform measurement if no data is provided
+    if len(data) == 0:
+        data = slab.transientAsync()         
+        vUnit = " V"
+        tUnit = " s"
+        fUnit = " Hz"
+    else:
+        vUnit = ""
+        tUnit = ""
+        fUnit = ""
+        
+    # Check if only one array/list is provided    
+    if isinstance(data[0],numbers.Number):
+        nsignals = 1
+        tUnit = "samples"
+    else:
+        x = data[0]
+        nsignals = len(data) - 1
+        print() 
+        print("Min time: " + str(x[0]) + tUnit)
+        print("Max time: " + str(x[-1]) + tUnit)
+        print("Total time: " + str(x[-1]-x[0]) +tUnit)
+       
+    values = measure(data)
+    print()    
+    for i in range(0,nsignals):
+        n = str(i+1)
+        print("Signal " + n)
+        print("   Mean: " + str(values["mean"+n]) + vUnit)
+        print("   Std Dev: " + str(values["std"+n]) + vUnit)
+        print()
+        print("   High Peak: " + str(values["high"+n]) + vUnit)
+        print("   Low Peak: " + str(values["low"+n]) + vUnit)
+        print("   Peak2peak: " + str(values["p2p"+n]) + vUnit)
+        print("   Half Range: " + str(values["half"+n]) + vUnit)
+        print("   RMS: " + str(values["rms"+n]) + vUnit)
+        
+        if not math.isnan(values["period"+n]):
+            print()
+            print("   Mean period: " + str(values["period"+n]) + tUnit)
+            print("   Mean frequency: " + str(values["freq"+n]) + fUnit)
+            
+        print()
+
+######################## BATCH ANALYSIS ###########################
+
+'''
+Value for a batch table cell
+Numbers are stored as floats so they can go to the cache
+'''
+def _cell(value):
+    try:
+        return float(value)
+    except (TypeError,ValueError):
+        return str(value)
+
+'''
+Analyze a chunk of capture files
+Runs on the worker processes
+  task : Tuple with the list of files and the analyses
+Returns a list with a (row,error) tuple for each file
+'''
+def _batchChunk(task):
+    files,analyses = task
+    rows = []
+    for name in files:
+        try:
+            with open(name,'rb') as f:
+                data = pickle.load(f)
+            row = {}
+            for func in analyses:
+                result = func(data)
+                if isinstance(result,dict):
+                    for key in result:
+                        row[key] = _cell(result[key])
+                else:
+                    row[func.__name__] = _cell(result)
+            rows.append((row,""))
+        except Exception as ex:
+            rows.append(({},getattr(ex,"msg",repr(ex))))
+    return rows
+
+'''
+Capture files from a directory, a file pattern or a list
+'''
+def _batchFiles(source):
+    if isinstance(source,str):
+        if os.path.isdir(source):
+            source = os.path.join(source,"*.sav")
+        return sorted(glob.glob(source))
+    files = []
+    for name in source:
+        if not os.path.exists(name) and os.path.exists(name + ".sav"):
+            name = name + ".sav"
+        files.append(name)
+    return files
+
+'''
+Key of a capture file from its contents
+'''
+def _fileKey(name):
+    h = hashlib.sha1()
+    with open(name,'rb') as f:
+        for block in iter(lambda: f.read(1 << 20),b""):
+            h.update(block)
+    return h.hexdigest()
+
+'''
+Add a code object to a hash
+Nested code objects, like the ones of lambdas, are added
+by content as their repr includes a memory address
+Sets are sorted as their order changes between runs
+'''
+def _hashCode(h,code):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const,"co_code"):
+            _hashCode(h,const)
+        elif isinstance(const,frozenset):
+            h.update(repr(sorted([repr(item) for item in const])).encode("utf-8"))
+        else:
+            h.update(repr(const).encode("utf-8"))
+
+'''
+Key of an analysis function
+Includes a hash of its code so that results are not
+taken from the cache after the function is edited
+'''
+def _analysisKey(func):
+    key = func.__module__ + "." + func.__name__
+    code = getattr(func,"__code__",None)
+    if code is None:
+        return key
+    h = hashlib.sha1()
+    _hashCode(h,code)
+    return key + ":" + h.hexdigest()[:12]
+
+'''
+Read the batch cache
+Returns a dictionary of entries
+Each entry has the capture "file", the analysis "row"
+and the "time" it was computed
+'''
+def _readBatchCache(name):
+    try:
+        with open(name,'r') as f:
+            cache = json.load(f)
+    except (IOError,OSError,ValueError):
+        return {}
+    if cache.get("version") != BATCH_CACHE_VERSION:
+        return {}
+    return cache["entries"]
+
+'''
+Remove old entries from the batch cache
+Entries of deleted captures and of the previous contents
+of changed captures are removed
+The oldest entries are removed over BATCH_CACHE_SIZE
+Parameters:
+  entries : Dictionary of entries
+    files : Dictionary of current keys of the analyzed files
+Returns True if some entry was removed
+'''
+def _pruneBatchCache(entries,files):
+    removed = False
+    for key in list(entries):
+        name = entries[key]["file"]
+        if name in files:
+            stale = key.split("|")[0] != files[name]
+        else:
+            stale = not os.path.exists(name)
+        if stale:
+            del entries[key]
+            removed = True
+    if len(entries) > BATCH_CACHE_SIZE:
+        keys = sorted(entries,key=lambda key: entries[key]["time"])
+        for key in keys[:len(entries) - BATCH_CACHE_SIZE]:
+            del entries[key]
+        removed = True
+    return removed
+
+'''
+Write the batch cache
+'''
+def _writeBatchCache(name,entries):
+    tmp = name + ".tmp"
+    with open(tmp,'w') as f:
+        json.dump({"version":BATCH_CACHE_VERSION,"entries":entries},f)
+    try:
+        os.replace(tmp,name)
+    except AttributeError:
+        # Python 2 cannot replace files in Windows
+        if os.path.exists(name):
+            os.remove(name)
+        os.rename(tmp,name)
+
+'''
+@batchAnalyze@
+batchAnalyze(source,analyses,processes,chunk,cache)
+Analyzes many captures saved with the save command
+
+Files are processed in chunks, optionally by a pool
+of processes
+Results are cached using the contents of each file
+and the code of the analyses so a new run only processes
+new or changed captures or edited analyses
+Results of deleted or changed captures are removed
+from the cache, as are the oldest ones when the cache
+has more than BATCH_CACHE_SIZE results
+
+Required parameters:
+  source : Directory with .sav files, file pattern
+           or list of file names
+
+Optional parameters:
+   analyses : List of analysis functions (Defaults to [measure])
+              Each function gets the loaded data and returns a
+              dictionary of values or a single value that is
+              named after the function
+              With processes, functions must be defined at
+              module level so they can be sent to the pool
+  processes : Number of processes (Defaults to 0)
+               0 runs in the calling process
+              -1 uses one process for each CPU
+              In Windows each process runs the calling script
+              again, so the script must call batchAnalyze
+              inside an  if __name__ == "__main__":  block
+      chunk : Files for each process task (Defaults to 16)
+      cache : Cache file name, empty to disable the cache
+              It uses the file prefix
+              (Defaults to "Batch_Cache.json")
+
+Returns a dictionary with one vector for each column
+  "file" : File names
+  "error" : Error of each file (empty if no error)
+  Other columns are the analysis values
+Missing values are NaN
+
+Example: main frequency of each capture
+  def mainFreq(data):
+      v,f = slab_fft.ftransform(data[1],data[0])
+      return f[np.argmax(np.abs(v[1:]))+1]
+  t = batchAnalyze("Captures",[measure,mainFreq])
+
+Included in slab_meas.py
+'''
+def batchAnalyze(source,analyses=[measure],processes=0,chunk=16
+                ,cache=BATCH_CACHE_FILE):
+    if chunk < 1:
+        raise slab.SlabEx("Chunk size must be at least one")
+    files = _batchFiles(source)
+    if len(files) == 0:
+        raise slab.SlabEx("No capture files found")
+
+    # Entries are cached for a given set of analyses
+    akey = ",".join([_analysisKey(func) for func in analyses])
+    cname = slab.fprefix + cache
+    entries = _readBatchCache(cname) if cache != "" else {}
+    fkeys = dict([(os.path.abspath(name),_fileKey(name)) for name in files])
+    keys = [fkeys[os.path.abspath(name)] + "|" + akey for name in files]
+    results = {}
+    pending = []
+    for name,key in zip(files,keys):
+        if key in entries:
+            results[name] = (entries[key]["row"],"")
+        else:
+            pending.append(name)
+    slab.message(1,str(len(files)-len(pending)) + " captures in cache, "
+                   + str(len(pending)) + " to process")
+
+    # Process new captures
+    tasks = [(pending[i:i+chunk],analyses) for i in range(0,len(pending),chunk)]
+    if processes == 0 or len(tasks) < 2:
+        chunks = map(_batchChunk,tasks)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes if processes > 0 else None)
+        chunks = pool.imap(_batchChunk,tasks)
+    try:
+        for task,rows in zip(tasks,chunks):
+            for name,(row,error) in zip(task[0],rows):
+                results[name] = (row,error)
+                if error != "":
+                    slab.warn("Analysis of " + name + " failed: " + error)
+            slab.message(2,"  " + str(len(results)) + " of " + str(len(files)))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    # Add the new results to the cache
+    # Errors are not cached
+    if cache != "":
+        changed = False
+        now = time.time()
+        for name,key in zip(files,keys):
+            row,error = results[name]
+            if error == "" and key not in entries:
+                entries[key] = {"file":os.path.abspath(name),"row":row,"time":now}
+                changed = True
+        if _pruneBatchCache(entries,fkeys) or changed:
+            _writeBatchCache(cname,entries)
+
+    # Build the table
+    columns = []
+    for name in files:
+        for column in results[name][0]:
+            if column not in columns:
+                columns.append(column)
+    table = {"file":files,"error":[results[name][1] for name in files]}
+    for column in columns:
+        cells = [results[name][0].get(column,float("nan")) for name in files]
+        if all([isinstance(cell,float) for cell in cells]):
+            cells = np.array(cells)
+        table[column] = cells
+    return table
+
+'''
+@batchExport@
+batchExport(table,filename)
+Saves a batchAnalyze table to a CSV file
+with one row for each capture
+
+Required parameters:
+     table : Table returned by batchAnalyze
+  filename : Name of the file
+Returns nothing
+Included in slab_meas.py
+'''
+def batchExport(table,filename):
+    header = ["file"] + [key for key in table if key not in ("file","error")]
+    header.append("error")
+    name = slab.fprefix + filename
+    with open(name,'w') as f:
+        writer = csv.writer(f,lineterminator="\n")
+        writer.writerow(header)
+        for i in range(len(table["file"])):
+            writer.writerow([table[key][i] for key in header])
+    slab.message(1,"Table saved to " + name)
+  
+################## CODE EXECUTED AT IMPORT ####################
+  
+# Show version information upon load
+slab.message(1,"SLab Analyze Submodule")
+slab.message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
+slab.message(1,"")
+
  
\ No newline at end of file
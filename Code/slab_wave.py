@@ -0,0 +1,398 @@
+'''
+Arbitrary wave submodule for the SLab project
+It requires and imports slab.py
+
+Waves are composed of lazy segments
+Segments are only evaluated when the wave is loaded so
+the same composition can be loaded at any number of points
+
+History:
+
+Version 1.0 : First version (19/10/2026)
+
+'''
+
+from __future__ import print_function
+
+import slab
+import numpy as np                # Numpy for math calculations
+
+import math           # Math module
+
+# Version information
+version_major = 1
+version_minor = 0
+version_date  = "19/10/2026"
+
+###################### INFO FOR THE HELP FILE ##########################
+
+'''
+@arb@
+Arbitrary wave submodule command topics:
+
+  Segment primitives:
+    arbConst
+    arbRamp
+    arbSine
+    arbExp
+    arbPiecewise
+    arbTable
+
+  Segment composition:
+    arbConcat
+    arbRepeat
+    arbScale
+    arbOffset
+
+  Evaluation and load:
+    arbEval
+    arbLoad
+
+Segments can also be joined with the + operator
+and can be given directly to loadWavetable
+'''
+
+########################## SEGMENT OBJECT ##############################
+
+'''
+Lazy wave segment
+Stores the nominal number of points of the segment and a
+function that evaluates it at any number of points
+The function gets the number of points and returns an array
+
+Segments behave as a read only sequence of their nominal
+points so they can be given directly to slab.loadWavetable
+'''
+class Segment(object):
+
+    def __init__(self,points,func):
+        self.points = int(points)
+        self.func = func
+        self.cache = None
+
+    # Evaluate at the nominal number of points
+    def nominal(self):
+        if self.cache is None:
+            self.cache = self.func(self.points)
+        return self.cache
+
+    def __len__(self):
+        return self.points
+
+    def __getitem__(self,index):
+        return self.nominal()[index]
+
+    def __array__(self,dtype=None,copy=None):
+        if dtype is None:
+            return self.nominal()
+        return self.nominal().astype(dtype)
+
+    def __add__(self,other):
+        return arbConcat(self,other)
+
+'''
+Check that a number of points is valid for a segment
+'''
+def _checkPoints(n):
+    if n < 1:
+        raise slab.SlabEx("Segments need at least one point")
+
+'''
+Split m points between several segments
+Points are assigned in proportion to the nominal sizes
+Returns a list with the points of each segment
+'''
+def _splitPoints(segments,m):
+    sizes = np.array([seg.points for seg in segments],dtype=float)
+    bounds = np.round(np.cumsum(sizes)*m/np.sum(sizes)).astype(int)
+    return np.diff(np.concatenate(([0],bounds)))
+
+######################## SEGMENT PRIMITIVES ############################
+
+'''
+@arbConst@
+arbConst(n,value)
+Creates a constant segment
+
+Required parameters:
+      n : Nominal number of points
+  value : Segment value (Volt)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbConst(n,value):
+    _checkPoints(n)
+    return Segment(n,lambda m: np.full(m,float(value)))
+
+'''
+@arbRamp@
+arbRamp(n,v1,v2)
+Creates a linear ramp segment
+The ramp starts at v1 and goes to v2 at the end of the
+segment, so v2 is the first value of the next segment
+
+Required parameters:
+   n : Nominal number of points
+  v1 : Start value (Volt)
+  v2 : End value (Volt)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbRamp(n,v1,v2):
+    _checkPoints(n)
+    return Segment(n,lambda m: v1 + (v2-v1)*np.arange(m)/float(m))
+
+'''
+@arbSine@
+arbSine(n,v1,v2,cycles,phase)
+Creates a sine segment
+
+Required parameters:
+   n : Nominal number of points
+  v1 : Minimum value (Volt)
+  v2 : Maximum value (Volt)
+
+Optional parameters:
+  cycles : Number of cycles in the segment (Defaults to 1)
+   phase : Phase at start (deg) (Defaults to 0)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbSine(n,v1,v2,cycles=1.0,phase=0.0):
+    _checkPoints(n)
+    mean = (v1 + v2)/2.0
+    amplitude = (v2 - v1)/2.0
+    phase = phase*math.pi/180.0
+    def func(m):
+        angle = 2.0*math.pi*cycles*np.arange(m)/float(m) + phase
+        return mean + amplitude*np.sin(angle)
+    return Segment(n,func)
+
+'''
+@arbExp@
+arbExp(n,v1,v2,tau)
+Creates an exponential segment
+Value starts at v1 and tends to v2
+
+Required parameters:
+   n : Nominal number of points
+  v1 : Start value (Volt)
+  v2 : Final value (Volt)
+
+Optional parameters:
+  tau : Time constant as a fraction of the segment
+        (Defaults to 0.2)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbExp(n,v1,v2,tau=0.2):
+    _checkPoints(n)
+    if tau <= 0.0:
+        raise slab.SlabEx("Time constant must be positive")
+    def func(m):
+        t = np.arange(m)/float(m)
+        return v2 + (v1-v2)*np.exp(-t/tau)
+    return Segment(n,func)
+
+'''
+@arbPiecewise@
+arbPiecewise(n,x,y)
+Creates a piecewise linear segment
+
+Required parameters:
+  n : Nominal number of points
+  x : Breakpoint positions, from 0 to n, in increasing order
+  y : Breakpoint values (Volt)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbPiecewise(n,x,y):
+    _checkPoints(n)
+    if len(x) != len(y) or len(x) < 1:
+        raise slab.SlabEx("Breakpoint lists must have the same size")
+    x = np.asarray(x,dtype=float)
+    y = np.asarray(y,dtype=float)
+    if np.any(np.diff(x) < 0):
+        raise slab.SlabEx("Breakpoint positions must be increasing")
+    return Segment(n,lambda m: np.interp(np.arange(m)*float(n)/m,x,y))
+
+'''
+@arbTable@
+arbTable(data)
+Creates a segment from a table of values
+If the segment is evaluated at a different number of points
+the table is resampled using linear interpolation
+
+Required parameter:
+  data : List or array of values (Volt)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbTable(data):
+    data = np.array(data,dtype=float)
+    n = len(data)
+    _checkPoints(n)
+    def func(m):
+        if m == n:
+            return data.copy()
+        # Periodic resampling
+        xp = np.arange(n+1)
+        fp = np.append(data,data[0])
+        return np.interp(np.arange(m)*float(n)/m,xp,fp)
+    return Segment(n,func)
+
+####################### SEGMENT COMPOSITION ############################
+
+'''
+@arbConcat@
+arbConcat(seg1,seg2,...)
+Joins several segments one after the other
+When evaluated, points are distributed between the segments
+in proportion to their nominal points
+
+Required parameters:
+  seg1,seg2,... : Segments to join
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbConcat(*segments):
+    if len(segments) == 0:
+        raise slab.SlabEx("No segments to join")
+    segments = list(segments)
+    points = sum([seg.points for seg in segments])
+    def func(m):
+        parts = []
+        for seg,count in zip(segments,_splitPoints(segments,m)):
+            if count > 0:
+                parts.append(seg.func(count))
+        return np.concatenate(parts)
+    return Segment(points,func)
+
+'''
+@arbRepeat@
+arbRepeat(seg,times)
+Repeats a segment several times
+
+Required parameters:
+    seg : Segment to repeat
+  times : Number of repetitions
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbRepeat(seg,times):
+    times = int(times)
+    if times < 1:
+        raise slab.SlabEx("Number of repetitions must be at least one")
+    def func(m):
+        # All repetitions are equal if the points can be split evenly
+        if m % times == 0:
+            return np.tile(seg.func(m//times),times)
+        return arbConcat(*([seg]*times)).func(m)
+    return Segment(seg.points*times,func)
+
+'''
+@arbScale@
+arbScale(seg,gain,center)
+Scales the amplitude of a segment around a center value
+
+Required parameters:
+   seg : Segment to scale
+  gain : Amplitude gain
+
+Optional parameter:
+  center : Value that does not change (Defaults to 0 V)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbScale(seg,gain,center=0.0):
+    return Segment(seg.points,lambda m: center + gain*(seg.func(m) - center))
+
+'''
+@arbOffset@
+arbOffset(seg,value)
+Adds an offset to a segment
+
+Required parameters:
+    seg : Segment to modify
+  value : Offset to add (Volt)
+
+Returns a segment
+Included in slab_wave.py
+'''
+def arbOffset(seg,value):
+    return Segment(seg.points,lambda m: seg.func(m) + value)
+
+####################### EVALUATION AND LOAD ############################
+
+'''
+@arbEval@
+arbEval(seg,npoints)
+Evaluates a segment
+
+Required parameter:
+  seg : Segment to evaluate
+
+Optional parameter:
+  npoints : Number of points
+            (Defaults to the nominal points of the segment)
+
+Returns a NumPy array of values
+Included in slab_wave.py
+'''
+def arbEval(seg,npoints=-1):
+    if npoints == -1:
+        return seg.nominal().copy()
+    _checkPoints(npoints)
+    return seg.func(int(npoints))
+
+'''
+@arbLoad@
+arbLoad(seg,npoints,second)
+Evaluates a segment and loads it as a wavetable
+If the wave does not fit in the free buffer space, it is
+resampled to the maximum number of points that fits
+
+Required parameter:
+  seg : Segment to load
+
+Optional parameters:
+  npoints : Number of points
+            (Defaults to the nominal points of the segment)
+   second : Load on secondary table
+            (Defaults to false)
+
+Returns the table of loaded values
+Included in slab_wave.py
+'''
+def arbLoad(seg,npoints=-1,second=False):
+    if not slab.opened:
+        raise slab.SlabEx("Not connected to board")
+    if npoints == -1:
+        npoints = seg.points
+    # Loading the primary table erases the secondary one
+    if second:
+        space = slab.buff_size - slab.w_points
+    else:
+        space = slab.buff_size
+    if npoints > space:
+        slab.message(1,"Wave resampled from " + str(npoints) + " to " + str(space) + " points")
+        npoints = space
+    table = arbEval(seg,npoints)
+    slab.loadWavetable(table,second)
+    return table
+
+################## CODE EXECUTED AT IMPORT ####################
+
+# Show version information upon load
+slab.message(1,"SLab Wave Submodule")
+slab.message(1,"Version "+str(version_major)+"."+str(version_minor)+" ("+version_date+")")
+slab.message(1,"")